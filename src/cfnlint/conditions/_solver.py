@@ -0,0 +1,349 @@
+"""
+Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Protocol, Sequence
+
+from sympy import Not, S, Symbol
+from sympy.assumptions.cnf import CNF, EncodedCNF
+
+try:
+    from pysat.solvers import Solver as _PySatSolver
+
+    HAS_PYSAT = True
+except ImportError:
+    HAS_PYSAT = False
+
+
+class Backend(Protocol):
+    """An incremental SAT solver over integer literals"""
+
+    def new_var(self) -> int:
+        """Allocate a new variable"""
+
+    def add_clause(self, clause: Sequence[int]) -> None:
+        """Add a clause that holds for every later solve"""
+
+    def solve(
+        self, assumptions: Sequence[int] = (), clauses: Sequence[Sequence[int]] = ()
+    ) -> bool:
+        """Determine if the clauses can be satisfied with the assumptions
+        and the clauses that only hold for this solve"""
+
+
+class DpllSolver:
+    """A pure Python incremental DPLL solver
+
+    Clauses are kept between calls to `solve` and the literals being
+    solved for are passed in as assumptions so the same clauses can
+    answer many queries. Clauses passed to `solve` are removed again
+    once it returns. Unit propagation uses two watched literals per
+    clause which stay valid across solves and backtracking.
+    """
+
+    def __init__(self, num_vars: int = 0) -> None:
+        self._num_vars = num_vars
+        self._clauses: list[list[int]] = []
+        self._watches: dict[int, list[list[int]]] = {}
+        self._units: list[int] = []
+        self._unsatisfiable = False
+
+    def new_var(self) -> int:
+        self._num_vars += 1
+        return self._num_vars
+
+    def _literals(self, clause: Sequence[int]) -> list[int] | None:
+        """The distinct literals of a clause or None if it is always true"""
+        literals: list[int] = []
+        for literal in clause:
+            if -literal in literals:
+                return None
+            if literal not in literals:
+                literals.append(literal)
+                self._num_vars = max(self._num_vars, abs(literal))
+        return literals
+
+    def _watch(self, clause: list[int]) -> None:
+        self._watches.setdefault(clause[0], []).append(clause)
+        self._watches.setdefault(clause[1], []).append(clause)
+
+    def _unwatch(self, clause: list[int]) -> None:
+        # the first two literals are always the ones being watched
+        for literal in clause[:2]:
+            watching = self._watches[literal]
+            for i, other in enumerate(watching):
+                if other is clause:
+                    watching[i] = watching[-1]
+                    watching.pop()
+                    break
+
+    def add_clause(self, clause: Sequence[int]) -> None:
+        literals = self._literals(clause)
+        if literals is None:
+            return
+
+        if not literals:
+            self._unsatisfiable = True
+        elif len(literals) == 1:
+            self._units.append(literals[0])
+        else:
+            self._clauses.append(literals)
+            self._watch(literals)
+
+    def solve(
+        self, assumptions: Sequence[int] = (), clauses: Sequence[Sequence[int]] = ()
+    ) -> bool:
+        if self._unsatisfiable:
+            return False
+
+        units = list(assumptions)
+        temporary: list[list[int]] = []
+        for clause in clauses:
+            literals = self._literals(clause)
+            if literals is None:
+                continue
+            if not literals:
+                return False
+            if len(literals) == 1:
+                units.append(literals[0])
+            else:
+                temporary.append(literals)
+
+        for literals in temporary:
+            self._watch(literals)
+        try:
+            return self._solve(units)
+        finally:
+            for literals in temporary:
+                self._unwatch(literals)
+
+    def _solve(self, assumptions: list[int]) -> bool:
+        # 1 is True, -1 is False and 0 is unassigned for each variable
+        values = [0] * (self._num_vars + 1)
+        trail: list[int] = []
+        watches = self._watches
+
+        def value(literal: int) -> int:
+            return values[literal] if literal > 0 else -values[-literal]
+
+        def assign(literal: int) -> None:
+            if literal > 0:
+                values[literal] = 1
+            else:
+                values[-literal] = -1
+            trail.append(literal)
+
+        def propagate(head: int) -> bool:
+            while head < len(trail):
+                false_literal = -trail[head]
+                head += 1
+                watching = watches.get(false_literal)
+                if not watching:
+                    continue
+                i = 0
+                while i < len(watching):
+                    clause = watching[i]
+                    # keep the false literal in the second position
+                    if clause[0] == false_literal:
+                        clause[0], clause[1] = clause[1], clause[0]
+                    if value(clause[0]) == 1:
+                        i += 1
+                        continue
+                    for j in range(2, len(clause)):
+                        if value(clause[j]) != -1:
+                            clause[1], clause[j] = clause[j], clause[1]
+                            watches.setdefault(clause[1], []).append(clause)
+                            watching[i] = watching[-1]
+                            watching.pop()
+                            break
+                    else:
+                        if value(clause[0]) == -1:
+                            return False
+                        assign(clause[0])
+                        i += 1
+            return True
+
+        def undo(position: int) -> None:
+            while len(trail) > position:
+                values[abs(trail.pop())] = 0
+
+        for literal in (*self._units, *assumptions):
+            if abs(literal) > self._num_vars:
+                # a variable that isn't in any clause
+                values.extend([0] * (abs(literal) - len(values) + 1))
+            current = value(literal)
+            if current == -1:
+                return False
+            if current == 0:
+                head = len(trail)
+                assign(literal)
+                if not propagate(head):
+                    return False
+
+        # each decision is the trail position, the literal and
+        # if the literal has already been flipped
+        decisions: list[tuple[int, int, bool]] = []
+        variable = 1
+        while True:
+            while variable <= self._num_vars and values[variable] != 0:
+                variable += 1
+            if variable > self._num_vars:
+                return True
+
+            position = len(trail)
+            decisions.append((position, -variable, False))
+            assign(-variable)
+            while not propagate(position):
+                while decisions:
+                    position, literal, flipped = decisions.pop()
+                    undo(position)
+                    if not flipped:
+                        decisions.append((position, -literal, True))
+                        assign(-literal)
+                        variable = min(variable, abs(literal))
+                        break
+                else:
+                    return False
+
+
+class PySatSolver:
+    """An incremental solver backed by the optional `python-sat` package
+
+    Clauses passed to `solve` are guarded by a variable that is only
+    assumed for that solve and then retired with a unit clause. The
+    solver is rebuilt from the other clauses after `max_retired` guards
+    so the retired clauses don't slow down later solves, and the guard
+    variables are used again.
+    """
+
+    def __init__(self, num_vars: int = 0, max_retired: int = 1000) -> None:
+        self._num_vars = num_vars
+        self._max_retired = max_retired
+        self._clauses: list[list[int]] = []
+        self._guards: list[int] = []
+        self._retired: list[int] = []
+        self._solver = _PySatSolver(name="minisat22")
+
+    def new_var(self) -> int:
+        self._num_vars += 1
+        return self._num_vars
+
+    def add_clause(self, clause: Sequence[int]) -> None:
+        for literal in clause:
+            self._num_vars = max(self._num_vars, abs(literal))
+        self._clauses.append(list(clause))
+        self._solver.add_clause(list(clause))
+
+    def solve(
+        self, assumptions: Sequence[int] = (), clauses: Sequence[Sequence[int]] = ()
+    ) -> bool:
+        if not clauses:
+            return bool(self._solver.solve(assumptions=list(assumptions)))
+
+        guard = self._guards.pop() if self._guards else self.new_var()
+        for clause in clauses:
+            self._solver.add_clause([-guard, *clause])
+        try:
+            return bool(self._solver.solve(assumptions=[guard, *assumptions]))
+        finally:
+            self._solver.add_clause([-guard])
+            self._retired.append(guard)
+            if len(self._retired) >= self._max_retired:
+                self._solver.delete()
+                self._solver = _PySatSolver(
+                    name="minisat22", bootstrap_with=self._clauses
+                )
+                self._guards.extend(self._retired)
+                self._retired = []
+
+
+def create_backend(num_vars: int = 0) -> Backend:
+    """Create the fastest available solver backend
+
+    Args:
+        num_vars (int): The number of variables already in use
+
+    Returns:
+        Backend: `PySatSolver` when `python-sat` is installed otherwise
+            the pure Python `DpllSolver`
+    """
+    if HAS_PYSAT:
+        return PySatSolver(num_vars)
+    return DpllSolver(num_vars)
+
+
+class Solver:
+    """Answers satisfiability queries against a base CNF
+
+    The base CNF is loaded into the backend once. Each query adds
+    SymPy propositions on top of it: single literals are passed in as
+    assumptions and any other clauses only hold for that query. Results
+    match
+    `sympy.logic.inference.satisfiable` on a copy of the base CNF with
+    the propositions added.
+    """
+
+    def __init__(self, cnf: EncodedCNF, backend: Backend | None = None) -> None:
+        self._encoding: dict[Any, int] = dict(cnf.encoding)
+        self._backend = backend or create_backend()
+        for _ in range(len(self._encoding)):
+            self._backend.new_var()
+        for clause in cnf.data:
+            self._backend.add_clause(self._clean(clause))
+
+    @staticmethod
+    def _clean(clause: Iterable[int]) -> list[int]:
+        # SymPy encodes False as 0
+        return [literal for literal in clause if literal != 0]
+
+    def _encode_literal(self, symbol: Any) -> int:
+        if symbol is S.false:
+            return 0
+        variable = self._encoding.get(symbol)
+        if variable is None:
+            variable = self._encoding[symbol] = self._backend.new_var()
+        return variable
+
+    def _encode(self, prop: Any) -> list[list[int]]:
+        if isinstance(prop, Symbol):
+            return [[self._encode_literal(prop)]]
+        if isinstance(prop, Not) and isinstance(prop.args[0], Symbol):
+            return [[-self._encode_literal(prop.args[0])]]
+
+        return [
+            [
+                (
+                    -self._encode_literal(arg.lit)
+                    if arg.is_Not
+                    else self._encode_literal(arg.lit)
+                )
+                for arg in clause
+            ]
+            for clause in CNF.from_prop(prop).clauses
+        ]
+
+    def satisfiable(self, props: Iterable[Any] = ()) -> bool:
+        """Determine if the base CNF and the propositions can be satisfied
+
+        Args:
+            props (Iterable[Any]): SymPy propositions that have to be True
+
+        Returns:
+            bool: True if there is an assignment that satisfies everything
+        """
+        assumptions: list[int] = []
+        clauses: list[list[int]] = []
+        for prop in props:
+            for clause in self._encode(prop):
+                clause = self._clean(clause)
+                if not clause:
+                    return False
+                if len(clause) == 1:
+                    assumptions.append(clause[0])
+                else:
+                    clauses.append(clause)
+
+        return self._backend.solve(assumptions, clauses)
@@ -9,26 +9,45 @@ import itertools
 import logging
 import traceback
 from functools import lru_cache
-from typing import Any, Iterator, Set, Tuple
+from typing import Any, Hashable, Iterator, NamedTuple, Set, Tuple
 
 from sympy import And, Implies, Not, Symbol
 from sympy.assumptions.cnf import EncodedCNF
 from sympy.logic.boolalg import BooleanFalse, BooleanTrue
-from sympy.logic.inference import satisfiable
 
 from cfnlint.conditions._condition import ConditionNamed
 from cfnlint.conditions._equals import Equal, EqualParameter
 from cfnlint.conditions._errors import UnknownSatisfisfaction
 from cfnlint.conditions._rule import Rule
+from cfnlint.conditions._solver import Solver
 from cfnlint.conditions._utils import get_hash
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    frozen: Hashable = value
+    return frozen
+
+
+class SatisfiableCacheInfo(NamedTuple):
+    """Statistics for the `Conditions.satisfiable` cache"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class Conditions:
     """Conditions provides the logic for relating individual condition together"""
 
     _max_scenarios: int = 128  # equivalent to 2^7
+    _max_satisfiable_cache: int = 4096
 
     def __init__(self, cfn) -> None:
         self._conditions: dict[str, ConditionNamed] = {}
@@ -38,6 +57,10 @@ class Conditions:
         self._init_parameters(cfn=cfn)
         self._init_rules(cfn=cfn)
         self._cnf, self._solver_params = self._build_cnf(list(self._conditions.keys()))
+        self._solver = Solver(self._cnf)
+        self._satisfiable_cache: dict[Hashable, bool | UnknownSatisfisfaction] = {}
+        self._satisfiable_hits = 0
+        self._satisfiable_misses = 0
 
     def _init_conditions(self, cfn):
         conditions = cfn.template.get("Conditions")
@@ -233,13 +256,13 @@ class Conditions:
         if len(conditions) == 0:
             return
 
-        c_cnf = self._cnf.copy()
+        c_props = []
         condition_names = []
         conditions_set = {}
         for condition_name, values in conditions.items():
             if condition_name in self._conditions:
                 if values == {True}:
-                    c_cnf.add_prop(
+                    c_props.append(
                         self._conditions[condition_name].build_true_cnf(
                             self._solver_params
                         )
@@ -247,7 +270,7 @@ class Conditions:
                     conditions_set[condition_name] = True
                     continue
                 if values == {False}:
-                    c_cnf.add_prop(
+                    c_props.append(
                         self._conditions[condition_name].build_false_cnf(
                             self._solver_params
                         )
@@ -269,24 +292,24 @@ class Conditions:
                 products = itertools.product([True, False], repeat=len(condition_names))  # type: ignore
 
             for p in products:
-                cnf = c_cnf.copy()
+                props = list(c_props)
                 params = dict(zip(condition_names, p))
                 for condition_name, opt in params.items():
                     if opt:
-                        cnf.add_prop(
+                        props.append(
                             self._conditions[condition_name].build_true_cnf(
                                 self._solver_params
                             )
                         )
                     else:
-                        cnf.add_prop(
+                        props.append(
                             self._conditions[condition_name].build_false_cnf(
                                 self._solver_params
                             )
                         )
 
                 # if the scenario can be satisfied then return it
-                if satisfiable(cnf):
+                if self._solver.satisfiable(props):
                     yield {**params, **conditions_set}
 
                 scenarios_attempted += 1
@@ -329,21 +352,19 @@ class Conditions:
             bool: if the implied condition will be True if the scenario is True
         """
         try:
-            cnf = self._cnf.copy()
             # if the implies condition has to be false in the scenarios we
             # know it can never be true
             if not scenarios.get(implies, True):
                 return False
 
             and_condition = self._build_cfn_implies(scenarios)
-            cnf.add_prop(and_condition)
             implies_condition = self._conditions[implies].build_true_cnf(
                 self._solver_params
             )
-            cnf.add_prop(Not(Implies(and_condition, implies_condition)))
 
-            results = satisfiable(cnf)
-            if results:
+            if self._solver.satisfiable(
+                [and_condition, Not(Implies(and_condition, implies_condition))]
+            ):
                 return False
 
             return True
@@ -364,7 +385,7 @@ class Conditions:
             list[bool]: Returns True, False, or True and False depending on if the
                condition could be True, False or both based on the region parameter
         """
-        cnf_region = self._cnf.copy()
+        region_props = []
         found_region = False
 
         # validate the condition name exists
@@ -377,9 +398,9 @@ class Conditions:
             if is_region:
                 found_region = True
                 if equal_region == region:
-                    cnf_region.add_prop(And(self._solver_params[eql.hash]))
+                    region_props.append(And(self._solver_params[eql.hash]))
                 else:
-                    cnf_region.add_prop(Not(self._solver_params[eql.hash]))
+                    region_props.append(Not(self._solver_params[eql.hash]))
 
         # The condition doesn't use a region parameter so it can be True or False
         # Note: It is possible its a hard coded condition but
@@ -388,18 +409,20 @@ class Conditions:
             return [True, False]
 
         results = []
-        cnf_test = cnf_region.copy()
-        cnf_test.add_prop(
-            self._conditions[condition_name].build_true_cnf(self._solver_params)
-        )
-        if satisfiable(cnf_test):
+        if self._solver.satisfiable(
+            [
+                *region_props,
+                self._conditions[condition_name].build_true_cnf(self._solver_params),
+            ]
+        ):
             results.append(True)
 
-        cnf_test = cnf_region.copy()
-        cnf_test.add_prop(
-            self._conditions[condition_name].build_false_cnf(self._solver_params)
-        )
-        if satisfiable(cnf_test):
+        if self._solver.satisfiable(
+            [
+                *region_props,
+                self._conditions[condition_name].build_false_cnf(self._solver_params),
+            ]
+        ):
             results.append(False)
 
         return results
@@ -410,9 +433,15 @@ class Conditions:
         """Given a list of condition names this function will
         determine if the conditions are satisfied
 
+        Results, including the conditions we can't determine, are cached
+        by the condition and parameter values so repeated checks of the
+        same scenario don't go back to the solver.
+
         Args:
             condition_names (dict[str, bool]): A list of condition names with if
               they are True or False
+            parameter_values (dict[str, str]): The parameter values that
+              are known in this scenario
 
         Returns:
             bool: True if the conditions are satisfied
@@ -420,16 +449,62 @@ class Conditions:
         Raises:
             UnknownSatisfisfaction: If we don't know how to satisfy a condition
         """
+        try:
+            key: Hashable = (
+                frozenset(conditions.items()),
+                _freeze(parameter_values),
+            )
+            cached = self._satisfiable_cache.get(key)
+        except TypeError:
+            # parameter values we can't hash aren't cached
+            return self._satisfiable(conditions, parameter_values)
+
+        if cached is not None:
+            self._satisfiable_hits += 1
+            if isinstance(cached, UnknownSatisfisfaction):
+                raise UnknownSatisfisfaction(str(cached))
+            return cached
+
+        self._satisfiable_misses += 1
+        try:
+            result: bool | UnknownSatisfisfaction = self._satisfiable(
+                conditions, parameter_values
+            )
+        except UnknownSatisfisfaction as e:
+            result = e
+
+        if len(self._satisfiable_cache) >= self._max_satisfiable_cache:
+            # drop the oldest result
+            del self._satisfiable_cache[next(iter(self._satisfiable_cache))]
+        self._satisfiable_cache[key] = result
+
+        if isinstance(result, UnknownSatisfisfaction):
+            raise result
+        return result
+
+    def satisfiable_cache_info(self) -> SatisfiableCacheInfo:
+        """Report the statistics of the `satisfiable` cache
+
+        Returns:
+            SatisfiableCacheInfo: The hits, misses, maximum and current size
+        """
+        return SatisfiableCacheInfo(
+            self._satisfiable_hits,
+            self._satisfiable_misses,
+            self._max_satisfiable_cache,
+            len(self._satisfiable_cache),
+        )
+
+    def _satisfiable(
+        self, conditions: dict[str, bool], parameter_values: dict[str, str]
+    ) -> bool:
         if not conditions:
             if self._rules:
-                satisfied = satisfiable(self._cnf, all_models=False)
-                if satisfied is False:
-                    return satisfied
-                return True
+                return self._solver.satisfiable()
             else:
                 return True
 
-        cnf = self._cnf.copy()
+        props = []
         at_least_one_param_found = False
 
         for condition_name, opt in conditions.items():
@@ -457,18 +532,18 @@ class Conditions:
 
                 at_least_one_param_found = True
                 if c_equals.test(found_params):
-                    cnf.add_prop(Symbol(c_equals.hash))
+                    props.append(Symbol(c_equals.hash))
                 else:
-                    cnf.add_prop(Not(Symbol(c_equals.hash)))
+                    props.append(Not(Symbol(c_equals.hash)))
 
                 if opt:
-                    cnf.add_prop(
+                    props.append(
                         self._conditions[condition_name].build_true_cnf(
                             self._solver_params
                         )
                     )
                 else:
-                    cnf.add_prop(
+                    props.append(
                         self._conditions[condition_name].build_false_cnf(
                             self._solver_params
                         )
@@ -476,14 +551,8 @@ class Conditions:
 
         if at_least_one_param_found is False:
             if self._rules:
-                satisfied = satisfiable(self._cnf, all_models=False)
-                if satisfied is False:
-                    return satisfied
-                return True
+                return self._solver.satisfiable()
             else:
                 return True
 
-        satisfied = satisfiable(cnf, all_models=False)
-        if satisfied is False:
-            return satisfied
-        return True
+        return self._solver.satisfiable(props)
@@ -439,6 +439,17 @@ class CliArgs:
         self.parser = self.create_parser()
         self.cli_args = self.parser.parse_args(cli_args or [])
 
+    def __getstate__(self):
+        # The parser uses a locally defined class and can't be pickled
+        # so it is rebuilt when the config is loaded in another process
+        state = self.__dict__.copy()
+        state.pop("parser", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parser = self.create_parser()
+
     def create_parser(self):
         """Do first round of parsing parameters to set options"""
 
@@ -703,6 +714,63 @@ class CliArgs:
             choices=["informational", "warning", "error", "none"],
             help="Exit code will be non zero from the specified rule class and higher",
         )
+        advanced.add_argument(
+            "-j",
+            "--jobs",
+            dest="jobs",
+            type=int,
+            default=None,
+            help=(
+                "Number of processes used to lint templates in parallel. "
+                "Use 0 to use one process per CPU"
+            ),
+        )
+        advanced.add_argument(
+            "--profile",
+            dest="profile",
+            nargs="?",
+            const="table",
+            default=None,
+            choices=["table", "json"],
+            help=(
+                "Write the time spent in each rule, keyword validator and "
+                "phase to stderr as a table or JSON"
+            ),
+        )
+        advanced.add_argument(
+            "--profile-aggregate",
+            dest="profile_aggregate",
+            default=False,
+            action="store_true",
+            help="Combine the profile of all templates instead of one per template",
+        )
+        advanced.add_argument(
+            "--cache-dir",
+            dest="cache_dir",
+            metavar="DIR",
+            default=None,
+            help=(
+                "Directory to keep the results of templates and their resources "
+                "so unchanged templates and resources aren't checked again"
+            ),
+        )
+        advanced.add_argument(
+            "--serve",
+            dest="serve",
+            metavar="SOCKET",
+            default=None,
+            help=(
+                "Run a lint server on the Unix socket that keeps rules and "
+                "schemas loaded between requests"
+            ),
+        )
+        advanced.add_argument(
+            "--server",
+            dest="server",
+            metavar="SOCKET",
+            default=None,
+            help="Lint using the server running on the Unix socket",
+        )
         advanced.add_argument("--force", help=argparse.SUPPRESS, action="store_true")
 
         return parser
@@ -746,6 +814,7 @@ class TemplateArgs:
 
 
 class ManualArgs(TypedDict, total=False):
+    cache_dir: str
     configure_rules: dict[str, dict[str, Any]]
     deployment_files: list[str]
     ignore_bad_template: bool
@@ -753,6 +822,7 @@ class ManualArgs(TypedDict, total=False):
     ignore_templates: list
     include_checks: list[str]
     include_experimental: bool
+    jobs: int
     mandatory_checks: list[str]
     merge_configs: bool
     non_zero_exit_code: str
@@ -808,6 +878,7 @@ class ConfigMixIn(TemplateArgs, CliArgs, ConfigFileArgs):
         return format_json_string(
             {
                 "append_rules": self.append_rules,
+                "cache_dir": self.cache_dir,
                 "config_file": self.config_file,
                 "configure_rules": self.configure_rules,
                 "custom_rules": self.custom_rules,
@@ -819,6 +890,7 @@ class ConfigMixIn(TemplateArgs, CliArgs, ConfigFileArgs):
                 "include_checks": self.include_checks,
                 "include_experimental": self.include_experimental,
                 "info": self.info,
+                "jobs": self.jobs,
                 "mandatory_checks": self.mandatory_checks,
                 "merge_configs": self.merge_configs,
                 "non_zero_exit_code": self.non_zero_exit_code,
@@ -917,6 +989,10 @@ class ConfigMixIn(TemplateArgs, CliArgs, ConfigFileArgs):
         if (raw_parameters or raw_parameter_files) and len(raw_templates) > 1:
             raise ValueError("Parameters can only be used with a single template")
 
+        raw_jobs = self._jobs_value()
+        if raw_jobs < 0:
+            raise ValueError("Jobs must be zero or a positive number")
+
     def _get_argument_value(self, arg_name, is_template, is_config_file):
         cli_value = getattr(self.cli_args, arg_name)
         template_value = self.template_args.get(arg_name)
@@ -1158,6 +1234,39 @@ class ConfigMixIn(TemplateArgs, CliArgs, ConfigFileArgs):
     def non_zero_exit_code(self):
         return self._get_argument_value("non_zero_exit_code", False, False)
 
+    def _jobs_value(self) -> int:
+        # zero is falsy so `_get_argument_value` would skip it
+        if self.cli_args.jobs is not None:
+            return int(self.cli_args.jobs)
+        return int(self._manual_args.get("jobs", self.file_args.get("jobs", 1)))
+
+    @property
+    def jobs(self) -> int:
+        jobs = self._jobs_value()
+        if jobs == 0:
+            return os.cpu_count() or 1
+        return jobs
+
+    @property
+    def profile(self):
+        return self._get_argument_value("profile", False, False)
+
+    @property
+    def profile_aggregate(self):
+        return self._get_argument_value("profile_aggregate", False, False)
+
+    @property
+    def cache_dir(self):
+        return self._get_argument_value("cache_dir", False, True)
+
+    @property
+    def serve(self):
+        return self._get_argument_value("serve", False, False)
+
+    @property
+    def server(self):
+        return self._get_argument_value("server", False, False)
+
     @property
     def force(self):
         return self._get_argument_value("force", False, False)
@@ -11,7 +11,7 @@ from collections import deque
 from copy import deepcopy
 from dataclasses import InitVar, dataclass, field, fields
 from functools import cached_property, lru_cache
-from typing import TYPE_CHECKING, Any, Deque, Iterator, Set, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Iterator, Set, Tuple, TypeVar
 
 import regex as re
 
@@ -103,24 +103,21 @@ class Path:
         elif isinstance(kwargs.get("cfn_path"), int):
             raise ValueError(f"{kwargs['cfn_path']!r} cannot be an integer")
 
-        for f in fields(Path):
-            if kwargs.get(f.name) is not None:
-                kwargs[f.name] = getattr(self, f.name) + deque([kwargs[f.name]])
+        for name in _PATH_FIELDS:
+            value = kwargs.get(name)
+            if value is not None:
+                kwargs[name] = getattr(self, name).copy()
+                kwargs[name].append(value)
             else:
-                kwargs[f.name] = getattr(self, f.name)
+                kwargs[name] = getattr(self, name)
 
-        return cls(**kwargs)
+        return _evolve(cls, self.__dict__, kwargs, _PATH_FIELDS)
 
     def evolve(self, **kwargs):
         """
         Create a new path without appending values
         """
-        cls = self.__class__
-
-        for f in fields(Path):
-            kwargs.setdefault(f.name, getattr(self, f.name))
-
-        return cls(**kwargs)
+        return _evolve(self.__class__, self.__dict__, kwargs, _PATH_FIELDS)
 
     @property
     def path_string(self):
@@ -205,18 +202,12 @@ class Context:
         """
         Create a new context without merging together attributes
         """
-        cls = self.__class__
-
         if "ref_values" in kwargs:
             new_ref_values = self.ref_values.copy()
             new_ref_values.update(kwargs["ref_values"])
             kwargs["ref_values"] = new_ref_values
 
-        for f in fields(Context):
-            if f.init:
-                kwargs.setdefault(f.name, getattr(self, f.name))
-
-        return cls(**kwargs)
+        return _evolve(self.__class__, self.__dict__, kwargs, _CONTEXT_FIELDS)
 
     def ref_value(self, instance: str) -> Iterator[Tuple[str | list[str], "Context"]]:
         if instance in PSEUDOPARAMS:
@@ -312,6 +303,49 @@ class Context:
         )
 
 
+# The fields of the frozen dataclasses so they can be evolved without
+# reflecting on the fields each time
+_PATH_FIELDS = frozenset(f.name for f in fields(Path) if f.init)
+_CONTEXT_FIELDS = frozenset(f.name for f in fields(Context) if f.init)
+
+
+_T = TypeVar("_T")
+
+
+def _evolve(
+    cls: type[_T],
+    values: dict[str, Any],
+    changes: dict[str, Any],
+    names: frozenset[str],
+) -> _T:
+    """
+    Create a path or context from the fields of another one with changes.
+    They are evolved for every node that is validated so this skips the
+    generated `__init__`. Cached properties aren't copied.
+
+    Args:
+        cls (type): The dataclass to create
+        values (dict[str, Any]): The field values to start from
+        changes (dict[str, Any]): The field values to change
+        names (frozenset[str]): The names of the init fields of the class
+
+    Returns:
+        _T: The new instance of cls
+    """
+    if not changes.keys() <= names or cls not in (Path, Context):
+        # let the dataclass report unknown fields
+        for name in names:
+            changes.setdefault(name, values[name])
+        return cls(**changes)
+
+    obj: _T = object.__new__(cls)
+    state = obj.__dict__
+    for name in names:
+        state[name] = values[name]
+    state.update(changes)
+    return obj
+
+
 def _get_pseudo_value(parameter: str) -> str | list[str] | None:
     if parameter == "AWS::AccountId":
         return "123456789012"
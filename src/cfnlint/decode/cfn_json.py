@@ -4,9 +4,12 @@ SPDX-License-Identifier: MIT-0
 """
 
 import fileinput
+import gc
 import json
 import logging
+import re
 import sys
+from bisect import bisect_right
 from json.decoder import WHITESPACE  # type: ignore
 from json.decoder import BACKSLASH, STRINGCHUNK, WHITESPACE_STR  # type: ignore
 from json.scanner import NUMBER_RE
@@ -41,16 +44,18 @@ def check_duplicates(ordered_pairs, beg_mark, end_mark):
     """
     err = None
     mapping = dict_node({}, beg_mark, end_mark)
+    # the first key seen for each name so duplicates are found by hash
+    keys = {}
     for key, value in ordered_pairs:
-        for m_key in mapping:
-            if m_key == key:
-                if err is None:
-                    err = DuplicateError(f'"{key}"', key)
-                    err.append(m_key)
-                else:
-                    err.append(key)
-        if key not in mapping:
+        m_key = keys.get(key)
+        if m_key is None:
+            keys[key] = key
             mapping[key] = value
+        elif err is None:
+            err = DuplicateError(f'"{key}"', key)
+            err.append(m_key)
+        else:
+            err.append(key)
 
     if err is not None:
         raise err
@@ -309,25 +314,17 @@ def py_make_scanner(context):
 
 def find_indexes(s, ch="\n"):
     """Finds all instances of given char and returns list of indexes"""
-    return [i for i, ltr in enumerate(s) if ltr == ch]
+    indexes = []
+    index = s.find(ch)
+    while index != -1:
+        indexes.append(index)
+        index = s.find(ch, index + 1)
+    return indexes
 
 
 def count_occurrences(arr, key):
     """Binary search indexes to replace str.count"""
-    n = len(arr)
-    left = 0
-    right = n - 1
-    count = 0
-
-    while left <= right:
-        mid = int((right + left) / 2)
-
-        if arr[mid] <= key:
-            count = mid + 1
-            left = mid + 1
-        else:
-            right = mid - 1
-    return count
+    return bisect_right(arr, key)
 
 
 def largest_less_than(indexes, line_num, pos):
@@ -337,13 +334,16 @@ def largest_less_than(indexes, line_num, pos):
 
 def get_beg_end_mark(start, end, indexes):
     """Get the Start and End Mark"""
-    beg_lineno = count_occurrences(indexes, start)
-    beg_colno = start - largest_less_than(indexes, beg_lineno, start)
+    # the same as count_occurrences and largest_less_than without searching
+    # the indexes twice as this is called for every key, object and array
+    beg_lineno = bisect_right(indexes, start)
+    beg_colno = start - (indexes[beg_lineno - 1] if beg_lineno else -1)
     beg_mark = Mark(beg_lineno, beg_colno)
 
     offset = 1 if len(indexes) > 1 else 0
-    end_lineno = count_occurrences(indexes, end) - offset
-    end_colno = end - largest_less_than(indexes, end_lineno, end)
+    end_count = bisect_right(indexes, end)
+    end_lineno = end_count - offset
+    end_colno = end - (indexes[end_lineno - 1] if end_count else -1)
     end_mark = Mark(end_lineno, end_colno)
 
     return beg_mark, end_mark
@@ -378,6 +378,140 @@ def loads(json_string):
     return json.loads(json_string, cls=CfnJSONDecoder)
 
 
+# Characters that the YAML decoder reads differently than JSON or doesn't
+# accept: tabs, line breaks other than CR and LF, non printable characters
+# and escaped UTF-16 surrogates
+_YAML_INCOMPATIBLE = re.compile(
+    "[^\n\r\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd"
+    "\U00010000-\U0010ffff]|\\\\u[dD][89abAB]"
+)
+# Strings and the start and end of objects and arrays in document order
+_MARK_TOKENS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+# Floats the YAML decoder creates. Other JSON numbers are YAML strings.
+_YAML_FLOAT = re.compile(r"-?[0-9]+\.[0-9]*(?:[eE][-+][0-9]+)?")
+# YAML keys have to be on one line and within this many characters of the colon
+_YAML_MAX_KEY_LENGTH = 1000
+
+
+class IncompatibleJSONError(ValueError):
+    """
+    Error thrown when the YAML decoder would decode a JSON document
+    differently than `loads_as_yaml`
+    """
+
+
+class _Pairs(list):
+    """The key value pairs of a JSON object"""
+
+
+def _unique_pairs(pairs):
+    if len({key for key, _ in pairs}) != len(pairs):
+        # let the Python scanner report the duplicates
+        raise ValueError("Duplicate keys")
+    return _Pairs(pairs)
+
+
+def _yaml_pairs(pairs):
+    if len({key for key, _ in pairs}) != len(pairs):
+        # let the YAML decoder report the duplicates
+        raise IncompatibleJSONError("Duplicate keys")
+    return _Pairs(pairs)
+
+
+def _yaml_float(value):
+    if _YAML_FLOAT.fullmatch(value) is None:
+        raise IncompatibleJSONError(f"{value} is a string in YAML")
+    return float(value)
+
+
+def _yaml_constant(value):
+    raise IncompatibleJSONError(f"{value} is a string in YAML")
+
+
+def loads_as_yaml(json_string):
+    """
+    Load the given JSON string into the same nodes as the YAML decoder
+
+    The document is decoded with the C JSON scanner and the marks are
+    added in a second pass over the strings, objects and arrays. The
+    marks and values match what `cfn_yaml.loads` returns for the same
+    string.
+
+    Raises:
+        json.JSONDecodeError: The string isn't valid JSON
+        IncompatibleJSONError: The YAML decoder would decode the
+            string differently
+    """
+    if _YAML_INCOMPATIBLE.search(json_string):
+        raise IncompatibleJSONError("Characters are decoded differently in YAML")
+
+    value = json.loads(
+        json_string,
+        object_pairs_hook=_yaml_pairs,
+        parse_float=_yaml_float,
+        parse_constant=_yaml_constant,
+    )
+
+    if "\r" in json_string:
+        line_breaks = re.finditer("\r\n|\r|\n", json_string)
+    else:
+        line_breaks = re.finditer("\n", json_string)
+    line_starts = [0] + [m.end() for m in line_breaks]
+    next_span = iter([m.span() for m in _MARK_TOKENS.finditer(json_string)]).__next__
+
+    def mark(pos):
+        line = bisect_right(line_starts, pos) - 1
+        return Mark(line, pos - line_starts[line])
+
+    def span(expected):
+        start, end = next_span()
+        if json_string[start] != expected:
+            raise IncompatibleJSONError(f"Expected {expected!r} at {start}")
+        return start, end
+
+    def build(value):
+        value_type = type(value)
+        if value_type is str:
+            start, end = span('"')
+            return str_node(value, mark(start), mark(end))
+        if value_type is _Pairs:
+            node = dict_node({}, mark(span("{")[0]))
+            for key, item in value:
+                start, end = span('"')
+                colon = json_string.find(":", end)
+                if colon - start > _YAML_MAX_KEY_LENGTH or json_string[end:colon].strip(
+                    " "
+                ):
+                    raise IncompatibleJSONError(f"Key {key!r} is not a YAML key")
+                node[str_node(key, mark(start), mark(end))] = build(item)
+            node.end_mark = mark(span("}")[1])
+            return node
+        if value_type is list:
+            node = list_node([], mark(span("[")[0]))
+            node.extend([build(item) for item in value])
+            node.end_mark = mark(span("]")[1])
+            return node
+        return value
+
+    # the nodes don't reference each other in cycles so skip collecting
+    # garbage while building them
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return build(value)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def load_as_yaml(filename):
+    """
+    Load the given JSON file into the same nodes as the YAML decoder
+    """
+    with open(filename, encoding="utf-8") as fp:
+        return loads_as_yaml(fp.read())
+
+
 class CfnJSONDecoder(json.JSONDecoder):
     """
     Converts a json string, where datetime and timedelta objects were converted
@@ -397,9 +531,61 @@ class CfnJSONDecoder(json.JSONDecoder):
     def decode(self, s, _w=WHITESPACE.match):
         """Overridden to retrieve indexes"""
         self.newline_indexes = find_indexes(s)
+        try:
+            return self.c_decode(s)
+        except ValueError:
+            # the Python scanner reports the errors and duplicates
+            pass
         obj = super().decode(s, _w)
         return obj
 
+    def c_decode(self, s):
+        """
+        Decode with the C scanner and add the marks in a second pass over
+        the strings, objects and arrays. The nodes and marks match what the
+        Python scanner creates for the same string.
+
+        Raises:
+            ValueError: The string isn't valid JSON or has duplicate keys
+        """
+        value = json.JSONDecoder(object_pairs_hook=_unique_pairs).decode(s)
+
+        indexes = self.newline_indexes
+        next_start = iter([m.start() for m in _MARK_TOKENS.finditer(s)]).__next__
+
+        def build(value):
+            value_type = type(value)
+            if value_type is str:
+                next_start()
+                return value
+            if value_type is _Pairs:
+                start = next_start() + 1
+                pairs = []
+                for key, item in value:
+                    begin = next_start()
+                    beg_mark, end_mark = get_beg_end_mark(
+                        begin, begin + len(key), indexes
+                    )
+                    pairs.append((str_node(key, beg_mark, end_mark), build(item)))
+                beg_mark, end_mark = get_beg_end_mark(start, next_start() + 1, indexes)
+                return dict_node(pairs, beg_mark, end_mark)
+            if value_type is list:
+                start = next_start() + 1
+                values = [build(item) for item in value]
+                beg_mark, end_mark = get_beg_end_mark(start, next_start() + 1, indexes)
+                return list_node(values, beg_mark, end_mark)
+            return value
+
+        # the nodes don't reference each other in cycles so skip collecting
+        # garbage while building them
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return build(value)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
     def JSONArray(self, s_and_end, scan_once, **kwargs):
         """Convert JSON array to be a list_node object"""
         values, end = json.decoder.JSONArray(s_and_end, scan_once, **kwargs)
@@ -92,6 +92,8 @@ class NodeConstructor(SafeConstructor):
         # because a dict does not support this. It overwrites it with the last
         # occurance, which can give unexpected results
         mapping = {}
+        # the first node seen for each key so duplicates are found by hash
+        key_nodes = {}
         self.flatten_mapping(node)
         matches = []
         for key_node, value_node in node.value:
@@ -115,10 +117,40 @@ class NodeConstructor(SafeConstructor):
                     ],
                 )
             if not getattr(node, "using_merge", False):
-                for key_dup in mapping:
-                    if key_dup == key:
-                        if matches:
-                            matches.append(
+                try:
+                    key_dup = key_nodes.get(key)
+                    if key_dup is None:
+                        key_nodes[key] = key
+                except TypeError:
+                    # unhashable keys are reported when added to the mapping
+                    key_dup = None
+                if key_dup is not None:
+                    if matches:
+                        matches.append(
+                            build_match(
+                                filename=self.filename,
+                                message=(
+                                    f"Duplicate found {key!r} (line"
+                                    f" {key_node.start_mark.line + 1})"
+                                ),
+                                line_number=key_node.start_mark.line,
+                                column_number=key_node.start_mark.column,
+                                key=key,
+                            )
+                        )
+                    else:
+                        matches.extend(
+                            [
+                                build_match(
+                                    filename=self.filename,
+                                    message=(
+                                        f"Duplicate found {key!r} (line"
+                                        f" {key_dup.start_mark.line + 1})"
+                                    ),
+                                    line_number=key_dup.start_mark.line,
+                                    column_number=key_dup.start_mark.column,
+                                    key=key,
+                                ),
                                 build_match(
                                     filename=self.filename,
                                     message=(
@@ -128,33 +160,9 @@ class NodeConstructor(SafeConstructor):
                                     line_number=key_node.start_mark.line,
                                     column_number=key_node.start_mark.column,
                                     key=key,
-                                )
-                            )
-                        else:
-                            matches.extend(
-                                [
-                                    build_match(
-                                        filename=self.filename,
-                                        message=(
-                                            f"Duplicate found {key!r} (line"
-                                            f" {key_dup.start_mark.line + 1})"
-                                        ),
-                                        line_number=key_dup.start_mark.line,
-                                        column_number=key_dup.start_mark.column,
-                                        key=key,
-                                    ),
-                                    build_match(
-                                        filename=self.filename,
-                                        message=(
-                                            f"Duplicate found {key!r} (line"
-                                            f" {key_node.start_mark.line + 1})"
-                                        ),
-                                        line_number=key_node.start_mark.line,
-                                        column_number=key_node.start_mark.column,
-                                        key=key,
-                                    ),
-                                ],
-                            )
+                                ),
+                            ],
+                        )
             try:
                 mapping[key] = value
             except Exception as exc:
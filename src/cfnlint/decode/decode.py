@@ -6,6 +6,7 @@ SPDX-License-Identifier: MIT-0
 from __future__ import annotations
 
 import logging
+import os
 from json.decoder import JSONDecodeError
 from typing import Any, Callable, Dict, List, Tuple, Union
 
@@ -21,21 +22,90 @@ LOGGER = logging.getLogger(__name__)
 Matches = List[Match]
 Decode = Tuple[Union[Dict[str, Any], None], Matches]
 
+# Extensions of files that are decoded as JSON without looking at them
+_JSON_EXTENSIONS = (".json",)
+# Extensions of files that are always decoded as YAML first
+_YAML_EXTENSIONS = (".yaml", ".yml")
+# The number of characters read at a time when sniffing a file
+_SNIFF_SIZE = 4096
+
+
+def _looks_like_json(content: str) -> bool | None:
+    """Check if the first non whitespace character starts a JSON document.
+
+    Returns None when the content is only whitespace.
+    """
+    content = content.lstrip()
+    if not content:
+        return None
+    return content[0] in "{["
+
+
+def _is_json_file(filename: str | None) -> bool:
+    """Check if a template file should be decoded as JSON first."""
+    if filename is None:
+        # stdin can only be read once so leave it to the YAML decoder
+        return False
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in _JSON_EXTENSIONS:
+        return True
+    if extension in _YAML_EXTENSIONS:
+        return False
+    try:
+        with open(filename, encoding="utf-8") as fp:
+            while chunk := fp.read(_SNIFF_SIZE):
+                looks_like_json = _looks_like_json(chunk)
+                if looks_like_json is not None:
+                    return looks_like_json
+    except (OSError, UnicodeDecodeError):
+        # the YAML decoder reports the error
+        pass
+    return False
+
 
 def decode_str(s: str) -> Decode:
     """Decode the string s into an object."""
-    return _decode(cfn_yaml.loads, cfn_json.loads, s, None)
+    return _decode(
+        cfn_yaml.loads,
+        cfn_json.loads,
+        s,
+        None,
+        cfn_json.loads_as_yaml if _looks_like_json(s) else None,
+    )
 
 
 def decode(filename: str | None) -> Decode:
     """Decode filename into an object."""
-    return _decode(cfn_yaml.load, cfn_json.load, filename, filename)
+    return _decode(
+        cfn_yaml.load,
+        cfn_json.load,
+        filename,
+        filename,
+        cfn_json.load_as_yaml if _is_json_file(filename) else None,
+    )
 
 
 def _decode(
-    yaml_f: Callable, json_f: Callable, payload: str | None, filename: str | None
+    yaml_f: Callable,
+    json_f: Callable,
+    payload: str | None,
+    filename: str | None,
+    json_first_f: Callable | None = None,
 ) -> Decode:
-    """Decode payload using yaml_f and json_f, using filename for log output."""
+    """Decode payload using yaml_f and json_f, using filename for log output.
+
+    JSON templates are decoded with json_first_f when it is provided. It
+    creates the same nodes as yaml_f so any error falls back to yaml_f
+    and json_f to report the errors the same way.
+    """
+    if json_first_f is not None:
+        try:
+            return json_first_f(payload), []
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            LOGGER.debug(
+                "Could not decode %s as JSON, trying YAML: %s", filename or "-", err
+            )
+
     template = None
     matches: Matches = []
     try:
@@ -24,11 +24,7 @@ def create_str_node_class(cls):
         def __init__(
             self, x, start_mark: Mark | None = None, end_mark: Mark | None = None
         ):
-            try:
-                cls.__init__(self, x)
-            except TypeError:
-                cls.__init__(self)
-
+            # the value is set in __new__ as the class is immutable
             self.start_mark = start_mark or Mark()
             self.end_mark = end_mark or Mark()
 
@@ -41,6 +37,9 @@ def create_str_node_class(cls):
             memo[id(self)] = result
             return result
 
+        def __reduce__(self):
+            return (_rebuild_str_node, (cls(self), self.start_mark, self.end_mark))
+
     node_class.__name__ = f"{cls.__name__}_node"
     return node_class
 
@@ -76,6 +75,12 @@ def create_dict_node_class(cls):
 
             return result
 
+        def __reduce__(self):
+            return (
+                _rebuild_dict_node,
+                (cls(self), self.start_mark, self.end_mark, self.using_merge),
+            )
+
         def get(self, key, default=None):
             """Override the default get"""
             if isinstance(default, dict):
@@ -112,6 +117,9 @@ def create_dict_list_class(cls):
 
             return result
 
+        def __reduce__(self):
+            return (_rebuild_list_node, (cls(self), self.start_mark, self.end_mark))
+
     node_class.__name__ = f"{cls.__name__}_node"
     return node_class
 
@@ -119,3 +127,17 @@ def create_dict_list_class(cls):
 str_node = create_str_node_class(str)
 dict_node = create_dict_node_class(dict)
 list_node = create_dict_list_class(list)
+
+
+# The node classes are created dynamically so pickle can't find them by name.
+# These helpers let nodes cross process boundaries with their marks intact.
+def _rebuild_str_node(x, start_mark, end_mark):
+    return str_node(x, start_mark, end_mark)
+
+
+def _rebuild_dict_node(x, start_mark, end_mark, using_merge=False):
+    return dict_node(x, start_mark, end_mark, using_merge)
+
+
+def _rebuild_list_node(x, start_mark, end_mark):
+    return list_node(x, start_mark, end_mark)
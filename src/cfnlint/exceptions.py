@@ -5,6 +5,7 @@ SPDX-License-Identifier: MIT-0
 
 from __future__ import annotations
 
+import copyreg
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -39,6 +40,12 @@ class CfnLintExitException(Exception):
         super().__init__(msg)
         self.exit_code = exit_code
 
+    def __reduce__(self):
+        # Subclasses don't share a constructor signature so rebuild the
+        # exception from its args and attributes instead of calling __init__.
+        # This keeps the exit code when raised from a worker process.
+        return (copyreg.__newobj__, (type(self), *self.args), self.__dict__)
+
 
 class InvalidRegionException(CfnLintExitException):
     """
@@ -49,6 +56,15 @@ class InvalidRegionException(CfnLintExitException):
     """
 
 
+class ServerUnavailableException(CfnLintExitException):
+    """
+    An exception that is raised when a lint server can't be used.
+
+    This exception is raised when the client can't connect to the lint
+    server or the server closes the connection without a valid reply.
+    """
+
+
 class UnexpectedRuleException(CfnLintExitException):
     """
     An exception that is raised when an unexpected error occurs while loading rules.
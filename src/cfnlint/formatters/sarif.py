@@ -94,7 +94,7 @@ class SARIFFormatter(BaseFormatter):
                     else "https://github.com/aws-cloudformation/cfn-lint/blob/main/docs/rules.md"
                 ),
             )
-            for rule_id in matched_rules
+            for rule_id in sorted(matched_rules)
         ]
 
         run = sarif.Run(
@@ -121,15 +121,31 @@ class Graph:
         self._add_subs(cfn)
 
     def get_cycles(self, cfn):
-        """Return all resource pairs that have a cycle in them"""
+        """Return all resource pairs that have a cycle in them
+
+        An edge is part of a cycle when it is a self loop or both of its
+        nodes are in the same strongly connected component so the
+        components are found once instead of searching for a cycle from
+        every resource. Parallel edges between the same resources are
+        only returned once.
+        """
+        components: dict[str, int] = {}
+        for i, component in enumerate(
+            networkx.strongly_connected_components(self.graph)
+        ):
+            if len(component) > 1:
+                components.update(dict.fromkeys(component, i))
+
         result = []
-        for starting_resource in cfn.template.get("Resources", {}):
-            try:
-                for edge in list(networkx.find_cycle(self.graph, starting_resource)):
-                    if edge not in result:
-                        result.append(edge)
-            except networkx.NetworkXNoCycle:
+        seen = set()
+        for source, target, key in self.graph.edges(keys=True):
+            if (source, target) in seen:
                 continue
+            if source == target or (
+                source in components and components[source] == components.get(target)
+            ):
+                seen.add((source, target))
+                result.append((source, target, key))
         return result
 
     def _add_parameters(self, cfn: Any) -> None:
@@ -22,6 +22,14 @@ if TYPE_CHECKING:
 
 _all_types = ["array", "boolean", "integer", "number", "object", "string"]
 
+# The number of filtered schemas to keep before starting over
+_MAX_FILTERED_SCHEMAS = 4096
+
+# Filtered schemas keyed by the id of the source schema, the cfn path
+# and if the cfnLint keyword is added. The source schema is kept with
+# the result so the id can't be reused while it is cached.
+_filtered_schemas: dict[tuple[int, str, bool], tuple[Any, Tuple[Any, Any]]] = {}
+
 
 @dataclass
 class FunctionFilter:
@@ -82,6 +90,25 @@ class FunctionFilter:
             if validator.context.path.path[-1] in ["Fn::If"]:
                 return schema, None
 
+        cfn_path = "/".join(validator.context.path.cfn_path)
+        key = (id(schema), cfn_path, self.add_cfn_lint_keyword)
+        cached = _filtered_schemas.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        filtered = self._build_filtered_schemas(schema, cfn_path)
+        if len(_filtered_schemas) >= _MAX_FILTERED_SCHEMAS:
+            _filtered_schemas.clear()
+        _filtered_schemas[key] = (schema, filtered)
+        return filtered
+
+    def _build_filtered_schemas(self, schema, cfn_path: str) -> Tuple[Any, Any]:
+        """
+        Split a schema into the standard and group schemas.
+
+        The results are cached and shared between nodes at the same
+        cfn path so they shouldn't be modified.
+        """
         standard_schema = {}
         group_schema = {}
         for key, value in schema.items():
@@ -91,7 +118,7 @@ class FunctionFilter:
                 standard_schema[key] = value
         if self.add_cfn_lint_keyword and "$ref" not in standard_schema:
             standard_schema["cfnLint"] = ensure_list(standard_schema.get("cfnLint", []))
-            standard_schema["cfnLint"].append("/".join(validator.context.path.cfn_path))
+            standard_schema["cfnLint"].append(cfn_path)
 
         # some times CloudFormation dumps to standard nested "json".
         # it will do by using {"type": "object"} with no properties
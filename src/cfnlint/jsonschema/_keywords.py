@@ -20,7 +20,6 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from difflib import SequenceMatcher
 from typing import Any, Sequence
 
@@ -38,6 +37,38 @@ from cfnlint.jsonschema._utils import (
 )
 from cfnlint.jsonschema.exceptions import FormatError
 
+# Strings converted by the numeric keywords, None when it isn't a number
+_MAX_NUMBERS = 4096
+_numbers: dict[str, float | None] = {}
+
+
+def _number(validator: Validator, instance: Any) -> Any:
+    """
+    The instance as a number for the numeric keywords. Strings are
+    converted to a float as CloudFormation accepts numbers as strings.
+
+    Returns:
+        Any: The number or None if the instance isn't a number
+    """
+    if validator.is_type(instance, "string"):
+        if instance in _numbers:
+            instance = _numbers[instance]
+        else:
+            number = None
+            try:
+                number = float(instance)
+            except ValueError:
+                pass
+            if len(_numbers) >= _MAX_NUMBERS:
+                _numbers.clear()
+            _numbers[instance] = number
+            instance = number
+        if instance is None:
+            return None
+    if not validator.is_type(instance, "number"):
+        return None
+    return instance
+
 
 def additionalProperties(
     validator: Validator, aP: Any, instance: Any, schema: dict[str, Any]
@@ -304,13 +335,8 @@ def enumCaseInsensitive(
 def exclusiveMaximum(
     validator: Validator, m: Any, instance: Any, schema: dict[str, Any]
 ) -> ValidationResult:
-    t_instance = deepcopy(instance)
-    if validator.is_type(t_instance, "string"):
-        try:
-            t_instance = float(t_instance)
-        except ValueError:
-            return
-    if not validator.is_type(t_instance, "number"):
+    t_instance = _number(validator, instance)
+    if t_instance is None:
         return
 
     if t_instance >= m:
@@ -322,13 +348,8 @@ def exclusiveMaximum(
 def exclusiveMinimum(
     validator: Validator, m: Any, instance: Any, schema: dict[str, Any]
 ) -> ValidationResult:
-    t_instance = deepcopy(instance)
-    if validator.is_type(t_instance, "string"):
-        try:
-            t_instance = float(t_instance)
-        except ValueError:
-            return
-    if not validator.is_type(t_instance, "number"):
+    t_instance = _number(validator, instance)
+    if t_instance is None:
         return
 
     if t_instance <= m:
@@ -455,13 +476,8 @@ def maxProperties(
 def maximum(
     validator: Validator, m: Any, instance: Any, schema: dict[str, Any]
 ) -> ValidationResult:
-    t_instance = deepcopy(instance)
-    if validator.is_type(t_instance, "string"):
-        try:
-            t_instance = float(t_instance)
-        except:  # noqa: E722
-            return
-    if not validator.is_type(t_instance, "number"):
+    t_instance = _number(validator, instance)
+    if t_instance is None:
         return
 
     if t_instance > m:
@@ -500,13 +516,8 @@ def minProperties(
 def minimum(
     validator: Validator, m: Any, instance: Any, schema: dict[str, Any]
 ) -> ValidationResult:
-    t_instance = deepcopy(instance)
-    if validator.is_type(t_instance, "string"):
-        try:
-            t_instance = float(t_instance)
-        except ValueError:
-            return
-    if not validator.is_type(t_instance, "number"):
+    t_instance = _number(validator, instance)
+    if t_instance is None:
         return
 
     if t_instance < m:
@@ -517,13 +528,8 @@ def minimum(
 def multipleOf(
     validator: Validator, dB: Any, instance: Any, schema: dict[str, Any]
 ) -> ValidationResult:
-    t_instance = deepcopy(instance)
-    if validator.is_type(t_instance, "string"):
-        try:
-            t_instance = float(t_instance)
-        except ValueError:
-            return
-    if not validator.is_type(t_instance, "number"):
+    t_instance = _number(validator, instance)
+    if t_instance is None:
         return
 
     if isinstance(dB, float):
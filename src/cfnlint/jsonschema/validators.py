@@ -22,8 +22,9 @@ import logging
 from collections import deque
 from collections.abc import Mapping
 from dataclasses import dataclass, field, fields
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import cfnlint.profiler
 from cfnlint.conditions import UnknownSatisfisfaction
 from cfnlint.context import Context
 from cfnlint.helpers import is_function
@@ -43,6 +44,20 @@ from cfnlint.template import Template
 
 LOGGER = logging.getLogger(__name__)
 
+# The number of compiled schema plans to keep before starting over
+_MAX_PLANS = 4096
+
+# The keyword, value, validator and custom message for each keyword
+_Plan = Tuple[
+    Tuple[
+        str,
+        Any,
+        Callable[[Any, Any, Any, Dict[str, Any]], ValidationResult],
+        Optional[str],
+    ],
+    ...,
+]
+
 
 def create(
     validators: Mapping[str, V] | None = None,
@@ -53,6 +68,11 @@ def create(
     function_filter_arg = function_filter or FunctionFilter()
     fn_resolvers_arg = fn_resolvers or {}
 
+    # Compiled plans keyed by the ids of the schema and validators they
+    # were built from. Both are kept with the plan so the ids can't be
+    # reused while the plan is cached.
+    plans: dict[tuple[int, int], tuple[Any, Mapping[str, V], int, _Plan]] = {}
+
     @dataclass
     class Validator:
         """
@@ -211,6 +231,39 @@ def create(
             # we will ignore this error
             yield instance, self, None  # type: ignore[misc]
 
+        def _plan(self, schema: Mapping[str, Any]) -> _Plan:
+            """
+            Get the keywords in a schema that have a validator.
+
+            The plan holds the keyword, its value, the function to
+            validate it with and any custom message from the schema so
+            that validating the same schema again doesn't have to walk
+            the schema or look up the validators.
+
+            Schemas are expected not to change once they are used to
+            validate. A schema that gained or lost keywords is compiled
+            again.
+            """
+            key = (id(schema), id(self.validators))
+            entry = plans.get(key)
+            if (
+                entry is not None
+                and entry[0] is schema
+                and entry[1] is self.validators
+                and entry[2] == len(schema)
+            ):
+                return entry[3]
+
+            plan = tuple(
+                (k, v, validator, custom_msg(k, schema))
+                for k, v in schema.items()
+                if (validator := self.validators.get(k)) is not None
+            )
+            if len(plans) >= _MAX_PLANS:
+                plans.clear()
+            plans[key] = (schema, self.validators, len(schema), plan)
+            return plan
+
         def iter_errors(self, instance: Any) -> ValidationResult:
             r"""
             Lazily yield each of the validation errors in the given instance.
@@ -240,6 +293,7 @@ def create(
                 )
                 return
 
+            profiler = cfnlint.profiler.PROFILER
             scope = id_of(schema)
             if scope:
                 self.resolver.push_scope(scope)
@@ -248,16 +302,22 @@ def create(
                 for _instance, _schema, _validator in self.function_filter.filter(
                     self, instance, schema
                 ):
-                    for k, v in _schema.items():
-                        validator = self.validators.get(k)
-                        if validator is None:
-                            continue
-
+                    for k, v, validator, message in self._plan(_schema):
                         try:
-                            for err in (
-                                validator(_validator, v, _instance, _schema) or ()
-                            ):
-                                msg = custom_msg(k, _schema) or err.message
+                            if profiler is not None:
+                                errs = profiler.profile(
+                                    "keyword",
+                                    k,
+                                    validator,
+                                    _validator,
+                                    v,
+                                    _instance,
+                                    _schema,
+                                )
+                            else:
+                                errs = validator(_validator, v, _instance, _schema)
+                            for err in errs or ():
+                                msg = message or err.message
                                 if msg is not None:
                                     err.message = msg
                                 # set details if not already set by the called fn
@@ -340,11 +400,21 @@ def create(
             StandardValidator(schema={'type': 'number'}, format_checker=None)
             """
             cls = self.__class__
-            for f in fields(Validator):
-                if f.init:
-                    kwargs.setdefault(f.name, getattr(self, f.name))
-
-            return cls(**kwargs)
+            if cls is not Validator or not kwargs.keys() <= init_fields:
+                # let the dataclass report unknown fields
+                for name in init_fields:
+                    kwargs.setdefault(name, getattr(self, name))
+                return cls(**kwargs)
+
+            # validators are evolved for every node that is validated so
+            # copy the fields instead of going through `__init__`
+            validator = object.__new__(cls)
+            state = validator.__dict__
+            state.update(self.__dict__)
+            state.update(kwargs)
+            if validator.context is None or validator.resolver is None:
+                validator.__post_init__()
+            return validator
 
         def extend(
             self,
@@ -370,15 +440,58 @@ def create(
             if fn_resolvers is not None:
                 all_fn_resolvers.update(fn_resolvers)
 
-            return create(  # type: ignore
-                validators=all_validators,
-                function_filter=function_filter,
-                fn_resolvers=all_fn_resolvers,
+            key = (
+                _identity_key(all_validators),
+                _identity_key(all_fn_resolvers),
+                _filter_key(function_filter),
             )
+            cls = _extended.get(key)
+            if cls is None:
+                cls = create(
+                    validators=all_validators,
+                    function_filter=function_filter,
+                    fn_resolvers=all_fn_resolvers,
+                )
+                if len(_extended) >= _MAX_EXTENDED:
+                    _extended.clear()
+                _extended[key] = cls
+
+            return cls  # type: ignore
+
+    init_fields = frozenset(f.name for f in fields(Validator) if f.init)
 
     return Validator
 
 
+# The number of extended validator classes to keep before starting over
+_MAX_EXTENDED = 512
+
+# Validator classes created by `extend` so that rules extending a
+# validator with the same functions reuse the class and its plans
+_extended: dict[tuple[Any, ...], Any] = {}
+
+
+def _identity_key(functions: Mapping[str, Any]) -> tuple[Any, ...]:
+    # Rules aren't hashable so bound methods are keyed by the ids of
+    # the rule and the function. The class created from the functions
+    # keeps them alive so the ids can't be reused while it is cached.
+    return tuple(
+        (
+            k,
+            id(getattr(fn, "__self__", fn)),
+            id(getattr(fn, "__func__", fn)),
+        )
+        for k, fn in functions.items()
+    )
+
+
+def _filter_key(function_filter: FunctionFilter) -> tuple[Any, ...]:
+    return (type(function_filter),) + tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (getattr(function_filter, f.name) for f in fields(function_filter))
+    )
+
+
 _standard_validators: dict[str, V] = {
     "$ref": _keywords.ref,
     "additionalProperties": _keywords.additionalProperties,
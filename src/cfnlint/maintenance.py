@@ -10,6 +10,9 @@ import subprocess
 
 import cfnlint
 import cfnlint.data.AdditionalSpecs
+import cfnlint.data.Rules
+import cfnlint.rules._manifest
+import cfnlint.rules.helpers.policies
 from cfnlint.helpers import get_url_content
 from cfnlint.schema import PROVIDER_SCHEMA_MANAGER
 
@@ -110,6 +113,20 @@ def update_documentation(rules):
         new_file.write("\n\\* experimental rules\n")
 
 
+def update_rule_manifest():
+    """update the manifest describing the rules so they can be imported lazily"""
+
+    filename = os.path.join(
+        os.path.dirname(cfnlint.data.Rules.__file__),
+        cfnlint.rules._manifest.MANIFEST_FILENAME,
+    )
+    LOGGER.debug("Writing the rule manifest to %s", filename)
+
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(cfnlint.rules._manifest.build(), f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
 def update_iam_policies():
     """update iam policies file"""
 
@@ -182,3 +199,12 @@ def update_iam_policies():
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=1, sort_keys=True, separators=(",", ": "))
         f.write("\n")
+
+    cfnlint.rules.helpers.policies.compile_policy_store(
+        data,
+        os.path.join(
+            os.path.dirname(cfnlint.data.AdditionalSpecs.__file__),
+            cfnlint.rules.helpers.policies.STORE_FILENAME,
+        ),
+        filename,
+    )
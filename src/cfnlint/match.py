@@ -63,6 +63,28 @@ class Match:
                 if not hasattr(self, k):
                     super().__setattr__(k, v)
 
+    def __hash__(self):
+        """
+        Hash the fields compared for equality so matches can be kept in
+        sets and dicts. The rule is hashed by its id as rules compare by id.
+
+        Returns:
+            int: The hash value of the Match instance.
+        """
+        return hash(
+            (
+                self.message,
+                getattr(self.rule, "id", None),
+                self.filename,
+                self.linenumber,
+                self.columnnumber,
+                self.linenumberend,
+                self.columnnumberend,
+                self.id,
+                self.parent_id,
+            )
+        )
+
     def __repr__(self):
         # use the Posix path to keep things consistent across platforms
         file_str = Path(self.filename).as_posix() + ":" if self.filename else ""
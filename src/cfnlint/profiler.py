@@ -0,0 +1,311 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Iterable, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+# The profiler collecting timings for the current run. Profiling is
+# off when this is None so the hot paths only pay for the check.
+PROFILER: Profiler | None = None
+
+
+@dataclass
+class ProfileStats:
+    """Timings for a rule, keyword validator or phase
+
+    Attributes:
+        calls (int): The number of times it was invoked.
+        total_time (float): Seconds spent in it including anything it
+            called. Recursive invocations are only counted once.
+        self_time (float): Seconds spent in it excluding anything else
+            that was profiled while it was running.
+    """
+
+    calls: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+
+
+class Profiler:
+    """Collects wall time and invocation counts
+
+    Timings are kept per template for a category (`phase`, `rule` or
+    `keyword`) and a name. Generators are timed each time they are
+    advanced so time spent by the consumer isn't included.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str, str], ProfileStats] = {}
+        self._template = "-"
+        # the key, start time and child time of each running frame
+        self._frames: list[list[Any]] = []
+        self._active: dict[tuple[str, str, str], int] = {}
+
+    def _stats(
+        self, category: str, name: str
+    ) -> tuple[tuple[str, str, str], ProfileStats]:
+        key = (self._template, category, name)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = ProfileStats()
+        return key, stats
+
+    def _enter(self, key: tuple[str, str, str]) -> None:
+        self._active[key] = self._active.get(key, 0) + 1
+        self._frames.append([key, perf_counter(), 0.0])
+
+    def _exit(self, stats: ProfileStats) -> None:
+        key, start, child_time = self._frames.pop()
+        elapsed = perf_counter() - start
+        stats.self_time += elapsed - child_time
+        self._active[key] -= 1
+        if not self._active[key]:
+            stats.total_time += elapsed
+        if self._frames:
+            self._frames[-1][2] += elapsed
+
+    @contextmanager
+    def template(self, filename: str | None) -> Iterator[None]:
+        """Attribute the timings in the block to a template
+
+        Args:
+            filename (str | None): The template filename or None for stdin
+        """
+        previous = self._template
+        self._template = filename or "-"
+        try:
+            yield
+        finally:
+            self._template = previous
+
+    @contextmanager
+    def measure(self, category: str, name: str) -> Iterator[None]:
+        """Time a block of code
+
+        Args:
+            category (str): The category of the timing
+            name (str): The name of the timing
+        """
+        key, stats = self._stats(category, name)
+        stats.calls += 1
+        self._enter(key)
+        try:
+            yield
+        finally:
+            self._exit(stats)
+
+    def profile(
+        self,
+        category: str,
+        name: str,
+        function: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Time a function that returns an iterable of results
+
+        Args:
+            category (str): The category of the timing
+            name (str): The name of the timing
+            function (Callable[..., Any]): The function to call. It can
+                return None when there are no results.
+            *args (Any): The arguments for the function
+            **kwargs (Any): The keyword arguments for the function
+
+        Yields:
+            Any: The results of the function
+        """
+        key, stats = self._stats(category, name)
+        stats.calls += 1
+        self._enter(key)
+        try:
+            iterator = iter(function(*args, **kwargs) or ())
+        finally:
+            self._exit(stats)
+
+        while True:
+            self._enter(key)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit(stats)
+            yield item
+
+    def results(self, aggregate: bool = False) -> list[dict[str, Any]]:
+        """The timings sorted by the most self time first
+
+        Args:
+            aggregate (bool): Combine the timings of all templates
+
+        Returns:
+            list[dict[str, Any]]: A dict for each timing
+        """
+        combined: dict[tuple[str, str, str], ProfileStats] = {}
+        for (template, category, name), stats in self.stats.items():
+            key = ("", category, name) if aggregate else (template, category, name)
+            total = combined.setdefault(key, ProfileStats())
+            total.calls += stats.calls
+            total.total_time += stats.total_time
+            total.self_time += stats.self_time
+
+        results = []
+        for (template, category, name), stats in sorted(
+            combined.items(), key=lambda item: (item[0][0], -item[1].self_time)
+        ):
+            result: dict[str, Any] = {} if aggregate else {"template": template}
+            result.update(
+                {
+                    "category": category,
+                    "name": name,
+                    "calls": stats.calls,
+                    "total_time": round(stats.total_time, 6),
+                    "self_time": round(stats.self_time, 6),
+                }
+            )
+            results.append(result)
+        return results
+
+    def to_json(self, aggregate: bool = False) -> str:
+        """Format the timings as JSON
+
+        Args:
+            aggregate (bool): Combine the timings of all templates
+
+        Returns:
+            str: The timings as a JSON list
+        """
+        return json.dumps(self.results(aggregate), indent=4)
+
+    def to_table(self, aggregate: bool = False) -> str:
+        """Format the timings as a table for each template
+
+        Args:
+            aggregate (bool): Combine the timings of all templates
+
+        Returns:
+            str: The timings as text tables
+        """
+        tables: dict[str, list[dict[str, Any]]] = {}
+        for result in self.results(aggregate):
+            tables.setdefault(result.get("template", "All templates"), []).append(
+                result
+            )
+
+        lines: list[str] = []
+        for title, results in tables.items():
+            rows = [("Category", "Name", "Calls", "Total (s)", "Self (s)")]
+            rows.extend(
+                (
+                    r["category"],
+                    r["name"],
+                    str(r["calls"]),
+                    f"{r['total_time']:.6f}",
+                    f"{r['self_time']:.6f}",
+                )
+                for r in results
+            )
+            widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+            if lines:
+                lines.append("")
+            lines.append(f"Profile for {title}")
+            for row in rows:
+                lines.append(
+                    "  ".join(
+                        cell.ljust(width) if i < 2 else cell.rjust(width)
+                        for i, (cell, width) in enumerate(zip(row, widths))
+                    ).rstrip()
+                )
+        return "\n".join(lines)
+
+    def format(self, fmt: str = "table", aggregate: bool = False) -> str:
+        """Format the timings
+
+        Args:
+            fmt (str): Either `table` or `json`
+            aggregate (bool): Combine the timings of all templates
+
+        Returns:
+            str: The formatted timings
+        """
+        if fmt == "json":
+            return self.to_json(aggregate)
+        return self.to_table(aggregate)
+
+
+def enable() -> Profiler:
+    """Start collecting timings with a new profiler
+
+    Returns:
+        Profiler: The profiler collecting the timings
+    """
+    global PROFILER  # pylint: disable=global-statement
+    PROFILER = Profiler()
+    return PROFILER
+
+
+def disable() -> None:
+    """Stop collecting timings"""
+    global PROFILER  # pylint: disable=global-statement
+    PROFILER = None
+
+
+def measure(category: str, name: str) -> ContextManager[None]:
+    """Time a block of code when profiling is enabled
+
+    Args:
+        category (str): The category of the timing
+        name (str): The name of the timing
+
+    Returns:
+        ContextManager[None]: A context manager timing the block
+    """
+    if PROFILER is None:
+        return nullcontext()
+    return PROFILER.measure(category, name)
+
+
+def template(filename: str | None) -> ContextManager[None]:
+    """Attribute timings to a template when profiling is enabled
+
+    Args:
+        filename (str | None): The template filename or None for stdin
+
+    Returns:
+        ContextManager[None]: A context manager for the template
+    """
+    if PROFILER is None:
+        return nullcontext()
+    return PROFILER.template(filename)
+
+
+def profile(
+    category: str, name: str, function: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Iterable[Any]:
+    """Time a function returning an iterable when profiling is enabled
+
+    Args:
+        category (str): The category of the timing
+        name (str): The name of the timing
+        function (Callable[..., Any]): The function to call
+        *args (Any): The arguments for the function
+        **kwargs (Any): The keyword arguments for the function
+
+    Returns:
+        Iterable[Any]: The results of the function
+    """
+    if PROFILER is None:
+        results: Iterable[Any] = function(*args, **kwargs)
+        return results
+    return PROFILER.profile(category, name, function, *args, **kwargs)
@@ -0,0 +1,197 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+import cfnlint.data.Rules
+import cfnlint.helpers
+
+if TYPE_CHECKING:
+    from cfnlint.rules._rule import CloudFormationLintRule
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+
+# The directory of the rules that come with cfn-lint
+RULES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass(frozen=True)
+class RuleMetadata:
+    """
+    What is known about a rule without importing it.
+
+    Attributes:
+        id (str): The ID of the rule.
+        module (str): The file of the rule relative to the rules
+            directory without the `.py` extension.
+        classname (str): The name of the rule class in the module.
+        shortdesc (str): The short description of the rule.
+        description (str): The description of the rule.
+        source_url (str): The URL documenting the rule.
+        tags (list[str]): The tags of the rule.
+        experimental (bool): If the rule is experimental.
+        resource_property_types (list[str]): The resource types the rule
+            checks the properties of.
+        child_rules (list[str]): The IDs of the child rules.
+        parent_rules (list[str]): The IDs of the parent rules.
+    """
+
+    id: str
+    module: str
+    classname: str
+    shortdesc: str = ""
+    description: str = ""
+    source_url: str = ""
+    tags: list[str] = field(default_factory=list)
+    experimental: bool = False
+    resource_property_types: list[str] = field(default_factory=list)
+    child_rules: list[str] = field(default_factory=list)
+    parent_rules: list[str] = field(default_factory=list)
+
+    def verbose(self) -> str:
+        """Verbose output"""
+        return f"{self.id}: {self.shortdesc}\n{self.description}"
+
+
+def _module_files(directory: str) -> list[str]:
+    """The rule files in a directory the same way `load_plugins` finds them"""
+    files = []
+    for root, _, filenames in os.walk(directory):
+        for filename in fnmatch.filter(filenames, "[A-Za-z1-9]*.py"):
+            files.append(os.path.relpath(os.path.join(root, filename), directory))
+    return sorted(f.replace(os.sep, "/") for f in files)
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        # ignore line endings so checkouts on Windows match
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def _module_digests(directory: str) -> dict[str, str]:
+    return {
+        module: _file_digest(os.path.join(directory, module))
+        for module in _module_files(directory)
+    }
+
+
+def _import(directory: str, module: str) -> ModuleType | None:
+    root, name = os.path.split(os.path.join(directory, module))
+    mod: ModuleType | None = cfnlint.helpers.import_filename(name, root)
+    return mod
+
+
+def build(directory: str = RULES_DIR) -> dict[str, Any]:
+    """
+    Import every rule in a directory and describe them for the manifest.
+
+    Args:
+        directory (str): The rules directory.
+
+    Returns:
+        dict[str, Any]: The digest of each rule file and the metadata of
+            each rule in the order they are loaded.
+    """
+    rules = []
+    for module in _module_files(directory):
+        mod = _import(directory, module[: -len(".py")])
+        if mod is None:
+            continue
+        for rule in cfnlint.helpers.create_rules(mod):
+            if not rule.id:
+                continue
+            rules.append(
+                asdict(
+                    RuleMetadata(
+                        id=rule.id,
+                        module=module[: -len(".py")],
+                        classname=type(rule).__name__,
+                        shortdesc=rule.shortdesc,
+                        description=rule.description,
+                        source_url=rule.source_url,
+                        tags=list(rule.tags),
+                        experimental=rule.experimental,
+                        resource_property_types=list(rule.resource_property_types),
+                        child_rules=list(rule.child_rules),
+                        parent_rules=list(rule.parent_rules),
+                    )
+                )
+            )
+
+    return {"modules": _module_digests(directory), "rules": rules}
+
+
+class RuleManifest:
+    """
+    The rules in a directory that can be described before they are
+    imported. Each rule module is imported once, the first time one of
+    its rules is created.
+
+    Attributes:
+        directory (str): The rules directory.
+        rules (dict[str, RuleMetadata]): The metadata of each rule by ID.
+    """
+
+    def __init__(self, directory: str, rules: dict[str, RuleMetadata]) -> None:
+        self.directory = directory
+        self.rules = rules
+        self._modules: dict[str, ModuleType | None] = {}
+
+    @classmethod
+    def load(cls, directory: str) -> RuleManifest | None:
+        """
+        Load the manifest for a rules directory.
+
+        Args:
+            directory (str): The rules directory.
+
+        Returns:
+            RuleManifest | None: The manifest or None when there is no
+                manifest for the directory or a rule file has changed
+                since it was generated.
+        """
+        try:
+            if not os.path.samefile(directory, RULES_DIR):
+                return None
+            manifest = cfnlint.helpers.load_resource(
+                cfnlint.data.Rules, MANIFEST_FILENAME
+            )
+            if manifest["modules"] != _module_digests(directory):
+                LOGGER.debug("Rule manifest is out of date, importing every rule")
+                return None
+            rules = [RuleMetadata(**rule) for rule in manifest["rules"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            LOGGER.debug("Unable to load the rule manifest: %s", e)
+            return None
+
+        return cls(directory, {rule.id: rule for rule in rules})
+
+    def create(self, rule_id: str) -> CloudFormationLintRule:
+        """
+        Import the module of a rule and create the rule.
+
+        Args:
+            rule_id (str): The ID of the rule.
+
+        Returns:
+            CloudFormationLintRule: The rule.
+        """
+        metadata = self.rules[rule_id]
+        if metadata.module not in self._modules:
+            self._modules[metadata.module] = _import(self.directory, metadata.module)
+        rule: CloudFormationLintRule = getattr(
+            self._modules[metadata.module], metadata.classname
+        )()
+        return rule
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from fnmatch import fnmatchcase
 from typing import Any, Iterator, Tuple
 
 import cfnlint.helpers
@@ -116,7 +117,9 @@ class RuleMatch:
             bool: True if the path and message of the two rule matches
             are equal, False otherwise.
         """
-        return (self.path, self.message) == (item.path, item.message)
+        if not isinstance(item, RuleMatch):
+            return NotImplemented
+        return (tuple(self.path), self.message) == (tuple(item.path), item.message)
 
     def __hash__(self):
         """
@@ -126,7 +129,7 @@ class RuleMatch:
         Returns:
             int: The hash value of the RuleMatch instance.
         """
-        return hash((self.path, self.message))
+        return hash((tuple(self.path), self.message))
 
 
 def _rule_match_to_match(
@@ -174,6 +177,23 @@ def _rule_match_to_match(
         )
 
 
+def resource_type_matches(resource_types: list[str], resource_type: str) -> bool:
+    """
+    Check if a resource type is one of the resource types a rule is
+    interested in. Types with a `*` are matched as wildcards.
+
+    Args:
+        resource_types (list[str]): The resource types of the rule.
+        resource_type (str): The resource type to check.
+
+    Returns:
+        bool: True if the resource type matches one of the resource types.
+    """
+    if resource_type in resource_types:
+        return True
+    return any("*" in t and fnmatchcase(resource_type, t) for t in resource_types)
+
+
 def matching(match_type: Any):
     """Does Logging for match functions"""
 
@@ -183,7 +203,7 @@ def matching(match_type: Any):
         def wrapper(self, filename: str, cfn: Template, *args, **kwargs):
             """Wrapper"""
             if match_type == "match_resource_properties":
-                if args[1] not in self.resource_property_types:
+                if not resource_type_matches(self.resource_property_types, args[1]):
                     return
 
             start = datetime.now()
@@ -10,12 +10,28 @@ import logging
 import os
 import traceback
 from collections import UserDict
-from typing import TYPE_CHECKING, Any, Callable, Iterator, MutableSet
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSet,
+    NamedTuple,
+)
 
 import cfnlint.helpers
+import cfnlint.profiler
 import cfnlint.rules.custom
 from cfnlint.exceptions import DuplicateRuleError
-from cfnlint.rules._rule import CloudFormationLintRule, Match
+from cfnlint.rules._manifest import RuleManifest, RuleMetadata
+from cfnlint.rules._rule import (
+    CloudFormationLintRule,
+    Match,
+    _rule_is_enabled,
+    resource_type_matches,
+)
 from cfnlint.rules.errors import RuleError
 from cfnlint.template import Template
 
@@ -30,20 +46,77 @@ else:
 LOGGER = logging.getLogger(__name__)
 
 
+class ResourceDispatchInfo(NamedTuple):
+    """Statistics for the resource property checks of the last run"""
+
+    invoked: int
+    skipped: int
+
+
+def _is_resource_rule(rule: CloudFormationLintRule, resource_type: str) -> bool:
+    # rules that replace matchall_resource_properties decide for
+    # themselves which resources they check
+    if (
+        type(rule).matchall_resource_properties
+        is not CloudFormationLintRule.matchall_resource_properties
+    ):
+        return True
+    return resource_type_matches(rule.resource_property_types, resource_type)
+
+
+def _closure(rule_ids: Iterable[str], edges: Mapping[str, Iterable[str]]) -> set[str]:
+    """The rules and every rule reachable from them through the edges"""
+    result: set[str] = set()
+    pending = list(rule_ids)
+    while pending:
+        rule_id = pending.pop()
+        if rule_id not in result:
+            result.add(rule_id)
+            pending.extend(edges.get(rule_id, ()))
+    return result
+
+
 class Rules(TypedRules):
+    """
+    The rules by their IDs.
+
+    Rules from a manifest are only imported when they are looked up or
+    needed for a run. Until then their metadata stands in for them when
+    listing rules and deciding which rules are enabled.
+    """
+
     def __init__(
         self, rules: dict[str, CloudFormationLintRule] | None = None, /, **kwargs
     ):
         super().__init__()
         self.data: dict[str, CloudFormationLintRule] = {}
+        # the manifest of each rule that hasn't been imported yet
+        self._manifests: dict[str, RuleManifest] = {}
         self._used_rules: dict[str, CloudFormationLintRule] = {}
+        self._resource_dispatch = ResourceDispatchInfo(0, 0)
         if rules is not None:
             self.update(rules)
         if kwargs:
             self.update(kwargs)
 
     def __repr__(self):
-        return "\n".join([self.data[id].verbose() for id in sorted(self.data)])
+        return "\n".join([self._metadata(id).verbose() for id in sorted(self)])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data or key in self._manifests
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.data
+        yield from list(self._manifests)
+
+    def __len__(self) -> int:
+        return len(self.data) + len(self._manifests)
+
+    def __missing__(self, key: str) -> CloudFormationLintRule:
+        if key not in self._manifests:
+            raise KeyError(key)
+        self._load([key])
+        return self.data[key]
 
     def __delitem__(self, i: str) -> None:
         raise RuntimeError("Deletion is not allowed")
@@ -51,10 +124,53 @@ class Rules(TypedRules):
     def __setitem__(self, key: str, item: CloudFormationLintRule) -> None:
         if not key:
             return
-        if key in self.data:
+        if key in self:
             raise DuplicateRuleError(rule_id=key)
         return super().__setitem__(key, item)
 
+    def update(self, other: Any = (), /, **kwargs: CloudFormationLintRule) -> None:
+        if isinstance(other, Rules):
+            # keep the rules that haven't been imported yet that way
+            for rule_id, manifest in other._manifests.items():
+                if rule_id in self:
+                    raise DuplicateRuleError(rule_id=rule_id)
+                self._manifests[rule_id] = manifest
+            other = other.data
+        super().update(other, **kwargs)
+
+    def _metadata(self, rule_id: str) -> CloudFormationLintRule | RuleMetadata:
+        """The rule or its metadata when it hasn't been imported yet"""
+        if rule_id in self.data:
+            return self.data[rule_id]
+        return self._manifests[rule_id].rules[rule_id]
+
+    def _load(self, rule_ids: Iterable[str]) -> None:
+        for rule_id in rule_ids:
+            self.data[rule_id] = self._manifests.pop(rule_id).create(rule_id)
+
+    def _needed(self, config: ConfigMixIn) -> list[str]:
+        """
+        The rules that haven't been imported yet that a run needs. Like
+        `RulesCollection` these are the enabled rules and the rules with
+        child rules. Every child rule of a needed rule is needed as well,
+        whether it is enabled or not, as a parent invokes its children and
+        they can report matches for other enabled rules.
+        """
+        children: dict[str, list[str]] = {}
+        for rule_id in self:
+            metadata = self._metadata(rule_id)
+            children.setdefault(rule_id, []).extend(metadata.child_rules)
+            for parent_id in metadata.parent_rules:
+                children.setdefault(parent_id, []).append(rule_id)
+
+        roots = (
+            rule_id
+            for rule_id in self
+            if children[rule_id] or self.is_rule_enabled(rule_id, config)
+        )
+        needed = _closure(roots, children)
+        return [rule_id for rule_id in self._manifests if rule_id in needed]
+
     def register(self, rule: CloudFormationLintRule) -> None:
         self[rule.id] = rule
 
@@ -69,9 +185,19 @@ class Rules(TypedRules):
         self, rule: str | CloudFormationLintRule, config: ConfigMixIn
     ) -> bool:
         if isinstance(rule, str):
-            if rule not in self.data:
+            if rule not in self:
                 return False
-            rule = self.data[rule]
+            metadata = self._metadata(rule)
+            if isinstance(metadata, RuleMetadata):
+                enabled: bool = _rule_is_enabled(
+                    metadata,  # type: ignore[arg-type]
+                    include_experimental=config.include_experimental,
+                    ignore_rules=config.ignore_checks,
+                    include_rules=config.include_checks,
+                    mandatory_rules=config.mandatory_checks,
+                )
+                return enabled
+            rule = metadata
         if rule.is_enabled(
             include_experimental=config.include_experimental,
             ignore_rules=config.ignore_checks,
@@ -89,6 +215,16 @@ class Rules(TypedRules):
     def used_rules(self) -> dict[str, CloudFormationLintRule]:
         return self._used_rules
 
+    def resource_dispatch_info(self) -> ResourceDispatchInfo:
+        """Report how many resource property checks the last run
+        invoked and how many were skipped because the rule isn't
+        interested in the resource type
+
+        Returns:
+            ResourceDispatchInfo: The invoked and skipped checks
+        """
+        return self._resource_dispatch
+
     # pylint: disable=inconsistent-return-statements
     def run_check(
         self, check, filename, rule_id, config, enabled_rule_ids=set(), *args
@@ -98,7 +234,7 @@ class Rules(TypedRules):
         if rule_id in enabled_rule_ids:
             self._used_rules[rule_id] = self.data[rule_id]
         try:
-            yield from iter(check(*args))
+            yield from iter(cfnlint.profiler.profile("rule", rule_id, check, *args))
         except Exception as err:  # pylint: disable=W0703
             if self.is_rule_enabled(RuleError(), config):
                 # In debug mode, print the error include complete stack trace
@@ -127,6 +263,9 @@ class Rules(TypedRules):
         self, filename: str | None, cfn: Template, config: ConfigMixIn
     ) -> Iterator[Match]:
         """Run rules"""
+        if self._manifests:
+            self._load(self._needed(config))
+
         # Build enabled rules set once to avoid repeated is_rule_enabled calls
         enabled_rule_ids = set()
         for rule_id, rule in self.data.items():
@@ -160,12 +299,27 @@ class Rules(TypedRules):
                 ),
             )
 
+        # the rules interested in each resource type in the order they
+        # are registered so each resource only runs the rules for its type
+        resource_rules: dict[str, list[tuple[str, CloudFormationLintRule]]] = {}
+        invoked = 0
+        skipped = 0
         for resource_name, resource_attributes in cfn.get_resources().items():
+            if resource_name in cfn.cached_resources:
+                continue
             resource_type = resource_attributes.get("Type")
             resource_properties = resource_attributes.get("Properties")
             if isinstance(resource_type, str) and isinstance(resource_properties, dict):
+                if resource_type not in resource_rules:
+                    resource_rules[resource_type] = [
+                        (rule_id, rule)
+                        for rule_id, rule in self.data.items()
+                        if _is_resource_rule(rule, resource_type)
+                    ]
                 path = ["Resources", resource_name, "Properties"]
-                for rule_id, rule in self.data.items():
+                invoked += len(resource_rules[resource_type])
+                skipped += len(self.data) - len(resource_rules[resource_type])
+                for rule_id, rule in resource_rules[resource_type]:
                     yield from self._filter_matches(
                         enabled_rule_ids,
                         self.run_check(
@@ -182,6 +336,14 @@ class Rules(TypedRules):
                         ),
                     )
 
+        self._resource_dispatch = ResourceDispatchInfo(invoked, skipped)
+        LOGGER.debug(
+            "Ran %s resource property checks and skipped %s for %s resource types",
+            invoked,
+            skipped,
+            len(resource_rules),
+        )
+
     @classmethod
     def _from_list(cls, items: list[CloudFormationLintRule]) -> Rules:
         rules = Rules()
@@ -199,6 +361,11 @@ class Rules(TypedRules):
     @classmethod
     def create_from_directory(cls, rulesdir: str) -> Rules:
         if rulesdir != "":
+            manifest = RuleManifest.load(os.path.expanduser(rulesdir))
+            if manifest is not None:
+                rules = cls({})
+                rules._manifests = dict.fromkeys(manifest.rules, manifest)
+                return rules
             return cls._from_list(
                 cfnlint.helpers.load_plugins(os.path.expanduser(rulesdir))
             )
@@ -5,8 +5,10 @@ SPDX-License-Identifier: MIT-0
 
 from cfnlint.rules.helpers.get_resource_by_name import get_resource_by_name
 from cfnlint.rules.helpers.get_value_from_path import get_value_from_path
+from cfnlint.rules.helpers.policies import get_policy_services
 
 __all__ = [
     "get_value_from_path",
     "get_resource_by_name",
+    "get_policy_services",
 ]
@@ -0,0 +1,155 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Iterator
+
+from cfnlint.data import AdditionalSpecs
+
+LOGGER = logging.getLogger(__name__)
+
+POLICIES_FILENAME = "Policies.json"
+STORE_FILENAME = "Policies.bin"
+
+# magic bytes and the length of the JSON index that follows
+_HEADER = struct.Struct("<8sI")
+_MAGIC = b"CFNLPOL1"
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def compile_policy_store(
+    services: dict[str, Any], store_path: str, source_path: str
+) -> None:
+    """Compile the IAM services into a single indexed file
+
+    Each service is stored as compact JSON so that it can be loaded on
+    its own without reading or parsing any of the other services. Keys
+    are sorted the same way as in `Policies.json`. The digest of the
+    source file is kept so a store that wasn't rebuilt isn't used.
+
+    Args:
+        services (dict[str, Any]): the actions and resources of each service
+        store_path (str): the file to write the store to
+        source_path (str): the `Policies.json` file the services came from
+    Returns:
+        None: Returns when the store has been written
+    """
+    index: dict[str, list[int]] = {}
+    blobs: list[bytes] = []
+    offset = 0
+    for name, service in sorted(services.items()):
+        blob = json.dumps(service, separators=(",", ":"), sort_keys=True).encode(
+            "utf-8"
+        )
+        index[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps(
+        {"source": _file_digest(source_path), "services": index},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    tmp_path = f"{store_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, store_path)
+
+
+class PolicyStore(Mapping):
+    """Lazy read-only mapping of IAM service names to their actions and
+    resources
+
+    The store is memory mapped the first time a service is looked up
+    and each service is only parsed when it is asked for so processes
+    share the pages of the file. If the store is missing, corrupt or
+    was compiled from a different `Policies.json` all of the services
+    are loaded from the JSON file instead.
+    """
+
+    def __init__(self, path: str, source_path: str) -> None:
+        self._path = path
+        self._source_path = source_path
+        self._mmap: mmap.mmap | None = None
+        self._index: dict[str, list[int]] | None = None
+        self._data_offset = 0
+        self._services: dict[str, Any] = {}
+
+    def _load_index(self) -> dict[str, list[int]]:
+        if self._index is not None:
+            return self._index
+
+        try:
+            with open(self._path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, header_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"Unknown policy store format in {self._path}")
+            header = json.loads(self._mmap[_HEADER.size : _HEADER.size + header_length])
+            if header["source"] != _file_digest(self._source_path):
+                raise ValueError(f"{self._path} is out of date")
+            self._index = header["services"]
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            LOGGER.debug("Not using policy store: %s", e)
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            with open(self._source_path, encoding="utf-8") as f:
+                self._services = json.load(f)
+            self._index = dict.fromkeys(self._services, [0, 0])
+            return self._index
+
+        self._data_offset = _HEADER.size + header_length
+        return self._index
+
+    def __getitem__(self, service: str) -> dict[str, Any]:
+        index = self._load_index()
+        if service not in self._services:
+            start, length = index[service]
+            start += self._data_offset
+            self._services[service] = json.loads(
+                self._mmap[start : start + length]  # type: ignore[index]
+            )
+        result: dict[str, Any] = self._services[service]
+        return result
+
+    def __contains__(self, service: object) -> bool:
+        return service in self._load_index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load_index())
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+
+@lru_cache(maxsize=None)
+def get_policy_services() -> Mapping[str, dict[str, Any]]:
+    """The actions and resources of each IAM service
+
+    Returns:
+        Mapping[str, dict[str, Any]]: The services shared by every rule
+            in the process
+    """
+    directory = os.path.dirname(AdditionalSpecs.__file__)
+    return PolicyStore(
+        os.path.join(directory, STORE_FILENAME),
+        os.path.join(directory, POLICIES_FILENAME),
+    )
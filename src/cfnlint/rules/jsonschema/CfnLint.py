@@ -3,8 +3,12 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: MIT-0
 """
 
+from __future__ import annotations
+
+import cfnlint.profiler
 from cfnlint.jsonschema._utils import Unset
 from cfnlint.rules import CloudFormationLintRule
+from cfnlint.template import Template
 
 
 class CfnLint(CloudFormationLintRule):
@@ -13,15 +17,25 @@ class CfnLint(CloudFormationLintRule):
     description = "Use supplemental logic to validate properties against"
     tags = []
 
-    # pylint: disable=unused-argument
-    def cfnLint(self, validator, keywords, instance, schema):
-        validator = validator.evolve(
-            function_filter=validator.function_filter.evolve(
-                add_cfn_lint_keyword=False,
-            )
-        )
+    def __init__(self) -> None:
+        super().__init__()
+        # The child rules for each of their keywords. Child rules are
+        # wired up after the rules are initialized so this is built the
+        # first time it is needed in a run.
+        self._keyword_rules: dict[str, list[CloudFormationLintRule]] | None = None
+
+    @CloudFormationLintRule.child_rules.setter  # type: ignore[attr-defined]
+    def child_rules(self, rules: dict[str, CloudFormationLintRule | None]):
+        self._child_rules = rules
+        self._keyword_rules = None
+
+    def initialize(self, cfn: Template):
+        super().initialize(cfn)
+        self._keyword_rules = None
 
-        for keyword in keywords:
+    def _rules_for_keyword(self) -> dict[str, list[CloudFormationLintRule]]:
+        if self._keyword_rules is None:
+            self._keyword_rules = {}
             for rule in self.child_rules.values():
                 if rule is None:
                     continue
@@ -29,9 +43,37 @@ class CfnLint(CloudFormationLintRule):
                     continue
 
                 for rule_keyword in rule.keywords:
-                    if rule_keyword == keyword:
-                        for err in rule.validate(validator, keyword, instance, schema):
-                            if err.rule is None:
-                                if isinstance(err.validator, Unset):
-                                    err.rule = rule
-                            yield err
+                    self._keyword_rules.setdefault(rule_keyword, []).append(rule)
+        return self._keyword_rules
+
+    # pylint: disable=unused-argument
+    def cfnLint(self, validator, keywords, instance, schema):
+        keyword_rules = self._rules_for_keyword()
+        rules = [
+            (keyword, rule)
+            for keyword in keywords
+            for rule in keyword_rules.get(keyword, [])
+        ]
+        if not rules:
+            return
+
+        validator = validator.evolve(
+            function_filter=validator.function_filter.evolve(
+                add_cfn_lint_keyword=False,
+            )
+        )
+
+        for keyword, rule in rules:
+            for err in cfnlint.profiler.profile(
+                "rule",
+                rule.id,
+                rule.validate,
+                validator,
+                keyword,
+                instance,
+                schema,
+            ):
+                if err.rule is None:
+                    if isinstance(err.validator, Unset):
+                        err.rule = rule
+                yield err
@@ -76,6 +76,11 @@ class Configuration(CfnLintJsonSchema):
             )
         )
 
+        # resources with matches reused from an earlier run aren't checked
+        cached_resources = validator.cfn.cached_resources
+        if cached_resources and isinstance(instance, dict):
+            instance = {k: v for k, v in instance.items() if k not in cached_resources}
+
         yield from patternProperties(validator, aP, instance, schema)
 
     def _is_serverless_additional_property(self, err: Any) -> bool:
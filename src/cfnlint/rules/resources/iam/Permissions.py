@@ -9,9 +9,9 @@ from typing import Any
 
 import regex as re
 
-from cfnlint.data import AdditionalSpecs
-from cfnlint.helpers import ensure_list, load_resource
+from cfnlint.helpers import ensure_list
 from cfnlint.jsonschema import ValidationError, ValidationResult, Validator
+from cfnlint.rules.helpers import get_policy_services
 from cfnlint.rules.jsonschema.CfnLintKeyword import CfnLintKeyword
 
 
@@ -29,12 +29,45 @@ class Permissions(CfnLintKeyword):
         super().__init__(
             ["AWS::IAM::Policy/Properties/PolicyDocument/Statement/Action"]
         )
-        self._service_map = load_resource(AdditionalSpecs, "Policies.json")
+        self._service_map = get_policy_services()
         self._resource_action_limitations = {
             "AWS::S3::BucketPolicy": ["s3"],
             "AWS::SQS::QueuePolicy": ["sqs"],
             "AWS::SNS::TopicPolicy": ["sns"],
         }
+        # The actions of each service and if a wildcard permission
+        # matches any of them. The index for a service is built the
+        # first time it is used and kept for the rest of the run.
+        self._action_index: dict[
+            str, tuple[dict[str, Any], frozenset[str], dict[str, bool]]
+        ] = {}
+
+    def _actions(
+        self, service: str
+    ) -> tuple[dict[str, Any], frozenset[str], dict[str, bool]]:
+        actions = self._service_map[service].get("Actions", {})
+        cached = self._action_index.get(service)
+        if cached is None or cached[0] is not actions:
+            cached = (actions, frozenset(actions), {})
+            self._action_index[service] = cached
+        return cached
+
+    def _is_action(self, service: str, permission: str) -> bool:
+        actions, names, wildcards = self._actions(service)
+        if not any(x in permission for x in ["*", "?"]):
+            return permission in names
+
+        if permission not in wildcards:
+            permission_regex = re.compile(
+                "".join(
+                    ".*" if c == "*" else "." if c == "?" else re.escape(c)
+                    for c in permission
+                )
+            )
+            wildcards[permission] = any(
+                permission_regex.fullmatch(action) for action in actions
+            )
+        return wildcards[permission]
 
     def validate(
         self, validator: Validator, _, instance: Any, schema: dict[str, Any]
@@ -80,20 +113,8 @@ class Permissions(CfnLintKeyword):
                         )
 
             if service in self._service_map:
-                enums = list(self._service_map[service].get("Actions", []).keys())
-                if permission == "*":
-                    pass
-
-                if any(x in permission for x in ["*", "?"]):
-                    permission_regex = (
-                        f"^{permission.replace('*', '.*').replace('?', '.')}$"
-                    )
-                    if not any(re.match(permission_regex, action) for action in enums):
-                        yield ValidationError(
-                            f"{permission!r} is not one of {enums!r}",
-                            rule=self,
-                        )
-                elif permission not in enums:
+                if not self._is_action(service, permission):
+                    enums = list(self._service_map[service].get("Actions", {}).keys())
                     yield ValidationError(
                         f"{permission!r} is not one of {enums!r}",
                         rule=self,
@@ -11,10 +11,9 @@ from typing import Any
 
 import regex as re
 
-from cfnlint.data import AdditionalSpecs
-from cfnlint.helpers import REGEX_DYN_REF, ensure_list, is_function, load_resource
+from cfnlint.helpers import REGEX_DYN_REF, ensure_list, is_function
 from cfnlint.jsonschema import ValidationError, ValidationResult, Validator
-from cfnlint.rules.helpers import get_value_from_path
+from cfnlint.rules.helpers import get_policy_services, get_value_from_path
 from cfnlint.rules.jsonschema.CfnLintKeyword import CfnLintKeyword
 
 LOGGER = logging.getLogger(__name__)
@@ -90,7 +89,7 @@ class StatementResources(CfnLintKeyword):
         super().__init__(
             ["AWS::IAM::Policy/Properties/PolicyDocument/Statement"],
         )
-        self.service_map = load_resource(AdditionalSpecs, "Policies.json")
+        self.service_map = get_policy_services()
 
     def validate(
         self, validator: Validator, keywords: Any, instance: Any, schema: dict[str, Any]
@@ -17,6 +17,13 @@ from cfnlint.rules.helpers import get_value_from_path
 from cfnlint.rules.jsonschema.CfnLintJsonSchema import CfnLintJsonSchema, SchemaDetails
 from cfnlint.schema.resolver import RefResolver
 
+# The number of parsed definition strings to keep before starting over
+_MAX_DEFINITIONS = 256
+
+# Parsed definition strings keyed by their content. Definitions that
+# aren't valid JSON are kept as None.
+_definitions: dict[str, Any] = {}
+
 
 class StateMachineDefinition(CfnLintJsonSchema):
     id = "E3601"
@@ -46,6 +53,10 @@ class StateMachineDefinition(CfnLintJsonSchema):
         }
 
         self.resolver = RefResolver.from_schema(self.schema, store=self.store)
+        # the JSONata schema and its resolver are built the first time a
+        # JSONata definition is validated
+        self._jsonata_schema: dict[str, Any] | None = None
+        self._jsonata_resolver: RefResolver | None = None
 
     def _fix_message(self, err: ValidationError) -> ValidationError:
         if len(err.path) > 1:
@@ -104,6 +115,14 @@ class StateMachineDefinition(CfnLintJsonSchema):
             }
         return schema
 
+    def _resolver(self, schema: dict[str, Any]) -> RefResolver:
+        if schema is self.schema:
+            resolver: RefResolver = self.resolver
+            return resolver
+        if self._jsonata_resolver is None:
+            self._jsonata_resolver = RefResolver.from_schema(schema, store=self.store)
+        return self._jsonata_resolver
+
     def _clean_schema(self, validator: Validator, instance: Any):
         for ql, ql_validator in get_value_from_path(
             validator, instance, deque(["QueryLanguage"])
@@ -112,18 +131,53 @@ class StateMachineDefinition(CfnLintJsonSchema):
                 yield self.schema, ql_validator
 
             if ql == "JSONata":
-                yield self._convert_schema_to_jsonata(), ql_validator
+                if self._jsonata_schema is None:
+                    self._jsonata_schema = self._convert_schema_to_jsonata()
+                yield self._jsonata_schema, ql_validator
+
+    def _load_definition(self, value: str) -> Any:
+        if value in _definitions:
+            return _definitions[value]
+
+        try:
+            definition = json.loads(value)
+        except json.JSONDecodeError:
+            definition = None
+        if len(_definitions) >= _MAX_DEFINITIONS:
+            _definitions.clear()
+        _definitions[value] = definition
+        return definition
 
-    def _validate_start_at(
+    def _transitions(self, state: dict[str, Any]) -> list[tuple[Any, list[Any]]]:
+        """The states a state can go to and the path to each of them"""
+        transitions: list[tuple[Any, list[Any]]] = []
+        for key in ["Next", "Default"]:
+            if key in state:
+                transitions.append((state[key], [key]))
+        for key in ["Choices", "Catch"]:
+            items = state.get(key)
+            if not isinstance(items, list):
+                continue
+            for i, item in enumerate(items):
+                if isinstance(item, dict) and "Next" in item:
+                    transitions.append((item["Next"], [key, i, "Next"]))
+        return transitions
+
+    def _validate_transitions(
         self,
         definition: Any,
         k: str,
-        add_path_to_message: bool,
+        substitutions: Any,
         path: deque | None = None,
     ) -> ValidationResult:
         """
-        Per the Amazon States Language specification, 'StartAt must' reference
-        a valid state name that exists in the States object.
+        Per the Amazon States Language specification, 'StartAt' and the
+        'Next' and 'Default' of every state must reference a valid state
+        name that exists in the same States object.
+
+        The transitions of each States object are collected into one map
+        and the states of Parallel branches and Map processors are
+        checked the same way.
 
         Reference: https://states-language.net/spec.html#toplevelfields
         """
@@ -135,54 +189,58 @@ class StateMachineDefinition(CfnLintJsonSchema):
         if not isinstance(start_at, str) or not isinstance(states, dict):
             return  # Early return to avoid further checks
 
-        # Check if StartAt state exists in States object
-        if start_at not in states:
-            if path is None:  # Top level StartAt
-                error_path = deque([k, "StartAt"])
-                display_path = "/StartAt"
-            else:  # Nested StartAt like Parallel or Map
-                error_path = deque([k] + list(path) + ["StartAt"])
-                display_path = f"/{'/'.join(str(item) for item in path)}/StartAt"
-
-            message = f"Missing 'Next' target '{start_at}' at {display_path}"
-
-            yield ValidationError(message, path=error_path, rule=self)
-
-        # Validate nested StartAt in Parallel and Map states
-        base_path = deque() if path is None else deque(path)
+        base_path = [] if path is None else list(path)
+        adjacency: dict[str, list[tuple[Any, list[Any]]]] = {
+            "": [(start_at, ["StartAt"])]
+        }
+        scopes: list[tuple[Any, list[Any]]] = []
         for state_name, state in states.items():
             if not isinstance(state, dict):
                 continue
-            state_type = state.get("Type")
+            state_path = ["States", state_name]
+            adjacency[state_name] = [
+                (target, state_path + target_path)
+                for target, target_path in self._transitions(state)
+            ]
 
+            state_type = state.get("Type")
             if state_type == "Parallel":
                 branches = state.get("Branches", [])
-                if not isinstance(branches, list):
-                    continue
-                for idx, branch in enumerate(branches):
-                    branch_path = deque(base_path)
-                    branch_path.extend(["States", state_name, "Branches", idx])
-                    yield from self._validate_start_at(
-                        branch, k, add_path_to_message, branch_path
-                    )
+                if isinstance(branches, list):
+                    for idx, branch in enumerate(branches):
+                        scopes.append((branch, state_path + ["Branches", idx]))
 
             if state_type == "Map":
-                # ItemProcessor (distributed/inline mode)
-                processor = state.get("ItemProcessor")
-                if isinstance(processor, dict):
-                    processor_path = deque(base_path)
-                    processor_path.extend(["States", state_name, "ItemProcessor"])
-                    yield from self._validate_start_at(
-                        processor, k, add_path_to_message, processor_path
-                    )
+                # ItemProcessor (distributed/inline mode) and
                 # Iterator (classic map)
-                iterator = state.get("Iterator")
-                if isinstance(iterator, dict):
-                    iterator_path = deque(base_path)
-                    iterator_path.extend(["States", state_name, "Iterator"])
-                    yield from self._validate_start_at(
-                        iterator, k, add_path_to_message, iterator_path
-                    )
+                for key in ["ItemProcessor", "Iterator"]:
+                    if isinstance(state.get(key), dict):
+                        scopes.append((state[key], state_path + [key]))
+
+        for transitions in adjacency.values():
+            for target, target_path in transitions:
+                # targets can be replaced with DefinitionSubstitutions
+                if not isinstance(target, str):
+                    continue
+                if target.replace("${", "").replace("}", "").strip() in substitutions:
+                    continue
+                if target in states:
+                    continue
+                error_path = base_path + target_path
+                yield ValidationError(
+                    (
+                        f"Missing 'Next' target '{target}' at "
+                        f"/{'/'.join(str(item) for item in error_path)}"
+                    ),
+                    path=deque([k] + error_path),
+                    rule=self,
+                )
+
+        for scope, scope_path in scopes:
+            if isinstance(scope, dict):
+                yield from self._validate_transitions(
+                    scope, k, substitutions, deque(base_path + scope_path)
+                )
 
     def _validate_step(
         self,
@@ -215,9 +273,6 @@ class StateMachineDefinition(CfnLintJsonSchema):
 
             yield self._clean_error(err)
 
-        # Validate StartAt exists
-        yield from self._validate_start_at(value, k, add_path_to_message)
-
     def validate(
         self, validator: Validator, keywords: Any, instance: Any, schema: dict[str, Any]
     ) -> ValidationResult:
@@ -242,33 +297,32 @@ class StateMachineDefinition(CfnLintJsonSchema):
 
             add_path_to_message = False
             if validator.is_type(value, "string"):
-                try:
-                    value = json.loads(value)
-                    add_path_to_message = True
-                    for schema, schema_validator in self._clean_schema(
-                        validator, value
-                    ):
-                        resolver = RefResolver.from_schema(schema, store=self.store)
-                        step_validator = schema_validator.evolve(
-                            context=validator.context.evolve(
-                                functions=[],
-                            ),
-                            resolver=resolver,
-                            schema=self.schema,
-                        )
-
-                        yield from self._validate_step(
-                            step_validator, substitutions, value, add_path_to_message, k
-                        )
-                except json.JSONDecodeError:
+                value = self._load_definition(value)
+                if value is None:
                     return
+                add_path_to_message = True
+                for schema, schema_validator in self._clean_schema(validator, value):
+                    step_validator = schema_validator.evolve(
+                        context=validator.context.evolve(
+                            functions=[],
+                        ),
+                        resolver=self._resolver(schema),
+                        schema=self.schema,
+                    )
+
+                    yield from self._validate_step(
+                        step_validator, substitutions, value, add_path_to_message, k
+                    )
             else:
                 for schema, schema_validator in self._clean_schema(validator, value):
-                    resolver = RefResolver.from_schema(schema, store=self.store)
                     step_validator = schema_validator.evolve(
-                        resolver=resolver,
+                        resolver=self._resolver(schema),
                         schema=schema,
                     )
                     yield from self._validate_step(
                         step_validator, substitutions, value, add_path_to_message, k
                     )
+
+            # Validate StartAt and Next targets exist
+            if isinstance(value, dict):
+                yield from self._validate_transitions(value, k, substitutions)
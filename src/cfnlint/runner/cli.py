@@ -12,6 +12,7 @@ from typing import Any, Iterator
 
 import cfnlint.formatters
 import cfnlint.maintenance
+import cfnlint.profiler
 from cfnlint.config import ConfigMixIn, configure_logging
 from cfnlint.exceptions import (
     CfnLintExitException,
@@ -154,10 +155,16 @@ class Runner:
         """
         yield from run_template_by_data(template, self.config, self.rules)
 
-    def _cli_output(self, matches: list[Match]) -> None:
+    def _format_output(self, matches: list[Match]) -> str | None:
         formatter = get_formatter(self.config)
         matches.sort(key=lambda x: (x.filename, x.linenumber, x.rule.id))
-        output = formatter.print_matches(matches, self.rules, config=self.config)
+        output: str | None = formatter.print_matches(
+            matches, self.rules, config=self.config
+        )
+        return output
+
+    def _cli_output(self, matches: list[Match]) -> None:
+        output = self._format_output(matches)
         if output:
             if self.config.output_file:
                 with open(self.config.output_file, "w") as output_file:
@@ -170,6 +177,11 @@ class Runner:
     def _exit(self, matches: list[Match]) -> int:
         """Determine exit code"""
 
+        sys.exit(self._exit_code(matches))
+
+    def _exit_code(self, matches: list[Match]) -> int:
+        """Determine exit code based on the severity of the matches"""
+
         exit_level: str = self.config.non_zero_exit_code or "informational"
 
         exit_levels: dict[str, list[str]] = {
@@ -197,7 +209,7 @@ class Runner:
             ):
                 exit_code = exit_code | 2
 
-        sys.exit(exit_code)
+        return exit_code
 
     def run(self) -> Iterator[Match]:
         """
@@ -286,6 +298,7 @@ class Runner:
         if self.config.update_documentation:
             # Get ALL rules (ignore the CLI settings))
             cfnlint.maintenance.update_documentation(self.rules)
+            cfnlint.maintenance.update_rule_manifest()
             sys.exit(0)
 
         if self.config.listrules:
@@ -328,11 +341,19 @@ class Runner:
                 self.config.parser.print_help()
                 sys.exit(1)
 
+        profiler = cfnlint.profiler.enable() if self.config.profile else None
         try:
             self._cli_output(list(self.run()))
         except CfnLintExitException as e:
             LOGGER.error(str(e))
             sys.exit(e.exit_code)
+        finally:
+            if profiler is not None:
+                cfnlint.profiler.disable()
+                print(
+                    profiler.format(self.config.profile, self.config.profile_aggregate),
+                    file=sys.stderr,
+                )
 
 
 def main() -> None:
@@ -351,6 +372,21 @@ def main() -> None:
     except Exception as e:
         print(e)
         sys.exit(1)
+
+    if config.serve or config.server:
+        # pylint: disable=import-outside-toplevel
+        from cfnlint.runner.server import run_client, serve
+
+        configure_logging(config.debug, config.info)
+        if config.serve:
+            try:
+                serve(config)
+            except CfnLintExitException as e:
+                LOGGER.error(str(e))
+                sys.exit(e.exit_code)
+            sys.exit(0)
+        run_client(config, sys.argv[1:])
+
     runner = Runner(config)
     runner.cli()
 
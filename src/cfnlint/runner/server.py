@@ -0,0 +1,265 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import sys
+from typing import Any
+
+from cfnlint.config import ConfigMixIn
+from cfnlint.decode.decode import decode_str
+from cfnlint.exceptions import CfnLintExitException, ServerUnavailableException
+from cfnlint.rules import Match
+from cfnlint.rules.errors import ConfigError
+from cfnlint.runner.cli import Runner
+from cfnlint.runner.template import run_template_by_data
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _lint_request(runner: Runner, request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Lint the templates in a single client request with a warm runner.
+
+    The request holds the client's command line arguments, working
+    directory and, when the template was piped in, the template content.
+    Rules, registry schemas and spec overrides come from the server's
+    configuration and stay loaded between requests.
+    """
+    cwd = os.getcwd()
+    try:
+        os.chdir(request.get("cwd") or cwd)
+        config = ConfigMixIn(request.get("args", []))
+        runner.config = config
+        runner.rules.used_rules.clear()
+
+        content = request.get("template")
+        matches: list[Match] = []
+        try:
+            if content is not None:
+                template, matches = decode_str(content)
+                if template is not None and not matches:
+                    matches = list(run_template_by_data(template, config, runner.rules))
+            elif not config.templates and not config.deployment_files:
+                matches = [
+                    Match("No templates or deployment files specified", ConfigError())
+                ]
+            else:
+                matches = list(runner.run())
+        except ValueError as e:
+            matches = [Match(str(e), ConfigError(), None)]
+
+        return {
+            "output": runner._format_output(matches),
+            "exit_code": runner._exit_code(matches),
+        }
+    except CfnLintExitException as e:
+        return {"error": str(e), "exit_code": e.exit_code}
+    finally:
+        os.chdir(cwd)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one request per connection as a JSON document"""
+
+    server: _LintServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.read())
+        except ValueError as e:
+            response: dict[str, Any] = {
+                "error": f"Invalid request: {str(e)}",
+                "exit_code": 1,
+            }
+        else:
+            LOGGER.info("Linting request from %s", request.get("cwd"))
+            try:
+                response = _lint_request(self.server.runner, request)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                LOGGER.exception("Failed to lint request")
+                response = {
+                    "error": f"Failed to lint request: {str(e)}",
+                    "exit_code": 1,
+                }
+
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class _LintServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server holding a warm Runner.
+
+    Requests are handled one at a time as rules and the working
+    directory are shared across requests.
+    """
+
+    def __init__(self, socket_path: str, runner: Runner) -> None:
+        self.runner = runner
+        super().__init__(socket_path, _RequestHandler)
+
+
+def _is_socket(path: str) -> bool:
+    """Check if the path exists and is a Unix socket"""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def serve(config: ConfigMixIn) -> None:
+    """
+    Run a lint server on the Unix socket from the configuration.
+
+    The server keeps the rules and provider schemas loaded so that
+    repeated lints from editors or pre-commit hooks only pay for
+    linting the template.
+
+    Args:
+        config (ConfigMixIn): The configuration with the socket path
+            and the rule settings to load.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise CfnLintExitException("--serve requires Unix socket support", 1)
+
+    socket_path = config.serve
+    if _is_socket(socket_path):
+        # left behind by a server that didn't shut down cleanly
+        os.unlink(socket_path)
+    elif os.path.lexists(socket_path):
+        raise CfnLintExitException(
+            f"Unable to serve on {socket_path}: the path exists and is not a socket",
+            1,
+        )
+    runner = Runner(config)
+
+    # only the current user can connect to the socket
+    umask = os.umask(0o077)
+    try:
+        server = _LintServer(socket_path, runner)
+    finally:
+        os.umask(umask)
+
+    LOGGER.info("Serving cfn-lint on %s", socket_path)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if _is_socket(socket_path):
+            os.unlink(socket_path)
+
+
+def lint_with_server(
+    socket_path: str, args: list[str], template: str | None = None
+) -> tuple[str | None, int]:
+    """
+    Send a lint request to a running cfn-lint server.
+
+    Args:
+        socket_path (str): The Unix socket the server is listening on.
+        args (list[str]): The command line arguments to lint with.
+        template (str | None): The template content when it isn't read
+            from a file.
+
+    Returns:
+        tuple[str | None, int]: The formatted output and the exit code.
+
+    Raises:
+        ServerUnavailableException: If the server can't be reached or
+            doesn't reply with a valid response.
+        CfnLintExitException: If the server fails to lint the request.
+    """
+    request: dict[str, Any] = {"args": args, "cwd": os.getcwd()}
+    if template is not None:
+        request["template"] = template
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError as e:
+        raise ServerUnavailableException(
+            f"Unable to connect to cfn-lint server at {socket_path}: {str(e)}", 1
+        ) from e
+
+    try:
+        response = json.loads(b"".join(chunks))
+    except ValueError as e:
+        raise ServerUnavailableException(
+            f"Invalid response from cfn-lint server at {socket_path}: {str(e)}", 1
+        ) from e
+    if not isinstance(response, dict) or "exit_code" not in response:
+        raise ServerUnavailableException(
+            f"Invalid response from cfn-lint server at {socket_path}", 1
+        )
+
+    return _result(response)
+
+
+def _result(response: dict[str, Any]) -> tuple[str | None, int]:
+    """The output and exit code of a lint response"""
+    if "error" in response:
+        raise CfnLintExitException(response["error"], response["exit_code"])
+
+    return response.get("output"), response["exit_code"]
+
+
+def run_client(config: ConfigMixIn, args: list[str]) -> None:
+    """
+    Lint using a running server and output the results like the CLI.
+
+    When the server can't be used the request is linted in this
+    process instead.
+
+    Args:
+        config (ConfigMixIn): The client configuration.
+        args (list[str]): The command line arguments to send to the server.
+    """
+    try:
+        has_templates = bool(config.templates or config.deployment_files)
+    except ValueError:
+        # the server reports templates that can't be found
+        has_templates = True
+
+    template = None
+    if not sys.stdin.isatty() and not has_templates:
+        template = sys.stdin.read()
+
+    try:
+        try:
+            output, exit_code = lint_with_server(config.server, args, template)
+        except ServerUnavailableException as e:
+            LOGGER.warning("%s. Linting without the server.", str(e))
+            request: dict[str, Any] = {"args": args, "cwd": os.getcwd()}
+            if template is not None:
+                request["template"] = template
+            output, exit_code = _result(_lint_request(Runner(config), request))
+    except CfnLintExitException as e:
+        LOGGER.error(str(e))
+        sys.exit(e.exit_code)
+
+    if output:
+        if config.output_file:
+            with open(config.output_file, "w") as output_file:
+                output_file.write(output)
+        else:
+            print(output)
+
+    sys.exit(exit_code)
@@ -0,0 +1,665 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Iterator
+
+import networkx
+
+from cfnlint.config import _DEFAULT_RULESDIR
+from cfnlint.rules import CloudFormationLintRule, Match
+from cfnlint.rules.errors import ConfigError, ParseError, RuleError, TransformError
+from cfnlint.schema import PROVIDER_SCHEMA_MANAGER
+from cfnlint.schema._lock import file_lock
+from cfnlint.version import __version__
+
+if TYPE_CHECKING:
+    from cfnlint.config import ConfigMixIn
+    from cfnlint.rules import Rules
+    from cfnlint.template import Template
+
+LOGGER = logging.getLogger(__name__)
+
+# Change when the contents of the cache files change
+_CACHE_VERSION = 2
+
+# Limits for the results of whole templates. The least recently used
+# templates are removed first when there are more.
+_RESULTS_MAX_ENTRIES = 1000
+_RESULTS_MAX_BYTES = 100 * 1024 * 1024
+
+# Seconds to wait for another process saving results before giving up
+_LOCK_TIMEOUT = 10.0
+
+# Attributes copied from a rule match that can be sent between processes
+# and kept in the cache
+_MATCH_ATTRIBUTES = ("path", "path_string")
+_MATCH_FIELDS = tuple(f.name for f in fields(Match) if f.init and f.name != "rule")
+
+
+def match_to_values(match: Match) -> tuple[str, dict[str, Any]]:
+    """
+    Flatten a match to its rule ID and plain values.
+
+    Args:
+        match (Match): The match to flatten.
+
+    Returns:
+        tuple[str, dict[str, Any]]: The rule ID and the values of the match.
+    """
+    values = {name: getattr(match, name) for name in _MATCH_FIELDS}
+    values["rulematch_obj"] = {
+        name: getattr(match, name) for name in _MATCH_ATTRIBUTES if hasattr(match, name)
+    }
+    return match.rule.id, values
+
+
+def match_from_values(rule_id: str, values: dict[str, Any], rules: Rules) -> Match:
+    """
+    Create a match from the values of `match_to_values`.
+
+    Args:
+        rule_id (str): The ID of the rule of the match.
+        values (dict[str, Any]): The values of the match.
+        rules (Rules): The rules the match is attached to.
+
+    Returns:
+        Match: The match.
+
+    Raises:
+        KeyError: When the rule isn't in the rules.
+    """
+    rule = rules[rule_id] if rule_id in rules else None
+    if rule is None:
+        # Errors can be raised with rules that are not in the collection
+        for error_rule in (ParseError(), TransformError(), RuleError(), ConfigError()):
+            if error_rule.id == rule_id:
+                rule = error_rule
+                break
+        else:
+            raise KeyError(f"Rule {rule_id} was not found")
+
+    values = dict(values)
+    rulematch_obj = values.pop("rulematch_obj")
+    # only the attributes Match copies from a RuleMatch are kept
+    rulematch: Any = SimpleNamespace(**rulematch_obj) if rulematch_obj else None
+    return Match(rule=rule, rulematch_obj=rulematch, **values)
+
+
+# Resources with a property that can point at a local template the rules
+# read, so a change to that file changes the matches of the resource
+_NESTED_TEMPLATE_PROPERTIES = {
+    "AWS::CloudFormation::Stack": "TemplateURL",
+    "AWS::Serverless::Application": "Location",
+}
+
+
+def _digest(*values: Any) -> str:
+    return hashlib.sha256(json.dumps(values, default=repr).encode("utf-8")).hexdigest()
+
+
+def _file_digest(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def _path_digest(path: str) -> Any:
+    """
+    Digest a file, every file in a directory or the files of a module.
+
+    Args:
+        path (str): The file, directory or module name.
+
+    Returns:
+        Any: The digest of the file, the digest of each file in the
+            directory by its relative path or None when it can't be read.
+    """
+    expanded = os.path.expanduser(path)
+    if os.path.isdir(expanded):
+        digests: dict[str, str | None] = {}
+        for root, dirs, files in os.walk(expanded):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digests[os.path.relpath(file_path, expanded)] = _file_digest(file_path)
+        return digests
+    if os.path.isfile(expanded):
+        return _file_digest(expanded)
+
+    # rules can be appended from a module
+    try:
+        spec = importlib.util.find_spec(path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if spec.submodule_search_locations:
+        return [_path_digest(location) for location in spec.submodule_search_locations]
+    return _file_digest(spec.origin) if spec.origin else None
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write to a temporary file first so readers never see part of it"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _strings(obj: Any) -> Iterator[str]:
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _strings(item)
+
+
+def nested_templates(base_dir: str, resource: Any) -> dict[str, str | None]:
+    """
+    Digest the local templates a nested stack resource can point at.
+
+    Args:
+        base_dir (str): The directory of the template the resource is in.
+        resource (Any): The resource.
+
+    Returns:
+        dict[str, str | None]: The digest of each local template by its
+            location or None when it can't be read.
+    """
+    if not isinstance(resource, dict):
+        return {}
+    name = _NESTED_TEMPLATE_PROPERTIES.get(resource.get("Type"))  # type: ignore
+    properties = resource.get("Properties")
+    if name is None or not isinstance(properties, dict):
+        return {}
+
+    return {
+        location: _file_digest(os.path.join(base_dir, location))
+        for location in _strings(properties.get(name))
+        if not location.startswith(("http://", "https://", "s3://"))
+    }
+
+
+def config_key(config: ConfigMixIn, rules: Rules) -> str:
+    """
+    Create a key for the settings that change the matches of a template.
+
+    Rules and schemas loaded from files are keyed by what the files
+    contain so editing them changes the key. The default rules are
+    covered by the version.
+
+    Args:
+        config (ConfigMixIn): The configuration used to lint the template.
+        rules (Rules): The rules used to lint the template.
+
+    Returns:
+        str: A digest of the version, settings and rules.
+    """
+    return _digest(
+        __version__,
+        config.regions,
+        config.ignore_checks,
+        config.include_checks,
+        config.mandatory_checks,
+        config.include_experimental,
+        config.configure_rules,
+        config.parameters,
+        [
+            (path, _path_digest(path))
+            for path in config.append_rules
+            if path != _DEFAULT_RULESDIR
+        ],
+        config.custom_rules and _path_digest(config.custom_rules),
+        config.override_spec and _path_digest(config.override_spec),
+        [(path, _path_digest(path)) for path in config.registry_schemas],
+        sorted(rules),
+    )
+
+
+def _layout(obj: Any, base: int, marks: list[tuple[int, int, int, int]]) -> None:
+    """Collect where each node is relative to the line a resource starts on"""
+    start = getattr(obj, "start_mark", None)
+    if start is not None:
+        end = obj.end_mark
+        marks.append((start.line - base, start.column, end.line - base, end.column))
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            _layout(key, base, marks)
+            _layout(value, base, marks)
+    elif isinstance(obj, list):
+        for item in obj:
+            _layout(item, base, marks)
+
+
+def _resource_name(match: Match) -> str | None:
+    path = getattr(match, "path", None)
+    if path and len(path) >= 2 and path[0] == "Resources":
+        name: str = path[1]
+        return name
+    return None
+
+
+def _checks_template(rule: CloudFormationLintRule) -> bool:
+    """If the rule looks at the whole template instead of one resource"""
+    return (
+        type(rule).match is not CloudFormationLintRule.match
+        or type(rule).matchall is not CloudFormationLintRule.matchall
+    )
+
+
+class IncrementalCache:
+    """
+    Reuse the matches of resources that haven't changed since the last run.
+
+    Each resource is keyed by its content, where its nodes are relative
+    to the line it starts on, and the content of every resource related to
+    it through `Ref`, `Fn::GetAtt`, `Fn::Sub` or `DependsOn` in either
+    direction. Nested stacks also include the local templates they point
+    at. All of the keys include the other sections of the template,
+    the type of every resource, the configuration and the rules. When a key
+    matches the last run the matches with a path in the resource are reused
+    with their line numbers moved to where the resource is now.
+
+    Only the matches of rules that check one resource at a time are
+    reused. Rules that look at the whole template, like the ones comparing
+    resources that aren't related, always run again. A resource with a
+    match from one of these rules that is also run by another rule isn't
+    reused as the matches from either can't be told apart.
+
+    Attributes:
+        reused (frozenset[str]): The resources with reused matches. The rules
+            don't need to check these resources again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filename: str,
+        lines: dict[str, int],
+        keys: dict[str, str],
+        rules: Rules,
+    ):
+        self._path = path
+        self._filename = filename
+        self._rules = rules
+        self._lines = lines
+        self._keys = keys
+        self._previous: dict[str, Any] = {}
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") == _CACHE_VERSION:
+                self._previous = cache["resources"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            LOGGER.debug("Ignoring unreadable cache file %s: %s", path, e)
+
+        self.reused = frozenset(
+            name
+            for name, key in keys.items()
+            if self._previous.get(name, {}).get("key") == key
+            and all(
+                rule_id in rules
+                for rule_id, _ in self._previous[name].get("matches", [])
+            )
+        )
+        LOGGER.info(
+            "Reusing matches for %d of %d resources", len(self.reused), len(keys)
+        )
+
+    @classmethod
+    def create(
+        cls, cache_dir: str | None, cfn: Template, config: ConfigMixIn, rules: Rules
+    ) -> IncrementalCache | None:
+        """
+        Create the cache for a template when it can be used.
+
+        Args:
+            cache_dir (str | None): The directory the cache files are in.
+            cfn (Template): The template being linted.
+            config (ConfigMixIn): The configuration used to lint the template.
+            rules (Rules): The rules used to lint the template.
+
+        Returns:
+            IncrementalCache | None: The cache or None when the template is
+                read from stdin, has transforms or can't be keyed.
+        """
+        if not cache_dir or not cfn.filename or cfn.graph is None:
+            return None
+        # transforms change the resources after they are keyed
+        if cfn.transform_pre["Transform"]:
+            return None
+        resources = cfn.template.get("Resources")
+        if not isinstance(resources, dict):
+            return None
+
+        try:
+            template_key = _digest(
+                {k: v for k, v in cfn.template.items() if k != "Resources"},
+                [
+                    (name, value.get("Type") if isinstance(value, dict) else None)
+                    for name, value in resources.items()
+                ],
+            )
+
+            base_dir = os.path.dirname(os.path.abspath(cfn.filename))
+            lines: dict[str, int] = {}
+            contents: dict[str, str] = {}
+            layouts: dict[str, str] = {}
+            for name, value in resources.items():
+                start = getattr(name, "start_mark", None)
+                lines[name] = start.line if start is not None else 0
+                marks: list[tuple[int, int, int, int]] = []
+                _layout(value, lines[name], marks)
+                contents[name] = _digest(value, nested_templates(base_dir, value))
+                layouts[name] = _digest(marks)
+        except (TypeError, ValueError) as e:
+            LOGGER.debug("Not caching %s as it can't be keyed: %s", cfn.filename, e)
+            return None
+
+        # the rules for a resource can look at the resources it is related to
+        graph = cfn.graph.graph
+        related: dict[str, str] = {}
+        for component in networkx.weakly_connected_components(
+            graph.subgraph(
+                node
+                for node, node_type in graph.nodes(data="type")
+                if node_type == "Resource"
+            )
+        ):
+            key = _digest([(name, contents.get(name)) for name in sorted(component)])
+            for name in component:
+                related[name] = key
+
+        keys = {
+            name: _digest(
+                template_key, contents[name], layouts[name], related.get(name)
+            )
+            for name in resources
+        }
+        path = os.path.join(
+            cache_dir,
+            "incremental",
+            _digest(os.path.abspath(cfn.filename), config_key(config, rules)) + ".json",
+        )
+        return cls(path, cfn.filename, lines, keys, rules)
+
+    def run(self, matches: Iterator[Match]) -> Iterator[Match]:
+        """
+        Replace the matches of reused resources with the ones from the last
+        run and save the matches of every resource for the next run.
+
+        Args:
+            matches (Iterator[Match]): The matches from running the rules.
+
+        Yields:
+            Match: The matches for the template.
+        """
+        results: dict[str, list[list[Any]]] = {name: [] for name in self._keys}
+        template_matches: dict[str, set[str]] = {name: set() for name in self._keys}
+        for match in matches:
+            name = _resource_name(match)
+            if name in results and _checks_template(match.rule):
+                template_matches[name].add(match.rule.id)
+            elif name in self.reused:
+                continue
+            elif name in results:
+                results[name].append(self._flatten(match, self._lines[name]))
+            yield match
+
+        for name in self.reused:
+            results[name] = self._previous[name]["matches"]
+            for rule_id, values in results[name]:
+                yield self._restore(rule_id, values, self._lines[name])
+
+        # rules run by other rules that look at the whole template too
+        shared_rules: set[str] = set()
+        for rule in self._rules.data.values():
+            if rule.child_rules or rule.parent_rules:
+                shared_rules.update([rule.id, *rule.child_rules, *rule.parent_rules])
+        self._save(
+            {
+                name: {"key": self._keys[name], "matches": results[name]}
+                for name in self._keys
+                if not template_matches[name] & shared_rules
+            }
+        )
+
+    @staticmethod
+    def _flatten(match: Match, line: int) -> list[Any]:
+        rule_id, values = match_to_values(match)
+        # line numbers are kept relative to the start of the resource
+        values["linenumber"] -= line
+        values["linenumberend"] -= line
+        if "path" in values["rulematch_obj"]:
+            values["rulematch_obj"]["path"] = list(values["rulematch_obj"]["path"])
+        return [rule_id, values]
+
+    def _restore(self, rule_id: str, values: dict[str, Any], line: int) -> Match:
+        values = dict(values)
+        values["filename"] = self._filename
+        values["linenumber"] += line
+        values["linenumberend"] += line
+        return match_from_values(rule_id, values, self._rules)
+
+    def _save(self, resources: dict[str, Any]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            _write_json(self._path, {"version": _CACHE_VERSION, "resources": resources})
+        except (OSError, TypeError, ValueError) as e:
+            LOGGER.debug("Unable to write cache file %s: %s", self._path, e)
+
+
+class ResultCache:
+    """
+    Reuse the matches of a template that was linted before.
+
+    Templates are keyed by their content and file extension, the
+    configuration, the rules, the version and the date of the schemas so
+    the same template linted from different places shares one entry. The
+    local templates of nested stacks are checked before an entry is used.
+    Saving takes a lock on the directory and removes the least recently
+    used entries when there are more than `max_entries` or they are bigger
+    than `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        filename: str,
+        key: str,
+        rules: Rules,
+        max_entries: int = _RESULTS_MAX_ENTRIES,
+        max_bytes: int = _RESULTS_MAX_BYTES,
+    ):
+        self._directory = directory
+        self._filename = filename
+        self._path = os.path.join(directory, key + ".json")
+        self._rules = rules
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+    @classmethod
+    def create(
+        cls,
+        filename: str | None,
+        config: ConfigMixIn,
+        rules: Rules,
+        ignore_bad_template: bool,
+    ) -> ResultCache | None:
+        """
+        Create the cache for a template file when caching is enabled.
+
+        Args:
+            filename (str | None): The template file.
+            config (ConfigMixIn): The configuration used to lint the template.
+            rules (Rules): The rules used to lint the template.
+            ignore_bad_template (bool): If templates that can't be parsed
+                are ignored.
+
+        Returns:
+            ResultCache | None: The cache or None when there is no cache
+                directory or the template is read from stdin or can't be read.
+        """
+        if not config.cache_dir or not filename:
+            return None
+        try:
+            with open(filename, "rb") as f:
+                content = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+        # the arguments of the last template don't apply to this one
+        config.set_template_args(None)
+        key = _digest(
+            _CACHE_VERSION,
+            content,
+            os.path.splitext(filename)[1].lower(),
+            ignore_bad_template,
+            config_key(config, rules),
+            PROVIDER_SCHEMA_MANAGER.schema_date,
+        )
+        return cls(os.path.join(config.cache_dir, "results"), filename, key, rules)
+
+    def get(self) -> list[Match] | None:
+        """
+        Get the matches of the template from an earlier run.
+
+        Returns:
+            list[Match] | None: The matches or None when the template
+                hasn't been linted before.
+        """
+        base_dir = os.path.dirname(os.path.abspath(self._filename))
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                entry = json.load(f)
+            for location, digest in entry["nested"].items():
+                if _file_digest(os.path.join(base_dir, location)) != digest:
+                    return None
+            matches = [
+                self._restore(rule_id, values) for rule_id, values in entry["matches"]
+            ]
+            used_rules = [self._rules[rule_id] for rule_id in entry["used_rules"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            LOGGER.debug("Ignoring unreadable cache file %s: %s", self._path, e)
+            return None
+
+        LOGGER.info("Reusing matches for template %s", self._filename)
+        for rule in used_rules:
+            self._rules.used_rules[rule.id] = rule
+        try:
+            # keep the entry from being removed as the least recently used
+            os.utime(self._path)
+        except OSError:
+            pass
+        return matches
+
+    def run(self, matches: Iterator[Match], template: Any) -> Iterator[Match]:
+        """
+        Save the matches of the template once they have all been yielded.
+
+        Args:
+            matches (Iterator[Match]): The matches for the template.
+            template (Any): The decoded template.
+
+        Yields:
+            Match: The matches for the template.
+        """
+        # the rules keep the rules used by every template so far
+        used_rules = self._rules.used_rules
+        previous = dict(used_rules)
+        used_rules.clear()
+        results = []
+        try:
+            for match in matches:
+                rule_id, values = match_to_values(match)
+                if values["filename"] == self._filename:
+                    values["filename"] = None
+                if "path" in values["rulematch_obj"]:
+                    values["rulematch_obj"]["path"] = list(
+                        values["rulematch_obj"]["path"]
+                    )
+                results.append([rule_id, values])
+                yield match
+        finally:
+            template_rules = list(used_rules)
+            merged = {**previous, **used_rules}
+            used_rules.clear()
+            used_rules.update(merged)
+
+        nested: dict[str, str | None] = {}
+        resources = template.get("Resources") if isinstance(template, dict) else None
+        if isinstance(resources, dict):
+            base_dir = os.path.dirname(os.path.abspath(self._filename))
+            for resource in resources.values():
+                nested.update(nested_templates(base_dir, resource))
+
+        self._save(
+            {
+                "nested": nested,
+                "matches": results,
+                "used_rules": template_rules,
+            }
+        )
+
+    def _restore(self, rule_id: str, values: dict[str, Any]) -> Match:
+        values = dict(values)
+        if values["filename"] is None:
+            values["filename"] = self._filename
+        return match_from_values(rule_id, values, self._rules)
+
+    def _save(self, entry: dict[str, Any]) -> None:
+        try:
+            with file_lock(Path(self._directory) / ".lock", timeout=_LOCK_TIMEOUT):
+                _write_json(self._path, entry)
+                self._evict()
+        except (OSError, TimeoutError, TypeError, ValueError) as e:
+            LOGGER.debug("Unable to write cache file %s: %s", self._path, e)
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries over the limits"""
+        entries = []
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = 0
+        for count, (_, size, path) in enumerate(sorted(entries, reverse=True)):
+            total += size
+            if count >= self._max_entries or total > self._max_bytes:
+                LOGGER.debug("Removing cache file %s", path)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -6,22 +6,37 @@ SPDX-License-Identifier: MIT-0
 from __future__ import annotations
 
 import logging
-from typing import Any, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator
 
+import cfnlint.profiler
 from cfnlint.config import ConfigMixIn
-from cfnlint.decode import decode
+from cfnlint.decode.decode import decode
 from cfnlint.exceptions import InvalidRegionException
 from cfnlint.helpers import REGIONS
 from cfnlint.rules import Match, Rules
 from cfnlint.rules.errors import ParseError, TransformError
+from cfnlint.runner.template.cache import (
+    IncrementalCache,
+    ResultCache,
+    match_from_values,
+    match_to_values,
+)
 from cfnlint.template.template import Template
 
+if TYPE_CHECKING:
+    from cfnlint.runner.cli import Runner
+
 LOGGER = logging.getLogger(__name__)
 
+# The runner for the current pool worker process
+_WORKER_RUNNER: Runner | None = None
+
 
 def _dedup(matches: Iterator[Match]) -> Iterator[Match]:
     """
-    Deduplicate a sequence of matches.
+    Deduplicate a sequence of matches keeping the first time each
+    match is seen.
 
     Args:
         matches (Iterator[Match]): The sequence of matches to be deduplicated.
@@ -29,10 +44,10 @@ def _dedup(matches: Iterator[Match]) -> Iterator[Match]:
     Yields:
         Match: The unique matches from the input sequence.
     """
-    seen: list[Match] = []
+    seen: set[Match] = set()
     for match in matches:
         if match not in seen:
-            seen.append(match)
+            seen.add(match)
             yield match
 
 
@@ -83,7 +98,8 @@ def _run_template_per_config(
             32,
         )
 
-    matches = cfn.transform()
+    with cfnlint.profiler.measure("phase", "transform"):
+        matches = cfn.transform()
     if matches:
         if rules.is_rule_enabled(TransformError(), config):
             yield from iter(matches)
@@ -91,9 +107,26 @@ def _run_template_per_config(
 
     if cfn.template is not None:
         if config.build_graph:
-            cfn.build_graph()
+            with cfnlint.profiler.measure("phase", "graph"):
+                cfn.build_graph()
+        with cfnlint.profiler.measure("phase", "cache"):
+            cache = IncrementalCache.create(config.cache_dir, cfn, config, rules)
+        if cache is not None:
+            cfn.cached_resources = cache.reused
+        rule_matches: Iterator[Match] = iter(
+            cfnlint.profiler.profile(
+                "phase",
+                "rules",
+                rules.run,
+                filename=cfn.filename,
+                cfn=cfn,
+                config=config,
+            )
+        )
+        if cache is not None:
+            rule_matches = cache.run(rule_matches)
         yield from _check_metadata_directives(
-            rules.run(filename=cfn.filename, cfn=cfn, config=config),
+            rule_matches,
             cfn=cfn,
             config=config,
         )
@@ -116,8 +149,10 @@ def _run_template(
         return
 
     config.set_template_args(template)
-    cfn = Template(filename, template, config.regions, config.parameters)
-    yield from _dedup(_run_template_per_config(cfn, config, rules))
+    with cfnlint.profiler.template(filename):
+        with cfnlint.profiler.measure("phase", "template"):
+            cfn = Template(filename, template, config.regions, config.parameters)
+        yield from _dedup(_run_template_per_config(cfn, config, rules))
 
 
 def run_template_by_file_path(
@@ -133,7 +168,18 @@ def run_template_by_file_path(
         rules (Rules): The set of rules to be applied to the template.
     """
 
-    (template, matches) = decode(filename)  # type: ignore
+    cache = ResultCache.create(filename, config, rules, ignore_bad_template)
+    if cache is not None:
+        with cfnlint.profiler.template(filename):
+            with cfnlint.profiler.measure("phase", "cache"):
+                cached = cache.get()
+        if cached is not None:
+            yield from iter(cached)
+            return
+
+    with cfnlint.profiler.template(filename):
+        with cfnlint.profiler.measure("phase", "decode"):
+            template, matches = decode(filename)  # type: ignore
     if matches:
         if ignore_bad_template or any(
             "E0000".startswith(x) for x in config.ignore_checks
@@ -142,7 +188,11 @@ def run_template_by_file_path(
 
         yield from iter(matches)
         return
-    yield from _run_template(filename, template, config, rules)
+
+    results = _run_template(filename, template, config, rules)
+    if cache is not None:
+        results = cache.run(results, template)
+    yield from results
 
 
 def run_template_by_data(
@@ -172,7 +222,7 @@ def run_template_by_pipe(config: ConfigMixIn, rules: Rules) -> Iterator[Match]:
         rules (Rules): The set of rules to be applied to the template.
     """
 
-    (template, matches) = decode(None)  # type: ignore
+    template, matches = decode(None)  # type: ignore
     if matches:
         yield from iter(matches)
         return
@@ -209,7 +259,81 @@ def run_template_by_file_paths(config: ConfigMixIn, rules: Rules) -> Iterator[Ma
             mandatory_rules=config.mandatory_checks,
         ):
             ignore_bad_template = True
-    for filename in config.templates:
+
+    templates = config.templates
+    # timings are collected in this process so profiled runs are serial
+    if config.jobs > 1 and len(templates) > 1 and not config.profile:
+        yield from _run_templates_in_pool(templates, config, rules, ignore_bad_template)
+        return
+
+    for filename in templates:
         yield from run_template_by_file_path(
             filename, config, rules, ignore_bad_template
         )
+
+
+def _init_worker(config: ConfigMixIn) -> None:
+    """
+    Warm up a pool worker process.
+
+    Each worker builds its own rules and applies any registry schemas
+    and spec overrides to its copy of the provider schema manager so
+    that the cost is paid once per process instead of once per template.
+    """
+    # pylint: disable=import-outside-toplevel
+    from cfnlint.runner.cli import Runner
+
+    global _WORKER_RUNNER  # pylint: disable=global-statement
+    _WORKER_RUNNER = Runner(config)
+
+
+def _run_template_in_worker(
+    filename: str, ignore_bad_template: bool
+) -> tuple[list[tuple[str, dict[str, Any]]], list[str]]:
+    """
+    Lint a single template inside a pool worker.
+
+    Matches are flattened to the rule ID and plain values so they can be
+    sent back to the parent process and attached to the parent's rules.
+    """
+    assert _WORKER_RUNNER is not None
+    config = _WORKER_RUNNER.config
+    rules = _WORKER_RUNNER.rules
+    results = [
+        match_to_values(match)
+        for match in run_template_by_file_path(
+            filename, config, rules, ignore_bad_template
+        )
+    ]
+
+    return results, list(rules.used_rules.keys())
+
+
+def _run_templates_in_pool(
+    templates: list[str],
+    config: ConfigMixIn,
+    rules: Rules,
+    ignore_bad_template: bool,
+) -> Iterator[Match]:
+    """
+    Lint templates across a pool of processes.
+
+    Results are yielded in template order as they complete so the output
+    matches a serial run of the same templates.
+    """
+    LOGGER.info("Linting %d templates with %d processes", len(templates), config.jobs)
+    with ProcessPoolExecutor(
+        max_workers=min(config.jobs, len(templates)),
+        initializer=_init_worker,
+        initargs=(config,),
+    ) as executor:
+        for results, used_rule_ids in executor.map(
+            _run_template_in_worker,
+            templates,
+            [ignore_bad_template] * len(templates),
+        ):
+            for rule_id in used_rule_ids:
+                if rule_id in rules:
+                    rules.used_rules[rule_id] = rules[rule_id]
+            for rule_id, values in results:
+                yield match_from_values(rule_id, values, rules)
@@ -0,0 +1,130 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+STORE_FILENAME = "schemas.bin"
+
+# magic bytes and the length of the JSON index that follows
+_HEADER = struct.Struct("<8sI")
+_MAGIC = b"CFNLSCH1"
+
+
+def _store_version() -> str:
+    # marshal data is only guaranteed to load in the same Python version
+    return f"{sys.version_info[0]}.{sys.version_info[1]}-{marshal.version}"
+
+
+def compile_schema_store(resources_dir: Path, store_path: Path) -> None:
+    """Compile the resource schemas into a single indexed file
+
+    Each schema is stored by its hash so that it can be loaded on
+    its own without reading or parsing any of the other schemas.
+
+    Args:
+        resources_dir (Path): the directory of <hash>.json schema files
+        store_path (Path): the file to write the store to
+    Returns:
+        None: Returns when the store has been written
+    """
+    index: dict[str, list[int]] = {}
+    blobs: list[bytes] = []
+    offset = 0
+    for schema_file in sorted(resources_dir.glob("*.json")):
+        with open(schema_file, "r", encoding="utf-8") as f:
+            blob = marshal.dumps(json.load(f))
+        index[schema_file.stem] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"version": _store_version(), "schemas": index}).encode("utf-8")
+    tmp_path = store_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, store_path)
+
+
+class SchemaStore:
+    """Lazy reader for a compiled schema store
+
+    The store is memory mapped the first time a schema is requested
+    and each schema is only deserialized when it is asked for. If the
+    store is missing, corrupt or was written by another version of
+    Python it reports every schema as missing so callers can fall
+    back to the JSON files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._mmap: mmap.mmap | None = None
+        self._index: dict[str, list[int]] | None = None
+        self._data_offset = 0
+
+    def _load_index(self) -> dict[str, list[int]]:
+        if self._index is not None:
+            return self._index
+
+        self._index = {}
+        try:
+            with open(self._path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # a missing or empty file
+            return self._index
+
+        try:
+            magic, header_length = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"Unknown schema store format in {self._path}")
+            header = json.loads(self._mmap[_HEADER.size : _HEADER.size + header_length])
+            if header.get("version") != _store_version():
+                raise ValueError(f"Schema store {self._path} is for another version")
+        except (struct.error, ValueError) as e:
+            LOGGER.debug("Not using schema store: %s", e)
+            self.close()
+            return self._index
+
+        self._data_offset = _HEADER.size + header_length
+        index: dict[str, list[int]] = header.get("schemas", {})
+        self._index = index
+        return index
+
+    def get(self, schema_hash: str) -> dict[str, Any] | None:
+        """Get a schema from the store
+
+        Args:
+            schema_hash (str): the hash of the schema
+        Returns:
+            dict[str, Any] | None: the schema or None when it isn't in the store
+        """
+        location = self._load_index().get(schema_hash)
+        if location is None or self._mmap is None:
+            return None
+
+        start = self._data_offset + location[0]
+        schema: dict[str, Any] = marshal.loads(self._mmap[start : start + location[1]])
+        return schema
+
+    def close(self) -> None:
+        """Release the memory map so the file can be replaced"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._index = {}
@@ -13,6 +13,7 @@ import shutil
 import sys
 import tempfile
 import zipfile
+from copy import deepcopy
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterator, Sequence
@@ -28,6 +29,7 @@ from cfnlint.schema._exceptions import ResourceNotFoundError
 from cfnlint.schema._getatts import AttributeDict
 from cfnlint.schema._lock import file_lock
 from cfnlint.schema._schema import Schema
+from cfnlint.schema._store import STORE_FILENAME, SchemaStore, compile_schema_store
 
 if TYPE_CHECKING:
     from cfnlint.schema._patch import SchemaPatch
@@ -77,6 +79,11 @@ class ProviderSchemaManager:
         except (FileNotFoundError, json.JSONDecodeError):
             return ""
 
+    @property
+    def schema_date(self) -> str:
+        """The date of the schemas in use or an empty string when unknown."""
+        return self._read_schema_date(self._providers_dir.parent)
+
     @staticmethod
     def _resolve_schema_dirs() -> tuple[Path, Path]:
         """Determine which schema directory to use.
@@ -118,6 +125,12 @@ class ProviderSchemaManager:
         self._schemas: dict[str, dict[str, Schema]] = {}
         for region in REGIONS:
             self._schemas[region] = {}
+        # regions with the same schema hash share one Schema
+        self._hashed_schemas: dict[str, Schema] = {}
+        store: SchemaStore | None = getattr(self, "_store", None)
+        if store is not None:
+            store.close()
+        self._store = SchemaStore(self._resources_dir / STORE_FILENAME)
         self._removed_types: list[str] = []
         self._provider_schema_modules = {}
         self._sam_schema_module = None
@@ -271,13 +284,56 @@ class ProviderSchemaManager:
         if not schema_hash:
             raise ResourceNotFoundError(resource_type, region)
 
-        try:
-            schema_file = self._resources_dir / f"{schema_hash}.json"
-            with open(schema_file, "r", encoding="utf-8") as f:
-                self._schemas[region][resource_type] = Schema(json.load(f))
-            return self._schemas[region][resource_type]
-        except Exception as e:
-            raise ResourceNotFoundError(resource_type, region) from e
+        schema = self._hashed_schemas.get(schema_hash)
+        if schema is None:
+            try:
+                schema = Schema(self._load_schema_by_hash(schema_hash))
+            except Exception as e:
+                raise ResourceNotFoundError(resource_type, region) from e
+            self._hashed_schemas[schema_hash] = schema
+
+        self._schemas[region][resource_type] = schema
+        return schema
+
+    def _load_schema_by_hash(self, schema_hash: str) -> dict[str, Any]:
+        """Load a schema from the compiled store or its JSON file
+
+        Args:
+            schema_hash (str): the hash of the schema
+        Returns:
+            dict[str, Any]: the schema
+        """
+        schema = self._store.get(schema_hash)
+        if schema is not None:
+            return schema
+
+        schema_file = self._resources_dir / f"{schema_hash}.json"
+        with open(schema_file, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        return schema
+
+    def _get_schema_to_patch(self, region: str, resource_type: str) -> Schema:
+        """Get a schema that can be patched for only this region
+
+        Schemas are shared between regions with the same schema hash so
+        a copy is made before the first patch in a region.
+
+        Args:
+            region (str): the region being patched
+            resource_type (str): the :: version of the resource type
+        Returns:
+            Schema: the schema for only this region
+        """
+        schema = self.get_resource_schema(region=region, resource_type=resource_type)
+        if not any(schema is shared for shared in self._hashed_schemas.values()):
+            return schema
+
+        if resource_type not in self._registry_schemas:
+            resource_type = self._normalize_resource_type(resource_type)
+        schema = Schema(deepcopy(schema.schema))
+        self._schemas[region][resource_type] = schema
+        self.get_resource_schema.cache_clear()
+        return schema
 
     @lru_cache(maxsize=None)
     def get_resource_types(self, region: str) -> list[str]:
@@ -396,6 +452,15 @@ class ProviderSchemaManager:
                             with zip_ref.open(name) as src, open(dest, "wb") as dst:
                                 dst.write(src.read())
 
+                # The JSON files are still used if the store can't be built
+                try:
+                    compile_schema_store(tmp_resources, tmp_resources / STORE_FILENAME)
+                except (OSError, ValueError) as e:
+                    LOGGER.warning("Failed to compile the schema store: %s", e)
+
+                # Release the current store so its file can be replaced
+                self._store.close()
+
                 # Atomic replacement: remove old, rename new. On POSIX, rename()
                 # is atomic when src and dst share a filesystem, which is
                 # guaranteed here by extracting under the same cache_dir.
@@ -494,9 +559,7 @@ class ProviderSchemaManager:
 
         for resource_type, patches in patch.patches.items():
             try:
-                schema = self.get_resource_schema(
-                    resource_type=resource_type, region=region
-                )
+                schema = self._get_schema_to_patch(region, resource_type)
             except ResourceNotFoundError:
                 # Resource type doesn't exist in this region
                 continue
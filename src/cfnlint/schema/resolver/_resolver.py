@@ -29,6 +29,14 @@ from cfnlint.schema.resolver._utils import id_of
 
 _SUBSCHEMAS_KEYWORDS = ("$id", "id", "$anchor", "$dynamicAnchor")
 
+# The number of schemas to keep shared resolvers for before dropping the oldest
+_MAX_SHARED_RESOLVERS = 1024
+
+# Resolvers keyed by the class, the id of the referring schema and the id of
+# the store. The schema and the store are kept with the resolver so the ids
+# can't be reused while it is cached.
+_shared_resolvers: dict[tuple[Any, int, int], tuple[Any, Any, "RefResolver"]] = {}
+
 
 def _match_subschema_keywords(value):
     for keyword in _SUBSCHEMAS_KEYWORDS:
@@ -66,6 +74,7 @@ class RefResolver:
     _cache_cfn_pointer: Any = field(init=True, default=None)
     _subschemas_cache: Any = field(init=False, default=None)
     store: Any = field(init=True, default=None)
+    _shared: Any = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
         self._scopes_stack = [self.base_uri]
@@ -88,6 +97,10 @@ class RefResolver:
         """
         Construct a resolver from a JSON schema object.
 
+        Resolvers for the same schema and store share their caches of
+        resolved references and subschemas. Each resolver has its own
+        scope stack.
+
         Arguments:
 
             schema:
@@ -98,7 +111,33 @@ class RefResolver:
 
             `RefResolver`
         """
-        return cls(base_uri=id_of(schema), referrer=schema, **kwargs)
+        if set(kwargs) - {"store"}:
+            return cls(base_uri=id_of(schema), referrer=schema, **kwargs)
+
+        store = kwargs.get("store")
+        key = (cls, id(schema), id(store))
+        cached = _shared_resolvers.get(key)
+        if cached is not None and cached[0] is schema and cached[1] is store:
+            shared = cached[2]
+        else:
+            # the shared resolver is never used for validation so the
+            # cached results are always resolved from the base scope
+            shared = cls(base_uri=id_of(schema), referrer=schema, store=store)
+            if len(_shared_resolvers) >= _MAX_SHARED_RESOLVERS:
+                # drop the oldest resolver
+                del _shared_resolvers[next(iter(_shared_resolvers))]
+            _shared_resolvers[key] = (schema, store, shared)
+
+        resolver = cls(
+            base_uri=shared.base_uri,
+            referrer=schema,
+            _urljoin_cache=shared._urljoin_cache,
+            _cache=shared._cache,
+            _cache_cfn_pointer=shared._cache_cfn_pointer,
+            store=shared.store,
+        )
+        resolver._shared = shared
+        return resolver
 
     def push_scope(self, scope):
         """
@@ -299,6 +338,9 @@ class RefResolver:
     def _get_subschemas_cache(self):
         if self._subschemas_cache is not None:
             return self._subschemas_cache
+        if self._shared is not None:
+            self._subschemas_cache = self._shared._get_subschemas_cache()
+            return self._subschemas_cache
         cache = {key: [] for key in _SUBSCHEMAS_KEYWORDS}
         for keyword, subschema in _search_schema(
             self.referrer,
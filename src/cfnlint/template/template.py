@@ -6,7 +6,9 @@ SPDX-License-Identifier: MIT-0
 from __future__ import annotations
 
 import functools
+import itertools
 import logging
+import operator
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Iterator
 
@@ -29,6 +31,10 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# A key mapped to where it was found in walk order as the position,
+# the path to the key and the value of the key
+_KeyIndex = dict[Any, list[tuple[int, tuple[Any, ...], Any]]]
+
 
 class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attributes
     """
@@ -46,6 +52,8 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
         transform_pre (dict[str, Any]): A dictionary containing pre-processed transformation data.
         conditions (Conditions): An instance of the Conditions class used for managing conditions.
         graph (Graph): An instance of the Graph class used for representing the template structure.
+        cached_resources (frozenset[str]): Resources with matches reused from an earlier run
+            that the rules don't need to check again.
     """
 
     def __init__(
@@ -67,6 +75,10 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
 
         self.filename = filename
         self.template = template
+        self.cached_resources: frozenset[str] = frozenset()
+        # every key in the template and Globals is indexed in one walk
+        # the first time they are searched
+        self._key_indexes: dict[str, tuple[Any, _KeyIndex]] = {}
         self.transform_pre: dict[str, Any] = {}
         self.transform_pre["Globals"] = {}
         self.transform_pre["Ref"] = self.search_deep_keys("Ref")
@@ -95,6 +107,8 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
             LOGGER.info("Encountered unknown error while building graph: %s", err)
 
         self.context = create_context_for_template(self)
+        # creating the context sorts the values of each Fn::Equals in place
+        self._key_indexes.clear()
         if parameter_sets:
             self.context = self.context.evolve(parameter_sets=parameter_sets)
         self.search_deep_keys = functools.lru_cache()(self.search_deep_keys)  # type: ignore
@@ -104,11 +118,14 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
+            if k == "_key_indexes":
+                v = {}
             setattr(result, k, deepcopy(v, memo))
         return result
 
     def _cache_clear(self):
         self.search_deep_keys.cache_clear()
+        self._key_indexes.clear()
 
     def transform(self) -> list[Match]:
         """
@@ -347,57 +364,6 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
                         results[ignore_rule_id].append(resource_name)
         return results
 
-    # pylint: disable=dangerous-default-value
-    def _search_deep_keys(self, searchText: str | re.Pattern, cfndict, path: CfnPath):
-        """Search deep for keys and get their values.
-
-        Args:
-            searchText (str | re.Pattern): The text or regular expression pattern to search for.
-            cfndict (Any): The dictionary or list to search in.
-            path (list[Any]): The current path in the dictionary or list.
-
-        Returns:
-            list[list[Any]]: A list of paths where the searchText was found.
-        """
-        keys = []
-        if isinstance(cfndict, dict):
-            for key in cfndict:
-                pathprop: CfnPath = path[:]
-                pathprop.append(key)
-                if isinstance(searchText, str):
-                    if key == searchText:
-                        pathprop.append(cfndict[key])
-                        keys.append(pathprop)
-                        # pop the last element off for nesting of found elements for
-                        # dict and list checks
-                        pathprop = pathprop[:-1]
-                elif isinstance(searchText, re.Pattern):
-                    if isinstance(key, str):
-                        if re.match(searchText, key):
-                            pathprop.append(cfndict[key])
-                            keys.append(pathprop)
-                            # pop the last element off for nesting of found elements for
-                            # dict and list checks
-                            pathprop = pathprop[:-1]
-                if isinstance(cfndict[key], dict):
-                    keys.extend(
-                        self._search_deep_keys(searchText, cfndict[key], pathprop)
-                    )
-                elif isinstance(cfndict[key], list):
-                    for index, item in enumerate(cfndict[key]):
-                        pathproparr = pathprop[:]
-                        pathproparr.append(index)
-                        keys.extend(
-                            self._search_deep_keys(searchText, item, pathproparr)
-                        )
-        elif isinstance(cfndict, list):
-            for index, item in enumerate(cfndict):
-                pathprop = path[:]
-                pathprop.append(index)
-                keys.extend(self._search_deep_keys(searchText, item, pathprop))
-
-        return keys
-
     def search_deep_keys(
         self, searchText: str | re.Pattern, includeGlobals: bool = True
     ):
@@ -414,17 +380,31 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
             If searchText is "Ref", the return value could be something like
             ['Resources', 'myInstance', 'Properties', 'ImageId', 'Ref', 'Ec2ImageId']
         """
-        results = []
-        results.extend(self._search_deep_keys(searchText, self.template, []))
+        results = _search_keys(self._keys("template", self.template), searchText)
         # Globals are removed during a transform.  They need to be checked manually
         if includeGlobals:
-            pre_results = self._search_deep_keys(
-                searchText, self.transform_pre.get("Globals"), []
+            pre_results = _search_keys(
+                self._keys("globals", self.transform_pre.get("Globals")), searchText
             )
             for pre_result in pre_results:
                 results.append(["Globals"] + pre_result)
         return results
 
+    def _keys(self, name: str, obj: Any) -> _KeyIndex:
+        """Get the index of the keys in an object building it the first time
+
+        Args:
+            name (str): The name the index is kept under
+            obj (Any): The object to index
+
+        Returns:
+            _KeyIndex: The index of the keys in the object
+        """
+        cached = self._key_indexes.get(name)
+        if cached is None or cached[0] is not obj:
+            cached = self._key_indexes[name] = (obj, _index_keys(obj))
+        return cached[1]
+
     def get_cfn_path(
         self, path: list[str], context: Context
     ) -> Iterator[tuple[Any, Context]]:
@@ -1341,6 +1321,61 @@ class Template:  # pylint: disable=R0904,too-many-lines,too-many-instance-attrib
         return results
 
 
+def _index_keys(obj: Any) -> _KeyIndex:
+    """Find every key in nested dicts and lists in a single walk
+
+    Args:
+        obj (Any): The dict or list to index
+
+    Returns:
+        _KeyIndex: Where each key was found
+    """
+    index: _KeyIndex = {}
+    position = itertools.count()
+
+    def _walk(obj: Any, path: tuple[Any, ...]) -> None:
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                key_path = path + (key,)
+                entries = index.get(key)
+                if entries is None:
+                    entries = index[key] = []
+                entries.append((next(position), key_path, value))
+                if isinstance(value, (dict, list)):
+                    _walk(value, key_path)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                _walk(item, path + (i,))
+
+    _walk(obj, ())
+    return index
+
+
+def _search_keys(index: _KeyIndex, searchText: str | re.Pattern) -> list[list[Any]]:
+    """Get the paths to the keys matching the search from an index
+
+    Args:
+        index (_KeyIndex): The index of the keys
+        searchText (str | re.Pattern): The key or a pattern the key matches
+
+    Returns:
+        list[list[Any]]: The path to each key ending with its value in the
+            order the keys are in the template
+    """
+    if isinstance(searchText, re.Pattern):
+        found = [
+            entry
+            for key, entries in index.items()
+            if isinstance(key, str) and re.match(searchText, key)
+            for entry in entries
+        ]
+        found.sort(key=operator.itemgetter(0))
+    else:
+        found = index.get(searchText, [])
+
+    return [[*path, value] for _, path, value in found]
+
+
 def camel_to_snake(s):
     """
     Is it ironic that this function is written in camel case, yet it
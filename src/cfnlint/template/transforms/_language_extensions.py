@@ -10,13 +10,13 @@ import json
 import logging
 import random
 import string
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Iterator, Mapping, MutableMapping, Tuple
 
 import regex as re
 
 from cfnlint.conditions._utils import get_hash
-from cfnlint.decode.node import str_node
+from cfnlint.decode.node import dict_node, list_node, str_node
 from cfnlint.helpers import FUNCTION_FOR_EACH, REGEX_SUB_PARAMETERS
 from cfnlint.template.transforms._types import TransformResult
 
@@ -29,6 +29,26 @@ _SCALAR_TYPES = (str, int, float, bool)
 
 _ACCOUNT_ID = None
 
+_AMPERSAND_PATTERN = re.compile(r"&{\s*[^!\s].*?\s*}")
+
+
+def _copy(obj: Any) -> Any:
+    """Shallow copy a template node keeping its marks"""
+    if isinstance(obj, dict_node):
+        return dict_node(obj, obj.start_mark, obj.end_mark, obj.using_merge)
+    if isinstance(obj, list_node):
+        return list_node(obj, obj.start_mark, obj.end_mark)
+    return copy(obj)
+
+
+def _set_item(obj: Any, index: int, value: Any) -> Any:
+    """Set an item copying the node first if the value is changing"""
+    if obj[index] is value:
+        return obj
+    obj = _copy(obj)
+    obj[index] = value
+    return obj
+
 
 class _ResolveError(Exception):
     def __init__(self, message: str, key: Any) -> None:
@@ -109,19 +129,26 @@ class _Transform:
 
     # pylint: disable=too-many-return-statements
     def _walk(self, item: Any, params: MutableMapping[str, Any], cfn: Any):
-        obj = deepcopy(item)
-        if isinstance(obj, dict):
+        # Subtrees that don't change are returned as is so they are shared
+        # with the original template. A node is only copied when one of its
+        # keys or values is replaced and the copy keeps the marks.
+        obj = item
+        if isinstance(item, dict):
             # adjust keys if needed
             if params:
                 for k, v in item.items():
                     _, new_k = self._replace_string_params(k, params)
                     if new_k != k:
+                        if obj is item:
+                            obj = _copy(item)
                         del obj[k]
                         obj[new_k] = v
 
-            for k, v in deepcopy(obj).items():
+            for k, v in list(obj.items()):
                 # see if key matches Fn::ForEach
-                if re.match(FUNCTION_FOR_EACH, k):
+                if FUNCTION_FOR_EACH.match(k):
+                    if obj is item:
+                        obj = _copy(item)
                     # only translate the foreach if its valid
                     foreach = _ForEach(k, v, self._collections)
                     # get the values will flatten the foreach
@@ -138,26 +165,30 @@ class _Transform:
                                     f_k,
                                 )
                     del obj[k]
-                elif k == "Fn::ToJsonString":
+                    continue
+                if k == "Fn::ToJsonString":
                     # extra special handing for this as {} could be a valid value
                     return obj
-                elif k == "Fn::GetAtt":
+
+                new_v = v
+                if k == "Fn::GetAtt":
                     if isinstance(v, (list, str)):
-                        obj[k] = self._walk(v, params, cfn)
+                        new_v = self._walk(v, params, cfn)
                 elif k == "Fn::Sub":
                     if isinstance(v, str):
-                        only_string, obj[k] = self._replace_string_params(v, params)
+                        only_string, new_v = self._replace_string_params(v, params)
                         if only_string:
-                            return obj[k]
+                            return new_v
                     if isinstance(v, list):
-                        only_string, obj[k][0] = self._replace_string_params(
+                        only_string, value = self._replace_string_params(
                             v[0],
                             params,
                         )
                         if only_string:
-                            return obj[k][0]
+                            return value
+                        new_v = _set_item(v, 0, value)
                         if len(v) == 2:
-                            obj[k][1] = self._walk(v[1], params, cfn)
+                            new_v = _set_item(new_v, 1, self._walk(v[1], params, cfn))
                 elif k == "Fn::FindInMap":
                     try:
                         mapping = _ForEachValueFnFindInMap(get_hash(v), v)
@@ -169,39 +200,51 @@ class _Transform:
                         # We couldn't resolve the FindInMap so we are going to
                         # leave it as it is
                         LOGGER.debug("Transform and Fn::FindInMap error: %s", {str(e)})
-                    for i, el in enumerate(v):
-                        v[i] = self._walk(el, params, cfn)
-                    obj[k] = v
+                    if isinstance(v, list):
+                        new_v = self._walk(v, params, cfn)
+                    else:
+                        new_v = _copy(v)
+                        for i, el in enumerate(v):
+                            new_v[i] = self._walk(el, params, cfn)
                 elif k == "Ref":
                     if isinstance(v, str):
                         if v in params:
                             return params[v]
                     elif isinstance(v, dict):
-                        r = self._walk(v, params, cfn)
-                        if isinstance(r, str):
-                            if r in params:
-                                return params[r]
-                        obj[k] = r
+                        new_v = self._walk(v, params, cfn)
+                        if isinstance(new_v, str):
+                            if new_v in params:
+                                return params[new_v]
                 elif k == "Fn::If":
                     if isinstance(v, list) and len(v) == 3:
                         # CloudFormation does not resolve the condition name
                         # (index 0) inside Fn::ForEach, so we leave it as-is
                         # and only walk the true/false branches.
-                        obj[k][1] = self._walk(v[1], params, cfn)
-                        obj[k][2] = self._walk(v[2], params, cfn)
+                        new_v = _set_item(v, 1, self._walk(v[1], params, cfn))
+                        new_v = _set_item(new_v, 2, self._walk(v[2], params, cfn))
                 else:
-                    sub_value = self._walk(v, params, cfn)
+                    new_v = self._walk(v, params, cfn)
                     # a sub object may be none or we have returned
                     # an empty object.  We don't want to remove empty
                     # strings "" or 0 (zeros)
                     # Remove `or sub_value == {}` for issue #2896
-                    if sub_value is None:
+                    if new_v is None:
+                        if obj is item:
+                            obj = _copy(item)
                         del obj[k]
-                    else:
-                        obj[k] = sub_value
-        elif isinstance(obj, list):
-            for i, v in enumerate(obj):
-                obj[i] = self._walk(v, params, cfn)
+                        continue
+
+                if new_v is not v:
+                    if obj is item:
+                        obj = _copy(item)
+                    obj[k] = new_v
+        elif isinstance(item, list):
+            for i, v in enumerate(item):
+                new_v = self._walk(v, params, cfn)
+                if new_v is not v:
+                    if obj is item:
+                        obj = _copy(item)
+                    obj[i] = new_v
         return obj
 
     def _replace_string_params(
@@ -209,17 +252,15 @@ class _Transform:
         s: str,
         params: Mapping[str, Any],
     ) -> Tuple[bool, str]:
-        _ampersand_pattern = re.compile(r"&{\s*[^!\s].*?\s*}")
-
         def _has_variables(value: str) -> bool:
             return bool(
-                REGEX_SUB_PARAMETERS.search(value) or _ampersand_pattern.search(value)
+                REGEX_SUB_PARAMETERS.search(value) or _AMPERSAND_PATTERN.search(value)
             )
 
         if not _has_variables(s):
             return (True, s)
 
-        new_s = deepcopy(s)
+        new_s = s
         for k, v in params.items():
             if isinstance(v, dict):
                 v = (
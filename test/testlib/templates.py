@@ -0,0 +1,20 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+
+def bucket_template(count):
+    """Return a generated template with `count` buckets"""
+    return {
+        "Resources": {
+            f"Bucket{i}": {
+                "Type": "AWS::S3::Bucket",
+                "Properties": {
+                    "BucketName": {"Fn::Sub": f"bucket-${{AWS::Region}}-{i}"},
+                    "Tags": [{"Key": "Name", "Value": {"Ref": "AWS::StackName"}}],
+                },
+            }
+            for i in range(count)
+        }
+    }
@@ -3,11 +3,16 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: MIT-0
 """
 
+import json
 from io import StringIO
+from test.testlib.templates import bucket_template
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
 
+import pytest
+
 import cfnlint.decode.cfn_json  # pylint: disable=E0401
+import cfnlint.decode.cfn_yaml
 from cfnlint import ConfigMixIn
 from cfnlint.config import _DEFAULT_RULESDIR
 from cfnlint.rules import Rules
@@ -107,3 +112,162 @@ class TestCfnJson(BaseTestCase):
             return
 
         assert False
+
+
+def _assert_same_nodes(json_node, yaml_node, path="$"):
+    assert type(json_node) is type(yaml_node), path
+    for attr in ("start_mark", "end_mark"):
+        if hasattr(yaml_node, attr):
+            json_mark = getattr(json_node, attr)
+            yaml_mark = getattr(yaml_node, attr)
+            assert (json_mark.line, json_mark.column) == (
+                yaml_mark.line,
+                yaml_mark.column,
+            ), f"{path} {attr}"
+    if isinstance(yaml_node, dict):
+        assert list(json_node) == list(yaml_node), path
+        for (json_key, json_value), (yaml_key, yaml_value) in zip(
+            json_node.items(), yaml_node.items()
+        ):
+            _assert_same_nodes(json_key, yaml_key, f"{path}.{yaml_key}")
+            _assert_same_nodes(json_value, yaml_value, f"{path}.{yaml_key}")
+    elif isinstance(yaml_node, list):
+        assert len(json_node) == len(yaml_node), path
+        for i, (json_item, yaml_item) in enumerate(zip(json_node, yaml_node)):
+            _assert_same_nodes(json_item, yaml_item, f"{path}[{i}]")
+    else:
+        assert json_node == yaml_node, path
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "test/fixtures/templates/good/parameters/used_transform_language_extension.json",
+        "test/fixtures/templates/good/decode/parsing.json",
+        "test/fixtures/templates/quickstart/vpc.json",
+        "test/fixtures/templates/public/watchmaker.json",
+    ],
+)
+def test_load_as_yaml_matches_yaml(filename):
+    _assert_same_nodes(
+        cfnlint.decode.cfn_json.load_as_yaml(filename),
+        cfnlint.decode.cfn_yaml.load(filename),
+    )
+
+
+@pytest.mark.parametrize(
+    "name,json_string",
+    [
+        ("Escapes", '{"a": "\\/\\b\\f\\n\\t\\u00e9\\"", "b\\"c": ""}'),
+        ("Numbers", '{"a": [1, -0, 0.5, -1.25, 1.0e+5, 2.5E-3, true, false, null]}'),
+        ("Wide characters", '{"\U0001f600\U0001f600": ["\U0001f600", "é"]}'),
+        ("Empty containers", '{"a": {}, "b": [], "c": [{}, []]}'),
+        ("Line breaks", '{"a": 1,\r\n "b": {\r"c": [\n]}\n}\n'),
+        ("No spaces", '{"a":{"b":["c",1]},"d":"e"}'),
+        ("Top level array", '[{"a": "b"}, "c"]'),
+    ],
+)
+def test_loads_as_yaml_matches_yaml(name, json_string):
+    _assert_same_nodes(
+        cfnlint.decode.cfn_json.loads_as_yaml(json_string),
+        cfnlint.decode.cfn_yaml.loads(json_string),
+        name,
+    )
+
+
+@pytest.mark.parametrize(
+    "name,json_string",
+    [
+        ("Tabs", '{\t"a": 1}'),
+        ("Escaped surrogates", '{"a": "\\ud83d\\ude00"}'),
+        ("Exponent without a fraction", '{"a": 1e5}'),
+        ("Exponent without a sign", '{"a": 1.5e5}'),
+        ("Not a number", '{"a": NaN}'),
+        ("Line separator", '{"a": "\u2028"}'),
+        ("Key on a different line", '{"a"\n: 1}'),
+        ("Long key", '{"' + "a" * 1024 + '": 1}'),
+        ("Duplicate keys", '{"a": 1, "a": 2}'),
+    ],
+)
+def test_loads_as_yaml_incompatible(name, json_string):
+    with pytest.raises(cfnlint.decode.cfn_json.IncompatibleJSONError):
+        cfnlint.decode.cfn_json.loads_as_yaml(json_string)
+
+
+def test_loads_as_yaml_invalid_json():
+    with pytest.raises(json.JSONDecodeError):
+        cfnlint.decode.cfn_json.loads_as_yaml('{"a": }')
+
+
+def _loads_with_python_scanner(json_string):
+    with patch.object(
+        cfnlint.decode.cfn_json.CfnJSONDecoder, "c_decode", side_effect=ValueError
+    ):
+        return cfnlint.decode.cfn_json.loads(json_string)
+
+
+@pytest.mark.parametrize(
+    "name,json_string",
+    [
+        ("Escapes", '{"a": "\\/\\b\\f\\n\\t\\u00e9\\"", "b\\"c": ""}'),
+        ("Numbers", '{"a": [1, -0, 0.5, 1e5, 2.5E-3, true, false, null]}'),
+        ("Tabs", '{\t"a":\t{\t"b": [\t1\t]}}'),
+        ("Empty containers", '{"a": {}, "b": [], "c": [{}, []]}'),
+        ("Line breaks", '{"a": 1,\r\n "b": {\r"c": [\n]}\n}\n'),
+        ("Top level array", '[{"a": "b"}, "c"]'),
+        ("Top level string", '"a"'),
+    ],
+)
+def test_loads_matches_python_scanner(name, json_string):
+    _assert_same_nodes(
+        cfnlint.decode.cfn_json.loads(json_string),
+        _loads_with_python_scanner(json_string),
+        name,
+    )
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "test/fixtures/templates/good/decode/parsing.json",
+        "test/fixtures/templates/quickstart/iam.json",
+        "test/fixtures/templates/public/watchmaker.json",
+    ],
+)
+def test_load_matches_python_scanner(filename):
+    with open(filename, encoding="utf-8") as f:
+        json_string = f.read()
+    _assert_same_nodes(
+        cfnlint.decode.cfn_json.loads(json_string),
+        _loads_with_python_scanner(json_string),
+    )
+
+
+def test_loads_generated_template_without_python_scanner():
+    # the Python scanner is only used to report errors
+    json_string = json.dumps(bucket_template(50), indent=2)
+
+    with patch.object(
+        cfnlint.decode.cfn_json.CfnJSONDecoder, "cfn_json_object", autospec=True
+    ) as mock_cfn_json_object:
+        template = cfnlint.decode.cfn_json.loads(json_string)
+    mock_cfn_json_object.assert_not_called()
+
+    key = list(template["Resources"])[-1]
+    assert key == "Bucket49"
+    assert key.start_mark.line == json_string[: json_string.rindex(key)].count("\n")
+
+
+def test_loads_errors_from_python_scanner():
+    with pytest.raises(cfnlint.decode.cfn_json.JSONDecodeError) as e:
+        cfnlint.decode.cfn_json.loads('{"a": 1,\n "a": 2}')
+    assert [(m.message, m.linenumber) for m in e.value.matches] == [
+        ('Duplicate found "a"', 1),
+        ('Duplicate found "a"', 0),
+    ]
+
+    with pytest.raises(cfnlint.decode.cfn_json.JSONDecodeError) as e:
+        cfnlint.decode.cfn_json.loads('{"a": 1,}')
+    assert e.value.matches[0].message == (
+        "Expecting property name enclosed in double quotes"
+    )
@@ -8,6 +8,7 @@ from unittest import TestCase
 
 from cfnlint.conditions import UnknownSatisfisfaction
 from cfnlint.conditions._utils import get_hash
+from cfnlint.conditions.conditions import SatisfiableCacheInfo
 from cfnlint.decode import decode_str
 from cfnlint.template import Template
 
@@ -17,13 +18,11 @@ class TestConditions(TestCase):
 
     def test_bad_condition_definition(self):
         """Badly formatted condition statements will return no results"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Conditions:
           IsProd: !Equals [!Ref Environment, "prod", "production"]
           IsUsEast1: !Equals [!Ref "AWS::Region", "us-east-1"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(
@@ -97,8 +96,7 @@ class TestConditions(TestCase):
 
     def test_check_always_true_or_false(self):
         """We properly validate static equals"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           FalseParameter:
             Default: "false"
@@ -106,8 +104,7 @@ class TestConditions(TestCase):
         Conditions:
           IsTrue: !Equals ["true", "true"]
           IsFalse: !Equals [!Ref FalseParameter, !Ref FalseParameter]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(len(cfn.conditions._conditions), 2)
@@ -116,8 +113,7 @@ class TestConditions(TestCase):
 
     def test_check_never_false(self):
         """With allowed values two conditions can not both be false"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
@@ -125,8 +121,7 @@ class TestConditions(TestCase):
         Conditions:
           IsProd: !Equals [!Ref Environment, "prod"]
           IsDev: !Equals [!Ref Environment, "dev"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(len(cfn.conditions._conditions), 2)
@@ -140,8 +135,7 @@ class TestConditions(TestCase):
 
     def test_check_can_be_false(self):
         """With allowed values two conditions can both be false"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
@@ -149,8 +143,7 @@ class TestConditions(TestCase):
         Conditions:
           IsProd: !Equals [!Ref Environment, "prod"]
           IsDev: !Equals [!Ref Environment, "dev"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(len(cfn.conditions._conditions), 2)
@@ -178,8 +171,7 @@ class TestConditions(TestCase):
 
     def test_check_can_be_good_when_condition_value(self):
         """Some times a condition Equals doesn't match to allowed values"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
@@ -187,8 +179,7 @@ class TestConditions(TestCase):
         Conditions:
           IsGamma: !Equals [!Ref Environment, "gamma"]
           IsBeta: !Equals ["beta", !Ref Environment]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(len(cfn.conditions._conditions), 2)
@@ -207,8 +198,7 @@ class TestConditions(TestCase):
 
     def test_check_condition_region(self):
         """Regional based condition testing"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
@@ -217,8 +207,7 @@ class TestConditions(TestCase):
           IsUsEast1: !Equals [!Ref AWS::Region, "us-east-1"]
           IsUsWest2: !Equals ["us-west-2", !Ref AWS::Region]
           IsProd: !Equals [!Ref Environment, "prod"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertEqual(len(cfn.conditions._conditions), 3)
@@ -263,8 +252,7 @@ class TestConditions(TestCase):
 
     def test_test_condition(self):
         """Get condition and test"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
@@ -274,8 +262,7 @@ class TestConditions(TestCase):
           IsUsWest2: !Equals ["us-west-2", !Ref AWS::Region]
           IsProd: !Equals [!Ref Environment, "prod"]
           IsUsEast1AndProd: !And [!Condition IsUsEast1, !Condition IsProd]
-        """
-        )[0]
+        """)[0]
 
         h_region = get_hash({"Ref": "AWS::Region"})
         h_environment = get_hash({"Ref": "Environment"})
@@ -296,12 +283,10 @@ class TestConditions(TestCase):
 
     def test_build_scenerios_on_region_with_condition_dne(self):
         """Get condition and test"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Conditions:
           IsUsEast1: !Equals [!Ref AWS::Region, "us-east-1"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
         self.assertListEqual(
@@ -311,8 +296,7 @@ class TestConditions(TestCase):
 
     def test_satifaction(self):
         """Get condition and test"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           SecurityGroups:
             Default: ""
@@ -320,8 +304,7 @@ class TestConditions(TestCase):
         Conditions:
           IsUsEast1: !Equals [!Ref AWS::Region, "us-east-1"]
           HasSecurityGroups: !Not [ !Equals [ !Join [ '', !Ref SecurityGroups ], ''] ]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
 
@@ -333,16 +316,14 @@ class TestConditions(TestCase):
     def test_unknown_condition_satisfaction(self):
         """Test raising UnknownSatisfisfaction when condition name
         is not in conditions"""
-        template = decode_str(
-            """
+        template = decode_str("""
         Parameters:
           Environment:
             Type: String
             Default: "dev"
         Conditions:
           IsProd: !Equals [!Ref Environment, "prod"]
-        """
-        )[0]
+        """)[0]
 
         cfn = Template("", template)
 
@@ -352,3 +333,68 @@ class TestConditions(TestCase):
             cfn.conditions.satisfiable(
                 {"NonExistentCondition": True}, {"Environment": "dev"}
             )
+
+    def test_satisfiable_cache(self):
+        """Repeated satisfaction checks are answered from the cache"""
+        template = decode_str("""
+        Parameters:
+          Environment:
+            Type: String
+            AllowedValues: ["prod", "dev"]
+          SecurityGroups:
+            Type: CommaDelimitedList
+        Conditions:
+          IsProd: !Equals [!Ref Environment, "prod"]
+          IsDev: !Equals [!Ref Environment, "dev"]
+          HasSecurityGroups: !Not [ !Equals [ !Join [ '', !Ref SecurityGroups ], ''] ]
+        """)[0]
+
+        cfn = Template("", template)
+
+        for _ in range(3):
+            self.assertTrue(
+                cfn.conditions.satisfiable(
+                    {"IsProd": True, "IsDev": False}, {"Environment": "prod"}
+                )
+            )
+            self.assertFalse(
+                cfn.conditions.satisfiable({"IsProd": True}, {"Environment": "dev"})
+            )
+            with self.assertRaises(UnknownSatisfisfaction):
+                cfn.conditions.satisfiable(
+                    {"HasSecurityGroups": True}, {"SecurityGroups": [""]}
+                )
+
+        # the order of the conditions doesn't matter
+        self.assertTrue(
+            cfn.conditions.satisfiable(
+                {"IsDev": False, "IsProd": True}, {"Environment": "prod"}
+            )
+        )
+
+        self.assertEqual(
+            cfn.conditions.satisfiable_cache_info(),
+            SatisfiableCacheInfo(hits=7, misses=3, maxsize=4096, currsize=3),
+        )
+
+    def test_satisfiable_cache_bounded(self):
+        """The oldest results are dropped when the cache is full"""
+        template = decode_str("""
+        Parameters:
+          Environment:
+            Type: String
+        Conditions:
+          IsProd: !Equals [!Ref Environment, "prod"]
+        """)[0]
+
+        cfn = Template("", template)
+        cfn.conditions._max_satisfiable_cache = 2
+
+        for value in ["prod", "dev", "test"]:
+            cfn.conditions.satisfiable({"IsProd": True}, {"Environment": value})
+
+        self.assertEqual(cfn.conditions.satisfiable_cache_info().currsize, 2)
+        self.assertTrue(
+            cfn.conditions.satisfiable({"IsProd": True}, {"Environment": "prod"})
+        )
+        self.assertEqual(cfn.conditions.satisfiable_cache_info().misses, 4)
@@ -0,0 +1,160 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import random
+
+import pytest
+from sympy import And, Not, Or, Symbol
+from sympy.assumptions.cnf import EncodedCNF
+from sympy.logic.boolalg import BooleanFalse, BooleanTrue
+from sympy.logic.inference import satisfiable
+
+from cfnlint.conditions._solver import HAS_PYSAT, DpllSolver, PySatSolver, Solver
+
+_backends = [
+    DpllSolver,
+    pytest.param(
+        PySatSolver,
+        marks=pytest.mark.skipif(not HAS_PYSAT, reason="python-sat not installed"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "name,clauses,assumptions,expected",
+    [
+        ("No clauses", [], [], True),
+        ("Unit clause", [[1]], [], True),
+        ("Conflicting units", [[1], [-1]], [], False),
+        ("Empty clause", [[]], [], False),
+        ("Tautology", [[1, -1]], [-1], True),
+        ("Assumption conflicts with unit", [[1]], [-1], False),
+        ("Propagation conflict", [[-1, 2], [-2, 3], [-3, -1]], [1], False),
+        ("Propagation", [[-1, 2], [-2, 3], [-3, -1]], [-1], True),
+        ("Backtracking", [[1, 2], [1, -2], [-1, 3], [-1, -3, 4], [-4, -3]], [], False),
+        ("Unknown assumption", [[1, 2]], [5], True),
+    ],
+)
+def test_dpll_solver(name, clauses, assumptions, expected):
+    solver = DpllSolver()
+    for clause in clauses:
+        solver.add_clause(clause)
+
+    assert solver.solve(assumptions) is expected, f"{name!r} test failed"
+    # solving again gives the same result as nothing is kept between solves
+    assert solver.solve(assumptions) is expected, f"{name!r} test failed"
+
+
+def test_dpll_solver_incremental():
+    solver = DpllSolver()
+    solver.add_clause([1, 2])
+    solver.add_clause([-1, 3])
+    assert solver.solve([-3]) is True
+    assert solver.solve([-3, -2]) is False
+
+    solver.add_clause([-2])
+    assert solver.solve() is True
+    assert solver.solve([-3]) is False
+
+
+def test_dpll_solver_temporary_clauses():
+    solver = DpllSolver()
+    solver.add_clause([1, 2])
+    assert solver.solve([-1], [[-2, 3], [-3]]) is False
+    assert solver.solve([-1], [[-2, 3], [3, -3]]) is True
+    assert solver.solve([], [[]]) is False
+    # the clauses don't apply to later solves
+    assert solver.solve([-1, -3]) is True
+    assert [sorted(clause) for clause in solver._clauses] == [[1, 2]]
+    assert solver._units == []
+    assert sum(len(clauses) for clauses in solver._watches.values()) == 2
+
+
+def _random_prop(symbols, rng, depth=0):
+    if depth > 2 or rng.random() < 0.3:
+        symbol = rng.choice(symbols)
+        return Not(symbol) if rng.random() < 0.5 else symbol
+    children = [_random_prop(symbols, rng, depth + 1) for _ in range(rng.randint(2, 3))]
+    return And(*children) if rng.random() < 0.5 else Or(*children)
+
+
+@pytest.mark.parametrize("backend", _backends)
+def test_solver_matches_sympy(backend):
+    rng = random.Random(42)
+    symbols = [Symbol(f"s{i}") for i in range(8)]
+    for _ in range(25):
+        cnf = EncodedCNF()
+        for _ in range(rng.randint(1, 6)):
+            cnf.add_prop(_random_prop(symbols, rng))
+        solver = Solver(cnf, backend())
+
+        for _ in range(10):
+            props = [_random_prop(symbols, rng) for _ in range(rng.randint(0, 3))]
+            expected = cnf.copy()
+            for prop in props:
+                expected.add_prop(prop)
+
+            assert solver.satisfiable(props) is bool(satisfiable(expected)), (
+                f"{props!r} against {cnf.data!r}"
+            )
+
+
+@pytest.mark.parametrize("backend", _backends)
+def test_solver_constants(backend):
+    cnf = EncodedCNF()
+    cnf.add_prop(Symbol("a"))
+    solver = Solver(cnf, backend())
+
+    assert solver.satisfiable([BooleanTrue()]) is True
+    assert solver.satisfiable([BooleanFalse()]) is False
+    assert solver.satisfiable([Not(Symbol("a"))]) is False
+    # symbols that aren't in the base CNF are unconstrained
+    assert solver.satisfiable([Symbol("b")]) is True
+    assert solver.satisfiable([Symbol("b"), Not(Symbol("b"))]) is False
+    # guarded clauses don't apply to later queries
+    assert (
+        solver.satisfiable([Or(Not(Symbol("a")), Symbol("b")), Not(Symbol("b"))])
+        is False
+    )
+    assert solver.satisfiable([Not(Symbol("b"))]) is True
+
+    cnf.add_prop(BooleanFalse())
+    assert Solver(cnf, backend()).satisfiable() is False
+
+
+def test_solver_queries_are_not_kept():
+    rng = random.Random(42)
+    symbols = [Symbol(f"s{i}") for i in range(8)]
+    cnf = EncodedCNF()
+    cnf.add_prop(Or(*symbols[:4]))
+    backend = DpllSolver()
+    solver = Solver(cnf, backend)
+    clauses = list(backend._clauses)
+    units = list(backend._units)
+
+    for _ in range(200):
+        solver.satisfiable([_random_prop(symbols, rng) for _ in range(3)])
+
+    assert backend._clauses == clauses
+    assert backend._units == units
+    assert backend._num_vars == len(symbols)
+    assert sum(len(watching) for watching in backend._watches.values()) == 2 * len(
+        clauses
+    )
+
+
+@pytest.mark.skipif(not HAS_PYSAT, reason="python-sat not installed")
+def test_pysat_solver_rebuilds_after_retired_guards():
+    backend = PySatSolver(max_retired=10)
+    solver = Solver(EncodedCNF(), backend)
+    a, b = Symbol("a"), Symbol("b")
+
+    for _ in range(25):
+        assert solver.satisfiable([Or(a, b), Not(a)]) is True
+        assert solver.satisfiable([Or(a, b), Not(a), Not(b)]) is False
+
+    assert backend._clauses == []
+    assert len(backend._retired) < 10
+    assert len(backend._guards) + len(backend._retired) <= 10
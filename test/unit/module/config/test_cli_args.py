@@ -130,6 +130,22 @@ class TestArgsParser(BaseTestCase):
         self.assertEqual(e.exception.code, 1)
         mock_print_help.assert_called_once()
 
+    def test_profile(self):
+        """Test the profile format defaults to a table"""
+
+        config = cfnlint.config.CliArgs(["-t", "template1.yaml"])
+        self.assertIsNone(config.cli_args.profile)
+        self.assertFalse(config.cli_args.profile_aggregate)
+
+        config = cfnlint.config.CliArgs(["--profile", "--", "template1.yaml"])
+        self.assertEqual(config.cli_args.profile, "table")
+
+        config = cfnlint.config.CliArgs(
+            ["--profile", "json", "--profile-aggregate", "--", "template1.yaml"]
+        )
+        self.assertEqual(config.cli_args.profile, "json")
+        self.assertTrue(config.cli_args.profile_aggregate)
+
     def test_exit_code_parameter(self):
         """Test values of exit code"""
 
@@ -5,6 +5,7 @@ SPDX-License-Identifier: MIT-0
 
 import logging
 import os
+import pickle
 from pathlib import Path
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
@@ -608,3 +609,51 @@ class TestConfigMixInValidation(BaseTestCase):
             config.validate()
         except ValueError:
             self.fail("validate() raised ValueError unexpectedly!")
+
+    def test_jobs(self):
+        """Test the number of jobs from each source"""
+        self.assertEqual(cfnlint.config.ConfigMixIn([]).jobs, 1)
+        self.assertEqual(cfnlint.config.ConfigMixIn(["--jobs", "4"]).jobs, 4)
+        self.assertEqual(cfnlint.config.ConfigMixIn(jobs=2).jobs, 2)
+        with patch("os.cpu_count", return_value=8):
+            self.assertEqual(cfnlint.config.ConfigMixIn(["-j", "0"]).jobs, 8)
+            self.assertEqual(cfnlint.config.ConfigMixIn(jobs=0).jobs, 8)
+
+    @patch("cfnlint.config.ConfigFileArgs._read_config", create=True)
+    def test_jobs_cli_zero_over_config_file(self, yaml_mock):
+        """Test zero jobs from the CLI wins over the config file"""
+        yaml_mock.side_effect = [{"jobs": 4}, {}]
+
+        with patch("os.cpu_count", return_value=8):
+            config = cfnlint.config.ConfigMixIn(["--jobs", "0", "template.yaml"])
+            self.assertEqual(config.jobs, 8)
+            config.validate()
+
+    def test_validate_negative_jobs(self):
+        """Test validation fails with a negative number of jobs"""
+        config = cfnlint.config.ConfigMixIn(templates=["template.yaml"], jobs=-1)
+
+        with self.assertRaises(ValueError) as context:
+            config.validate()
+
+        self.assertIn("Jobs must be zero or a positive number", str(context.exception))
+
+    def test_cache_dir(self):
+        """Test the cache directory from each source"""
+        self.assertIsNone(cfnlint.config.ConfigMixIn([]).cache_dir)
+        self.assertEqual(
+            cfnlint.config.ConfigMixIn(["--cache-dir", "cache"]).cache_dir, "cache"
+        )
+        self.assertEqual(
+            cfnlint.config.ConfigMixIn(cache_dir="cache").cache_dir, "cache"
+        )
+
+    def test_pickle(self):
+        """Test the config can be sent to another process"""
+        config = cfnlint.config.ConfigMixIn(["--regions", "us-west-2", "-j", "2"])
+
+        loaded = pickle.loads(pickle.dumps(config))
+
+        self.assertEqual(loaded, config)
+        self.assertEqual(loaded.jobs, 2)
+        self.assertIsNotNone(loaded.parser)
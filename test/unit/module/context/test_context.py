@@ -5,6 +5,7 @@ SPDX-License-Identifier: MIT-0
 
 import unittest
 from collections import deque
+from unittest.mock import patch
 
 from cfnlint.context import Context, Path
 from cfnlint.context.conditions._conditions import Condition, Conditions
@@ -159,3 +160,41 @@ class TestModuleNames(unittest.TestCase):
             resources={"MyBucket": Resource({"Type": "AWS::S3::Bucket"})}
         )
         self.assertEqual(replaced.module_names, ())
+
+
+class TestEvolve(unittest.TestCase):
+    def test_evolve_keeps_fields(self):
+        context = Context(regions=["us-west-2"], ref_values={"Foo": "Bar"})
+        evolved = context.evolve(functions=["Ref"], ref_values={"Bar": "Foo"})
+
+        self.assertEqual(evolved.regions, ["us-west-2"])
+        self.assertEqual(evolved.functions, ["Ref"])
+        self.assertEqual(evolved.ref_values, {"Foo": "Bar", "Bar": "Foo"})
+        self.assertEqual(context.ref_values, {"Foo": "Bar"})
+        self.assertEqual(
+            evolved, context.evolve(functions=["Ref"], ref_values={"Bar": "Foo"})
+        )
+
+    def test_evolve_unknown_field(self):
+        with self.assertRaises(TypeError):
+            Context().evolve(foo="bar")
+        with self.assertRaises(TypeError):
+            Path().evolve(foo="bar")
+
+    def test_evolve_skips_init(self):
+        # a context and its path are evolved for nearly every node that is
+        # validated so make sure the dataclass `__init__` isn't used
+        context = Context()
+        with (
+            patch.object(Context, "__init__") as context_init,
+            patch.object(Path, "__init__") as path_init,
+        ):
+            for i in range(100):
+                context = context.evolve(
+                    path=context.path.descend(path=i, cfn_path="Foo")
+                )
+
+        self.assertEqual(context_init.call_count, 0)
+        self.assertEqual(path_init.call_count, 0)
+        self.assertEqual(len(context.path.path), 100)
+        self.assertEqual(context.path.path[-1], 99)
@@ -5,6 +5,9 @@ SPDX-License-Identifier: MIT-0
 
 import json
 import logging
+import os
+import tempfile
+from test.testlib.templates import bucket_template
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
 
@@ -14,6 +17,7 @@ from yaml.scanner import ScannerError
 import cfnlint.decode.cfn_json
 import cfnlint.decode.cfn_yaml
 import cfnlint.decode.decode
+from cfnlint.decode.decode import _is_json_file
 
 
 class TestDecode(BaseTestCase):
@@ -142,3 +146,93 @@ class TestDecode(BaseTestCase):
     def test_decode_yaml_empty(self):
         template = cfnlint.decode.cfn_yaml.loads("")
         self.assertEqual(template, {})
+
+    def test_decode_json_skips_yaml(self):
+        filename = "test/fixtures/templates/quickstart/vpc.json"
+        with patch(
+            "cfnlint.decode.cfn_yaml.load", wraps=cfnlint.decode.cfn_yaml.load
+        ) as mock_cfn_yaml:
+            template, matches = cfnlint.decode.decode(filename)
+
+        self.assertListEqual(matches, [])
+        self.assertEqual(template, cfnlint.decode.cfn_yaml.load(filename))
+        mock_cfn_yaml.assert_not_called()
+
+    def test_decode_json_falls_back_to_yaml(self):
+        # tabs are read differently by the YAML decoder
+        filename = "test/fixtures/templates/quickstart/iam.json"
+        with patch(
+            "cfnlint.decode.cfn_yaml.load", wraps=cfnlint.decode.cfn_yaml.load
+        ) as mock_cfn_yaml:
+            template, matches = cfnlint.decode.decode(filename)
+
+        self.assertListEqual(matches, [])
+        self.assertIsNotNone(template)
+        mock_cfn_yaml.assert_called_once_with(filename)
+
+    def test_decode_json_errors_from_yaml(self):
+        _, matches = cfnlint.decode.decode_str('{"a": 1, "a": 2}')
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(matches[0].message, "Duplicate found 'a' (line 1)")
+
+        _, matches = cfnlint.decode.decode_str('{"a": "b"')
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].rule.id, "E0000")
+
+    def test_decode_str_sniffs_json(self):
+        with patch(
+            "cfnlint.decode.cfn_yaml.loads", wraps=cfnlint.decode.cfn_yaml.loads
+        ) as mock_cfn_yaml:
+            template, _ = cfnlint.decode.decode_str('\n  {"a": "b"}')
+            self.assertEqual(template, {"a": "b"})
+            mock_cfn_yaml.assert_not_called()
+
+            template, _ = cfnlint.decode.decode_str("a: b")
+            self.assertEqual(template, {"a": "b"})
+            mock_cfn_yaml.assert_called_once()
+
+    def test_is_json_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, content, expected in [
+                ("template.json", "a: b", True),
+                ("template.yaml", '{"a": "b"}', False),
+                ("template.YML", '{"a": "b"}', False),
+                ("template.template", '\n\n  {"a": "b"}', True),
+                ("template.template", "# comment\n{}", False),
+                ("template", " " * 5000 + "[]", True),
+                ("template", "   ", False),
+            ]:
+                with self.subTest(name=name, content=content):
+                    filename = os.path.join(directory, name)
+                    with open(filename, "w", encoding="utf-8") as f:
+                        f.write(content)
+                    self.assertEqual(_is_json_file(filename), expected)
+
+        self.assertFalse(_is_json_file(None))
+        self.assertFalse(_is_json_file("missing.template"))
+
+    def test_decode_json_generated_template_skips_yaml(self):
+        # a generated JSON template is decoded without the YAML decoder
+        # so count that the YAML constructor isn't used
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "template.json")
+            content = json.dumps(bucket_template(50), indent=2)
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(content)
+
+            with patch.object(
+                cfnlint.decode.cfn_yaml.NodeConstructor,
+                "construct_yaml_map",
+                autospec=True,
+            ) as mock_construct_yaml_map:
+                template, matches = cfnlint.decode.decode(filename)
+
+        self.assertListEqual(matches, [])
+        mock_construct_yaml_map.assert_not_called()
+        self.assertEqual(len(template["Resources"]), 50)
+        bucket = template["Resources"]["Bucket49"]
+        start = content.index('"Bucket49": {') + len('"Bucket49": ')
+        self.assertEqual(
+            (bucket.start_mark.line, bucket.start_mark.column),
+            (content.count("\n", 0, start), start - content.rfind("\n", 0, start) - 1),
+        )
@@ -0,0 +1,31 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import pickle
+
+from cfnlint.decode.mark import Mark
+from cfnlint.decode.node import dict_node, list_node, str_node
+
+
+def test_pickle_nodes():
+    key = str_node("Key", Mark(2, 3), Mark(2, 6))
+    obj = dict_node(
+        {key: list_node([str_node("Value", Mark(3, 5), Mark(3, 10))], Mark(3, 3))},
+        Mark(1, 1),
+        Mark(4, 1),
+    )
+
+    loaded = pickle.loads(pickle.dumps(obj))
+
+    assert loaded == {"Key": ["Value"]}
+    assert isinstance(loaded, dict_node)
+    assert (loaded.start_mark, loaded.end_mark) == (Mark(1, 1), Mark(4, 1))
+    (loaded_key,) = loaded.keys()
+    assert isinstance(loaded_key, str_node)
+    assert loaded_key.start_mark == Mark(2, 3)
+    assert isinstance(loaded["Key"], list_node)
+    assert loaded["Key"].start_mark == Mark(3, 3)
+    assert isinstance(loaded["Key"][0], str_node)
+    assert loaded["Key"][0].end_mark == Mark(3, 10)
@@ -238,3 +238,37 @@ def test_raw_pseudo_parameter_with_dynamic_references_disabled(template):
     assert len(results) == 1
     assert results[0][0] == "AWS::NoValue"
     assert results[0][1] == {"rawPseudoParameter": schema}
+
+
+def test_filter_schemas_cached_per_path(template):
+    filter = FunctionFilter()
+
+    context = create_context_for_template(template)
+    schema = {"type": "string", "required": ["Foo"]}
+    validator = CfnTemplateValidator(
+        context=context,
+        cfn=template,
+        schema=schema,
+    )
+
+    def _path(*path):
+        return validator.evolve(
+            context=validator.context.evolve(
+                path=Path(deque(path), cfn_path=deque(path)),
+            )
+        )
+
+    foo = filter._filter_schemas(schema, _path("Resources", "Foo"))
+    assert foo == (
+        {"type": "string", "cfnLint": ["Resources/Foo"]},
+        {"required": ["Foo"]},
+    )
+    assert filter._filter_schemas(schema, _path("Resources", "Foo")) is foo
+
+    bar = filter._filter_schemas(schema, _path("Resources", "Bar"))
+    assert bar[0]["cfnLint"] == ["Resources/Bar"]
+
+    no_keyword = FunctionFilter(add_cfn_lint_keyword=False)._filter_schemas(
+        schema, _path("Resources", "Foo")
+    )
+    assert no_keyword == ({"type": "string"}, {"required": ["Foo"]})
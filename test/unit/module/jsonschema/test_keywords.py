@@ -4,6 +4,7 @@ SPDX-License-Identifier: MIT-0
 """
 
 from collections import deque
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
@@ -385,3 +386,63 @@ def test_if_unknown(name, instance, schema, expected_unknown, validator_unresolv
         assert errs[0].unknown is True, f"{name}: expected unknown=True"
     else:
         assert len(errs) == 0, f"{name}: expected 0 errors, got {len(errs)}"
+
+
+@pytest.mark.parametrize(
+    "name,instance,schema,expected",
+    [
+        ("Maximum", "11", {"maximum": 10}, ["'11' is greater than the maximum of 10"]),
+        ("Minimum", 1.5, {"minimum": 2}, ["1.5 is less than the minimum of 2"]),
+        (
+            "Exclusive maximum",
+            "10",
+            {"exclusiveMaximum": 10},
+            ["'10' is greater than or equal to the maximum of 10"],
+        ),
+        (
+            "Exclusive minimum",
+            2,
+            {"exclusiveMinimum": 2},
+            ["2 is less than or equal to the minimum of 2"],
+        ),
+        ("Multiple of", "7", {"multipleOf": 2}, ["'7' is not a multiple of 2"]),
+        (
+            "Multiple of float",
+            0.3,
+            {"multipleOf": 0.2},
+            ["0.3 is not a multiple of 0.2"],
+        ),
+        ("Not a number string", "foo", {"maximum": 1, "minimum": 2}, []),
+        ("Boolean", True, {"maximum": 0}, []),
+        ("Object", {"a": 1}, {"maximum": 0, "multipleOf": 2}, []),
+    ],
+)
+def test_numeric_keywords(name, instance, schema, validator, expected):
+    errs = list(validator.evolve(schema=schema).iter_errors(instance))
+    assert [err.message for err in errs] == expected, f"{name!r} test failed"
+
+
+def test_numeric_keywords_convert_once(validator):
+    # each numeric keyword used to convert strings again so count the
+    # conversions for the same values
+    class _Str(str):
+        conversions = 0
+
+        def __float__(self):
+            _Str.conversions += 1
+            return float(str(self))
+
+    schema = {
+        "maximum": 100,
+        "minimum": 0,
+        "exclusiveMaximum": 101,
+        "exclusiveMinimum": -1,
+        "multipleOf": 1,
+    }
+    instances = [_Str(i % 50) for i in range(200)] + [{"a": [1, 2, 3]}] * 10
+    with mock.patch.dict(_keywords._numbers, clear=True):
+        for instance in instances:
+            for k, v in schema.items():
+                assert list(getattr(_keywords, k)(validator, v, instance, {})) == []
+
+    assert _Str.conversions == 50
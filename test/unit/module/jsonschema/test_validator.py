@@ -1252,3 +1252,70 @@ def test_messages(name, schema, instance, expected, validator):
     validator = validator.evolve(schema=schema)
     errs = list(validator.iter_errors(instance))
     assert sorted(errs) == sorted(expected), f"{name!r} returned {errs!r}"
+
+
+def test_extend_reuses_class(validator):
+    assert validator.extend(validators={"fail": fail}) is validator.extend(
+        validators={"fail": fail}
+    )
+    assert validator.extend(validators={"fail": fail}) is not validator.extend(
+        validators={"fail": None}
+    )
+
+
+def test_plan_reused_for_same_schema(validator):
+    schema = {"fail": [{"message": "Failed"}], "description": "foo"}
+    plan = validator._plan(schema)
+    assert [k for k, _, _, _ in plan] == ["fail"]
+    assert validator._plan(schema) is plan
+
+    # a schema that changed keywords is compiled again
+    schema["type"] = "string"
+    assert [k for k, _, _, _ in validator._plan(schema)] == ["fail", "type"]
+
+
+def test_plan_skips_disabled_validators(validator):
+    validator = validator.extend(validators={"fail": None})({})
+    assert validator._plan({"fail": [{}], "type": "string"}) == (
+        ("type", "string", validator.validators["type"], None),
+    )
+    assert list(validator.evolve(schema={"fail": [{}]}).iter_errors("foo")) == []
+
+
+def test_plan_custom_message(validator):
+    validator = validator.evolve(
+        schema={"fail": [{}], "message": {"fail": "Custom message"}}
+    )
+    errs = list(validator.iter_errors("foo"))
+    errs_again = list(validator.iter_errors("foo"))
+    assert [err.message for err in errs] == ["Custom message"]
+    assert [err.message for err in errs_again] == ["Custom message"]
+
+
+def test_evolve(validator):
+    evolved = validator.evolve(schema={"type": "string"})
+    assert evolved.schema == {"type": "string"}
+    assert evolved.context is validator.context
+    assert evolved.resolver is validator.resolver
+    assert evolved.cfn is validator.cfn
+    assert validator.schema == {}
+
+    # a missing context or resolver is created again
+    evolved = validator.evolve(context=None, resolver=None)
+    assert evolved.context == validator.cfn.context
+    assert evolved.resolver is not None
+
+    with pytest.raises(TypeError):
+        validator.evolve(foo="bar")
+
+
+def test_evolve_skips_init(validator):
+    # validators are evolved for nearly every node that is validated so
+    # make sure the dataclass `__init__` isn't used
+    cls = type(validator)
+    with patch.object(cls, "__init__") as init:
+        for _ in range(100):
+            validator = validator.evolve(schema={"type": "string"})
+
+    assert init.call_count == 0
+    assert validator.schema == {"type": "string"}
@@ -5,9 +5,11 @@ SPDX-License-Identifier: MIT-0
 
 import json
 import logging
+import os
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
 
+import cfnlint.data.AdditionalSpecs
 import cfnlint.maintenance
 
 LOGGER = logging.getLogger("cfnlint.maintenance")
@@ -19,7 +21,8 @@ class TestUpdateIamPolicies(BaseTestCase):
 
     @patch("cfnlint.maintenance.get_url_content")
     @patch("cfnlint.maintenance.json.dump")
-    def test_update_iam_policies(self, mock_json_dump, mock_content):
+    @patch("cfnlint.rules.helpers.policies.compile_policy_store")
+    def test_update_iam_policies(self, mock_compile, mock_json_dump, mock_content):
         """Success update iam policies"""
 
         services = [
@@ -97,3 +100,14 @@ class TestUpdateIamPolicies(BaseTestCase):
                 separators=(",", ": "),
                 sort_keys=True,
             )
+            mock_compile.assert_called_once_with(
+                mock_json_dump.call_args.args[0],
+                os.path.join(
+                    os.path.dirname(cfnlint.data.AdditionalSpecs.__file__),
+                    "Policies.bin",
+                ),
+                os.path.join(
+                    os.path.dirname(cfnlint.data.AdditionalSpecs.__file__),
+                    "Policies.json",
+                ),
+            )
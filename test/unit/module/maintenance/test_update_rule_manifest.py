@@ -0,0 +1,38 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import logging
+import os
+from test.testlib.testcase import BaseTestCase
+from unittest.mock import mock_open, patch
+
+import cfnlint.maintenance
+
+LOGGER = logging.getLogger("cfnlint.maintenance")
+LOGGER.addHandler(logging.NullHandler())
+
+
+class TestUpdateRuleManifest(BaseTestCase):
+    """Used for Testing Updating the Rule Manifest"""
+
+    @patch("cfnlint.rules._manifest.build")
+    @patch("cfnlint.maintenance.json.dump")
+    def test_update_rule_manifest(self, mock_json_dump, mock_build):
+        mock_build.return_value = {"modules": {}, "rules": []}
+
+        with patch("builtins.open", mock_open()) as mock_builtin_open:
+            cfnlint.maintenance.update_rule_manifest()
+
+        self.assertTrue(
+            mock_builtin_open.call_args[0][0].endswith(
+                os.path.join("Rules", "manifest.json")
+            )
+        )
+        mock_json_dump.assert_called_once_with(
+            {"modules": {}, "rules": []},
+            mock_builtin_open.return_value,
+            indent=1,
+            sort_keys=True,
+        )
@@ -0,0 +1,142 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import glob
+import os
+from unittest.mock import patch
+
+import pytest
+
+import cfnlint.data.Rules
+from cfnlint.config import _DEFAULT_RULESDIR, ConfigMixIn
+from cfnlint.exceptions import DuplicateRuleError
+from cfnlint.helpers import load_resource
+from cfnlint.rules import Rules
+from cfnlint.rules._manifest import MANIFEST_FILENAME, RuleManifest, build
+from cfnlint.runner.template import run_template_by_file_path
+
+
+def _eager_rules() -> Rules:
+    with patch.object(RuleManifest, "load", return_value=None):
+        return Rules.create_from_directory(_DEFAULT_RULESDIR)
+
+
+def _match_values(matches):
+    return sorted((m.linenumber, m.columnnumber, m.rule.id, m.message) for m in matches)
+
+
+def test_manifest_is_up_to_date():
+    # run `cfn-lint --update-documentation` after changing a rule
+    assert build() == load_resource(cfnlint.data.Rules, MANIFEST_FILENAME)
+
+
+def test_rules_are_not_imported_until_needed():
+    rules = Rules.create_from_directory(_DEFAULT_RULESDIR)
+    eager = _eager_rules()
+
+    assert len(rules.data) == 0
+    assert len(rules) == len(eager)
+    assert sorted(rules) == sorted(eager)
+    assert repr(rules) == repr(eager)
+    assert "E3012" in rules
+    assert "E9999" not in rules
+    assert rules.is_rule_enabled("E3012", ConfigMixIn([]))
+    assert not rules.is_rule_enabled("I3011", ConfigMixIn([]))
+    assert len(rules.data) == 0
+
+    assert rules["E3012"].id == "E3012"
+    assert list(rules.data) == ["E3012"]
+    with pytest.raises(KeyError):
+        rules["E9999"]
+
+
+def test_rules_update_keeps_rules_lazy():
+    rules = Rules()
+    rules.update(Rules.create_from_directory(_DEFAULT_RULESDIR))
+
+    assert len(rules.data) == 0
+    assert "E3012" in rules
+    with pytest.raises(DuplicateRuleError):
+        rules.update(Rules.create_from_directory(_DEFAULT_RULESDIR))
+
+
+def test_out_of_date_manifest_imports_every_rule():
+    with patch("cfnlint.rules._manifest._module_digests", return_value={}):
+        rules = Rules.create_from_directory(_DEFAULT_RULESDIR)
+
+    assert len(rules.data) == len(rules)
+
+
+def test_single_rule_run_imports_fewer_rules():
+    # the disabled rules without child rules that no other rule invokes
+    # aren't imported
+    filename = "test/fixtures/templates/bad/generic.yaml"
+    config = ConfigMixIn(["--ignore-checks", "E", "W", "--mandatory-checks", "E3012"])
+    rules = Rules.create_from_directory(_DEFAULT_RULESDIR)
+    eager = _eager_rules()
+
+    matches = list(run_template_by_file_path(filename, config, rules, False))
+
+    assert _match_values(matches) == _match_values(
+        run_template_by_file_path(filename, config, eager, False)
+    )
+    assert {match.rule.id for match in matches} == {"E3012"}
+    assert len(rules.data) < len(rules)
+
+
+def test_disabled_child_rules_are_invoked(tmp_path):
+    # E3028 and E3009 are disabled but they are the only rules that
+    # validate the Fn::Sub in the metadata
+    filename = tmp_path / "template.yaml"
+    filename.write_text(
+        "Resources:\n"
+        "  Instance:\n"
+        "    Type: AWS::EC2::Instance\n"
+        "    Metadata:\n"
+        "      AWS::CloudFormation::Init:\n"
+        "        config:\n"
+        "          files:\n"
+        "            /tmp/file:\n"
+        "              content: !Sub no variables\n"
+        "    Properties:\n"
+        "      ImageId: ami-12345678\n"
+    )
+    config = ConfigMixIn(["--ignore-checks", "E3"])
+    rules = Rules.create_from_directory(_DEFAULT_RULESDIR)
+
+    matches = list(run_template_by_file_path(str(filename), config, rules, False))
+
+    assert [match.rule.id for match in matches] == ["W1020"]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--ignore-checks", "E3"],
+        ["--ignore-checks", "E1", "W", "--include-checks", "I"],
+    ],
+)
+def test_lazy_run_matches_eager_run(args):
+    # disabled child rules are still invoked by their parents and can
+    # report matches for the enabled rules. Disabled rules that aren't
+    # imported can't fail with E0002 so those matches aren't compared.
+    config = ConfigMixIn(args)
+    rules = Rules.create_from_directory(_DEFAULT_RULESDIR)
+    eager = _eager_rules()
+
+    def _values(filename, rules):
+        return _match_values(
+            match
+            for match in run_template_by_file_path(filename, config, rules, True)
+            if match.rule.id != "E0002"
+        )
+
+    for filename in sorted(
+        glob.glob("test/fixtures/templates/bad/**/*.yaml", recursive=True)
+    ):
+        # the generated templates at the limits are slow to lint twice
+        if os.path.basename(filename).startswith("limit_"):
+            continue
+        assert _values(filename, rules) == _values(filename, eager), filename
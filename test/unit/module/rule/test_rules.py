@@ -10,6 +10,7 @@ from cfnlint.decode.mark import Mark
 from cfnlint.decode.node import dict_node
 from cfnlint.exceptions import DuplicateRuleError
 from cfnlint.rules import CloudFormationLintRule, Match, RuleMatch, Rules
+from cfnlint.rules._rules import ResourceDispatchInfo
 from cfnlint.rules.errors import RuleError
 
 
@@ -78,6 +79,35 @@ class RuleParent(CloudFormationLintRule):
         return [RuleMatch([], "Parent Rule")] + self.child_rules["ECCCC"].validate(cfn)
 
 
+class RuleResourceType(CloudFormationLintRule):
+    id = "ERRRR"
+    shortdesc = "Resource Rule"
+    description = "Resource Rule"
+    source_url = "https://github.com/aws-cloudformation/cfn-lint/"
+    tags = ["resources"]
+
+    def __init__(self, id, resource_types) -> None:
+        super().__init__()
+        self.id = id
+        self.resource_property_types = resource_types
+
+    def match_resource_properties(self, properties, resourcetype, path, cfn):
+        return [RuleMatch(path, f"{self.id} {resourcetype}")]
+
+
+class RuleAllResources(CloudFormationLintRule):
+    id = "EAAAA"
+    shortdesc = "All Resources Rule"
+    description = "All Resources Rule"
+    source_url = "https://github.com/aws-cloudformation/cfn-lint/"
+    tags = ["resources"]
+
+    def matchall_resource_properties(
+        self, filename, cfn, resource_properties, property_type, path
+    ):
+        yield Match(filename=filename, rule=self, message=f"All {property_type}")
+
+
 class TestRules(BaseTestCase):
     """Test CloudFormation Rules"""
 
@@ -169,6 +199,47 @@ class TestRules(BaseTestCase):
             matches,
         )
 
+    def test_resource_property_dispatch(self):
+        rules = Rules()
+        rules.extend(
+            [
+                RuleResourceType("E0001", ["AWS::S3::Bucket"]),
+                RuleResourceType("E0002", ["AWS::EC2::*"]),
+                RuleResourceType("E0003", ["AWS::Lambda::Function"]),
+                RuleAllResources(),
+            ]
+        )
+
+        cfn = Template(
+            "-",
+            {
+                "Resources": {
+                    "Bucket": {"Type": "AWS::S3::Bucket", "Properties": {}},
+                    "Vpc": {"Type": "AWS::EC2::VPC", "Properties": {}},
+                    "Subnet": {"Type": "AWS::EC2::Subnet", "Properties": {}},
+                    "NoProperties": {"Type": "AWS::S3::Bucket"},
+                }
+            },
+            regions=["us-east-1"],
+        )
+
+        matches = list(rules.run("-", cfn, ConfigMixIn([])))
+        self.assertListEqual(
+            [match.message for match in matches],
+            [
+                "E0001 AWS::S3::Bucket",
+                "All AWS::S3::Bucket",
+                "E0002 AWS::EC2::VPC",
+                "All AWS::EC2::VPC",
+                "E0002 AWS::EC2::Subnet",
+                "All AWS::EC2::Subnet",
+            ],
+        )
+        self.assertEqual(
+            rules.resource_dispatch_info(),
+            ResourceDispatchInfo(invoked=6, skipped=6),
+        )
+
     def test_rule_deletion(self):
         rules = Rules()
         rules.extend([Rule()])
@@ -0,0 +1,369 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import cfnlint.decode as decode_module
+from cfnlint.config import ConfigMixIn
+from cfnlint.jsonschema._keywords import patternProperties
+from cfnlint.runner import Runner
+from cfnlint.runner.template import run_template_by_file_path
+from cfnlint.runner.template.cache import IncrementalCache, ResultCache
+
+_TEMPLATE = Path("test/fixtures/templates/bad/generic.yaml")
+
+
+def _match_values(matches):
+    return sorted(
+        (
+            match.filename,
+            match.linenumber,
+            match.columnnumber,
+            match.linenumberend,
+            match.columnnumberend,
+            match.rule.id,
+            match.message,
+            match.id,
+            getattr(match, "path_string", None),
+        )
+        for match in matches
+    )
+
+
+def _lint(runner, filename):
+    return list(
+        run_template_by_file_path(str(filename), runner.config, runner.rules, False)
+    )
+
+
+def _caches(monkeypatch):
+    caches = []
+    create = IncrementalCache.create
+
+    def _create(*args, **kwargs):
+        cache = create(*args, **kwargs)
+        caches.append(cache)
+        return cache
+
+    monkeypatch.setattr(IncrementalCache, "create", _create)
+    return caches
+
+
+def test_incremental_matches_full_run(tmp_path, monkeypatch):
+    filename = tmp_path / "template.yaml"
+    content = _TEMPLATE.read_text()
+    filename.write_text(content)
+
+    full = Runner(ConfigMixIn([]))
+    incremental = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+    caches = _caches(monkeypatch)
+
+    expected = _match_values(_lint(full, filename))
+    assert _match_values(_lint(incremental, filename)) == expected
+    assert caches[-1].reused == frozenset()
+
+    # move every resource down and change one of them
+    filename.write_text(
+        "# a comment\n\n"
+        + content.replace("KeyName: 1\n", "KeyName: 1\n      Monitoring: 1\n")
+    )
+    expected = _match_values(_lint(full, filename))
+    assert _match_values(_lint(incremental, filename)) == expected
+    assert "MyEC2Instance" not in caches[-1].reused
+    assert "myIamProfile" in caches[-1].reused
+
+    # nothing changed and the results of the whole template are gone
+    shutil.rmtree(tmp_path / "cache" / "results")
+    assert _match_values(_lint(incremental, filename)) == expected
+    assert len(caches[-1].reused) == len(caches[-1]._keys)
+
+
+def test_incremental_related_resources(tmp_path, monkeypatch):
+    filename = tmp_path / "template.yaml"
+    template = """
+Parameters:
+  Cidr:
+    Type: String
+Resources:
+  Vpc:
+    Type: AWS::EC2::VPC
+    Properties:
+      CidrBlock: 10.0.0.0/16
+  Subnet:
+    Type: AWS::EC2::Subnet
+    Properties:
+      VpcId: !Ref Vpc
+      CidrBlock: {cidr}
+  Bucket:
+    Type: AWS::S3::Bucket
+"""
+    filename.write_text(template.format(cidr="10.0.0.0/24"))
+
+    incremental = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+    caches = _caches(monkeypatch)
+    _lint(incremental, filename)
+
+    filename.write_text(template.format(cidr="10.1.0.0/24"))
+    matches = _lint(incremental, filename)
+
+    # the VPC checks the CIDR of its subnets
+    assert caches[-1].reused == frozenset(["Bucket"])
+    assert _match_values(matches) == _match_values(
+        _lint(Runner(ConfigMixIn([])), filename)
+    )
+
+
+def test_incremental_unrelated_resources(tmp_path, monkeypatch):
+    filename = tmp_path / "template.yaml"
+    template = """
+Resources:
+  Project1:
+    Type: AWS::CodeBuild::Project
+    Properties:
+      Name: project1
+      Artifacts:
+        Type: NO_ARTIFACTS
+      Environment:
+        ComputeType: BUILD_GENERAL1_SMALL
+        Image: aws/codebuild/standard:7.0
+        Type: LINUX_CONTAINER
+      ServiceRole: arn:aws:iam::123456789012:role/codebuild
+      Source:
+        Type: NO_SOURCE
+        BuildSpec: buildspec.yaml
+  Project2:
+    Type: AWS::CodeBuild::Project
+    Properties:
+      Name: {name}
+      Artifacts:
+        Type: NO_ARTIFACTS
+      Environment:
+        ComputeType: BUILD_GENERAL1_SMALL
+        Image: aws/codebuild/standard:7.0
+        Type: LINUX_CONTAINER
+      ServiceRole: arn:aws:iam::123456789012:role/codebuild
+      Source:
+        Type: NO_SOURCE
+        BuildSpec: buildspec.yaml
+"""
+    full = Runner(ConfigMixIn([]))
+    incremental = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+    caches = _caches(monkeypatch)
+
+    # E3019 compares the names of resources that don't reference each other
+    for name, expected, reused in [
+        ("project2", [], []),
+        ("project1", ["E3019", "E3019"], ["Project1"]),
+        ("project3", [], ["Project1"]),
+    ]:
+        filename.write_text(template.format(name=name))
+        matches = _lint(incremental, filename)
+
+        assert sorted(match.rule.id for match in matches) == expected
+        assert caches[-1].reused == frozenset(reused)
+        assert _match_values(matches) == _match_values(_lint(full, filename))
+
+
+def test_incremental_nested_stack(tmp_path, monkeypatch):
+    filename = tmp_path / "template.yaml"
+    filename.write_text("""
+Resources:
+  Stack:
+    Type: AWS::CloudFormation::Stack
+    Properties:
+      TemplateURL: nested.yaml
+      Parameters:
+        Name: name
+  Bucket:
+    Type: AWS::S3::Bucket
+""")
+    nested = tmp_path / "nested.yaml"
+    nested.write_text("Parameters:\n  Name:\n    Type: String\nResources: {}\n")
+
+    incremental = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+    caches = _caches(monkeypatch)
+    assert [match.rule.id for match in _lint(incremental, filename)] == ["W3002"]
+
+    # the parameter was renamed in the nested template
+    nested.write_text(nested.read_text().replace("Name:", "Other:"))
+    matches = _lint(incremental, filename)
+
+    assert caches[-1].reused == frozenset(["Bucket"])
+    assert sorted(match.rule.id for match in matches) == ["E3043", "E3043", "W3002"]
+
+
+def test_incremental_unchanged_template(tmp_path):
+    # a second run of an unchanged template doesn't check any resources
+    filename = tmp_path / "template.yaml"
+    filename.write_text(_TEMPLATE.read_text())
+    runner = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+
+    # rules are loaded from their files so patch the globals of E3001
+    rule_globals = type(runner.rules["E3001"])._pattern_properties.__globals__
+    checked = []
+    for _ in range(2):
+        shutil.rmtree(tmp_path / "cache" / "results", ignore_errors=True)
+        pattern_properties = MagicMock(wraps=patternProperties)
+        with patch.dict(rule_globals, {"patternProperties": pattern_properties}):
+            _lint(runner, filename)
+        checked.append(
+            sum(len(call.args[2]) for call in pattern_properties.call_args_list)
+        )
+
+    assert checked[0] > 0
+    assert checked[1] == 0
+    assert runner.rules.resource_dispatch_info().invoked == 0
+
+
+def test_incremental_not_used(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    runner = Runner(ConfigMixIn(["--cache-dir", str(cache_dir)]))
+    caches = _caches(monkeypatch)
+
+    # the resources change during the transform
+    _lint(runner, "test/fixtures/templates/good/transform/list_transform.yaml")
+    assert caches == [None]
+    assert not (cache_dir / "incremental").exists()
+
+
+def test_incremental_unreadable_cache(tmp_path, monkeypatch):
+    filename = tmp_path / "template.yaml"
+    filename.write_text(_TEMPLATE.read_text())
+    cache_dir = tmp_path / "cache"
+    runner = Runner(ConfigMixIn(["--cache-dir", str(cache_dir)]))
+    caches = _caches(monkeypatch)
+
+    expected = _match_values(_lint(runner, filename))
+    (cache_file,) = (cache_dir / "incremental").iterdir()
+    cache_file.write_text("{")
+    shutil.rmtree(cache_dir / "results")
+
+    assert _match_values(_lint(runner, filename)) == expected
+    assert caches[-1].reused == frozenset()
+    assert os.listdir(cache_dir / "incremental") == [cache_file.name]
+
+
+def test_results_shared_between_templates(tmp_path):
+    content = _TEMPLATE.read_text()
+    filenames = []
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        filenames.append(tmp_path / directory / "template.yaml")
+        filenames[-1].write_text(content)
+    runner = Runner(ConfigMixIn(["--cache-dir", str(tmp_path / "cache")]))
+
+    expected = _match_values(_lint(Runner(ConfigMixIn([])), filenames[1]))
+    _lint(runner, filenames[0])
+    with patch("cfnlint.runner.template.runner.decode") as decode:
+        matches = _lint(runner, filenames[1])
+
+    # the template is neither decoded nor checked again
+    decode.assert_not_called()
+    assert _match_values(matches) == expected
+    assert len(os.listdir(tmp_path / "cache" / "results")) == 2
+
+
+def test_results_not_reused(tmp_path):
+    filename = tmp_path / "template.yaml"
+    filename.write_text("""
+Resources:
+  Stack:
+    Type: AWS::CloudFormation::Stack
+    Properties:
+      TemplateURL: nested.yaml
+      Parameters:
+        Name: name
+""")
+    nested = tmp_path / "nested.yaml"
+    nested.write_text("Parameters:\n  Name:\n    Type: String\nResources: {}\n")
+    cache_dir = str(tmp_path / "cache")
+    runner = Runner(ConfigMixIn(["--cache-dir", cache_dir]))
+    _lint(runner, filename)
+
+    # the nested template changed
+    nested.write_text(nested.read_text().replace("Name:", "Other:"))
+    assert "E3043" in [match.rule.id for match in _lint(runner, filename)]
+
+    # the configuration changed
+    other = Runner(ConfigMixIn(["--cache-dir", cache_dir, "--ignore-checks", "E3043"]))
+    assert "E3043" not in [match.rule.id for match in _lint(other, filename)]
+
+    # templates that can't be parsed aren't kept
+    filename.write_text("Resources: [")
+    for _ in range(2):
+        with patch(
+            "cfnlint.runner.template.runner.decode", wraps=decode_module.decode
+        ) as decode:
+            assert [match.rule.id for match in _lint(runner, filename)] == ["E0000"]
+        decode.assert_called_once()
+
+
+def test_results_eviction(tmp_path):
+    rules = Runner(ConfigMixIn([])).rules
+    directory = tmp_path / "results"
+
+    def _save(key, max_entries=2, max_bytes=1024):
+        cache = ResultCache(
+            str(directory), "template.yaml", key, rules, max_entries, max_bytes
+        )
+        list(cache.run(iter([]), {}))
+        return cache
+
+    first = _save("first")
+    _save("second")
+    os.utime(directory / "first.json", (1, 1))
+    os.utime(directory / "second.json", (2, 2))
+
+    # the first template is used so the second is the least recently used
+    assert first.get() == []
+    _save("third")
+    assert sorted(os.listdir(directory)) == [".lock", "first.json", "third.json"]
+
+    size = (directory / "third.json").stat().st_size
+    _save("fourth", max_bytes=size * 2)
+    assert len(os.listdir(directory)) == 3
+
+
+def test_results_rule_files_changed(tmp_path):
+    filename = tmp_path / "template.yaml"
+    filename.write_text(
+        "Resources:\n"
+        "  Bucket:\n"
+        "    Type: AWS::S3::Bucket\n"
+        "    Properties:\n"
+        "      BucketName: a\n"
+    )
+    custom_rules = tmp_path / "custom.txt"
+    custom_rules.write_text('AWS::S3::Bucket BucketName EQUALS "a" WARN\n')
+    args = ["--cache-dir", str(tmp_path / "cache"), "--custom-rules", str(custom_rules)]
+    assert "W9001" not in [
+        m.rule.id for m in _lint(Runner(ConfigMixIn(args)), filename)
+    ]
+
+    # the custom rules are read again by the next run
+    custom_rules.write_text('AWS::S3::Bucket BucketName EQUALS "b" WARN\n')
+    assert "W9001" in [m.rule.id for m in _lint(Runner(ConfigMixIn(args)), filename)]
+
+
+def test_results_used_rules(tmp_path):
+    # the rules aren't run for a template that isn't an object
+    filename = tmp_path / "template.yaml"
+    filename.write_text("- Resources\n")
+    cache_dir = tmp_path / "cache"
+    runner = Runner(ConfigMixIn(["--cache-dir", str(cache_dir)]))
+    _lint(runner, _TEMPLATE)
+    used_rules = set(runner.rules.used_rules)
+    _lint(runner, filename)
+
+    # only the rules used by the template are kept with its results
+    cache = ResultCache.create(str(filename), runner.config, runner.rules, False)
+    with open(cache._path, encoding="utf-8") as f:
+        assert json.load(f)["used_rules"] == []
+    assert used_rules
+    assert set(runner.rules.used_rules) == used_rules
@@ -0,0 +1,77 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from unittest.mock import patch
+
+from cfnlint.match import Match
+from cfnlint.rules import CloudFormationLintRule, RuleMatch
+from cfnlint.runner.template.runner import _dedup
+
+
+class _Rule(CloudFormationLintRule):
+    id = "W3005"
+    shortdesc = "Test rule"
+
+
+class _OtherRule(CloudFormationLintRule):
+    id = "E3005"
+    shortdesc = "Other test rule"
+
+
+def _match(line: int, rule=None, message="Obsolete DependsOn") -> Match:
+    return Match.create(
+        message=message,
+        filename="template.yaml",
+        rule=rule or _Rule(),
+        linenumber=line,
+    )
+
+
+def test_match_hash_and_eq():
+    assert _match(1) == _match(1)
+    assert hash(_match(1)) == hash(_match(1))
+    # rules are compared by id
+    assert _match(1, _Rule()) == _match(1, _Rule())
+    assert _match(1) != _match(2)
+    assert _match(1) != _match(1, _OtherRule())
+    assert _match(1) != _match(1, message="Other")
+    assert len({_match(1), _match(1), _match(2)}) == 2
+
+
+def test_rule_match_hash_and_eq():
+    assert RuleMatch(["Resources", "A"], "Message") == RuleMatch(
+        ["Resources", "A"], "Message"
+    )
+    assert hash(RuleMatch(["Resources", "A"], "Message")) == hash(
+        RuleMatch(("Resources", "A"), "Message")
+    )
+    assert RuleMatch(["Resources", "A"], "Message") != RuleMatch(
+        ["Resources", "B"], "Message"
+    )
+    assert RuleMatch(["Resources", "A"], "Message") != "Message"
+
+
+def test_dedup_keeps_first_seen_order():
+    matches = [_match(3), _match(1), _match(3), _match(2), _match(1)]
+
+    results = list(_dedup(iter(matches)))
+
+    assert results == [_match(3), _match(1), _match(2)]
+    assert all(a is b for a, b in zip(results, [matches[0], matches[1], matches[3]]))
+
+
+def test_dedup_compares_each_match_once():
+    # every other match is an equal copy. Deduplicating with a list
+    # compares each match with all of the unique ones seen so far so
+    # count the comparisons
+    rule = _Rule()
+    unique = [_match(i, rule) for i in range(500)]
+    matches = [m for i in range(500) for m in (unique[i], _match(i, rule))]
+
+    with patch.object(Match, "__eq__", autospec=True, side_effect=Match.__eq__) as eq:
+        results = list(_dedup(iter(matches)))
+
+    assert results == unique
+    assert eq.call_count <= len(matches)
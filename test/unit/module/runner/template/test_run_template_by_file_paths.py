@@ -0,0 +1,57 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import pytest
+
+from cfnlint.config import ConfigMixIn
+from cfnlint.exceptions import InvalidRegionException
+from cfnlint.runner import Runner
+from cfnlint.runner.template import run_template_by_file_paths
+
+_TEMPLATES = [
+    "test/fixtures/templates/good/generic.yaml",
+    "test/fixtures/templates/bad/generic.yaml",
+    "test/fixtures/templates/bad/duplicate.json",
+]
+
+
+def _match_values(matches):
+    return [
+        (
+            match.filename,
+            match.linenumber,
+            match.columnnumber,
+            match.linenumberend,
+            match.columnnumberend,
+            match.rule.id,
+            match.message,
+            match.id,
+            match.parent_id,
+        )
+        for match in matches
+    ]
+
+
+def test_jobs_match_serial_run():
+    serial = Runner(ConfigMixIn(templates=_TEMPLATES))
+    parallel = Runner(ConfigMixIn(templates=_TEMPLATES, jobs=2))
+
+    serial_matches = list(run_template_by_file_paths(serial.config, serial.rules))
+    parallel_matches = list(run_template_by_file_paths(parallel.config, parallel.rules))
+
+    assert serial_matches
+    assert _match_values(parallel_matches) == _match_values(serial_matches)
+    for match in parallel_matches:
+        assert match.rule is parallel.rules[match.rule.id]
+    assert set(parallel.rules.used_rules) == set(serial.rules.used_rules)
+
+
+def test_jobs_raise_worker_exceptions():
+    runner = Runner(ConfigMixIn(templates=_TEMPLATES, regions=["us-east-11"], jobs=2))
+
+    with pytest.raises(InvalidRegionException) as e:
+        list(run_template_by_file_paths(runner.config, runner.rules))
+
+    assert e.value.exit_code == 32
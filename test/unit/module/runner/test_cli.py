@@ -3,11 +3,13 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: MIT-0
 """
 
+import json
 import logging
 from io import StringIO
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
 
+import cfnlint.profiler
 from cfnlint import ConfigMixIn
 from cfnlint.helpers import format_json_string
 from cfnlint.runner import Runner
@@ -23,8 +25,9 @@ class TestCli(BaseTestCase):
         for handler in LOGGER.handlers:
             LOGGER.removeHandler(handler)
 
+    @patch("cfnlint.maintenance.update_rule_manifest")
     @patch("cfnlint.maintenance.update_documentation")
-    def test_update_documentation(self, mock_maintenance):
+    def test_update_documentation(self, mock_maintenance, mock_manifest):
         config = ConfigMixIn(["--update-documentation"])
 
         runner = Runner(config)
@@ -34,6 +37,7 @@ class TestCli(BaseTestCase):
 
         self.assertEqual(e.exception.code, 0)
         mock_maintenance.assert_called_once()
+        mock_manifest.assert_called_once()
 
     @patch("cfnlint.maintenance.update_resource_specs")
     def test_update_specs(self, mock_maintenance):
@@ -142,6 +146,42 @@ class TestCli(BaseTestCase):
         # _cli_output should be called once
         mock_cli_output.assert_called_once()
 
+    @patch("sys.stderr", new_callable=StringIO)
+    @patch("cfnlint.runner.Runner._cli_output")
+    def test_profile(self, mock_cli_output, mock_stderr):
+        config = ConfigMixIn(
+            [
+                "--profile",
+                "json",
+                "--",
+                "test/fixtures/templates/good/generic.yaml",
+            ]
+        )
+
+        runner = Runner(config)
+
+        runner.cli()
+
+        mock_cli_output.assert_called_once()
+        profile = json.loads(mock_stderr.getvalue())
+        names = {(p["category"], p["name"]) for p in profile}
+        for name in [
+            ("phase", "decode"),
+            ("phase", "template"),
+            ("phase", "transform"),
+            ("phase", "rules"),
+            ("rule", "E3002"),
+            ("keyword", "properties"),
+        ]:
+            self.assertIn(name, names)
+        self.assertTrue(
+            all(
+                p["template"] == "test/fixtures/templates/good/generic.yaml"
+                for p in profile
+            )
+        )
+        self.assertIsNone(cfnlint.profiler.PROFILER)
+
     def test_bad_regions(self):
         config = ConfigMixIn(
             [
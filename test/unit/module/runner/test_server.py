@@ -0,0 +1,119 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import socketserver
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from cfnlint.config import ConfigMixIn
+from cfnlint.exceptions import CfnLintExitException, ServerUnavailableException
+from cfnlint.runner import Runner
+from cfnlint.runner.server import _LintServer, lint_with_server, run_client, serve
+
+_TEMPLATE = "test/fixtures/templates/bad/generic.yaml"
+
+
+@pytest.fixture(scope="module")
+def socket_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("server") / "cfn-lint.sock")
+    server = _LintServer(path, Runner(ConfigMixIn([])))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def _direct(args):
+    runner = Runner(ConfigMixIn(args))
+    matches = list(runner.run())
+    return runner._format_output(matches), runner._exit_code(matches)
+
+
+def test_lint_templates(socket_path):
+    args = ["--format", "parseable", _TEMPLATE]
+
+    assert lint_with_server(socket_path, args) == _direct(args)
+    # a second request reuses the warm runner
+    assert lint_with_server(socket_path, args) == _direct(args)
+
+
+def test_lint_template_content(socket_path):
+    with open(_TEMPLATE, encoding="utf-8") as f:
+        output, exit_code = lint_with_server(socket_path, [], f.read())
+
+    assert exit_code == 6
+    assert "E1001" in output
+
+
+def test_lint_missing_template(socket_path):
+    output, exit_code = lint_with_server(socket_path, ["missing.yaml"])
+
+    assert exit_code == 2
+    assert "E0003" in output
+
+
+def test_lint_invalid_region(socket_path):
+    with pytest.raises(CfnLintExitException) as e:
+        lint_with_server(socket_path, ["--regions", "us-east-11", "--", _TEMPLATE])
+
+    assert e.value.exit_code == 32
+
+
+def test_lint_request_error(socket_path):
+    with patch("cfnlint.runner.server._lint_request", side_effect=RuntimeError("boom")):
+        with pytest.raises(CfnLintExitException) as e:
+            lint_with_server(socket_path, [_TEMPLATE])
+
+    assert not isinstance(e.value, ServerUnavailableException)
+    assert str(e.value) == "Failed to lint request: boom"
+    assert e.value.exit_code == 1
+
+
+def test_no_server(tmp_path):
+    with pytest.raises(ServerUnavailableException) as e:
+        lint_with_server(str(tmp_path / "missing.sock"), [_TEMPLATE])
+
+    assert e.value.exit_code == 1
+
+
+def test_empty_reply(tmp_path):
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.rfile.read()
+
+    path = str(tmp_path / "empty.sock")
+    with socketserver.UnixStreamServer(path, _Handler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with pytest.raises(ServerUnavailableException):
+                lint_with_server(path, [_TEMPLATE])
+        finally:
+            server.shutdown()
+
+
+def test_client_lints_without_server(tmp_path, capsys):
+    args = ["--format", "parseable", _TEMPLATE]
+    output, exit_code = _direct(args)
+    config = ConfigMixIn(["--server", str(tmp_path / "missing.sock"), *args])
+
+    with pytest.raises(SystemExit) as e:
+        run_client(config, args)
+
+    assert e.value.code == exit_code
+    assert capsys.readouterr().out == f"{output}\n"
+
+
+def test_serve_does_not_remove_files(tmp_path):
+    path = tmp_path / "cfn-lint.sock"
+    path.write_text("not a socket")
+
+    with pytest.raises(CfnLintExitException):
+        serve(ConfigMixIn(["--serve", str(path)]))
+
+    assert path.read_text() == "not a socket"
@@ -0,0 +1,81 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import cfnlint.schema.resolver._resolver
+from cfnlint.schema.resolver import RefResolver
+
+
+@pytest.fixture
+def schema():
+    return {
+        "definitions": {
+            "Name": {"type": "string"},
+            "Sub": {"$id": "https://example.com/sub", "type": "object"},
+        },
+        "properties": {
+            "Name": {"$ref": "#/definitions/Name"},
+        },
+    }
+
+
+def test_resolvers_share_caches(schema):
+    resolver = RefResolver.from_schema(schema)
+    other = RefResolver.from_schema(schema=schema)
+
+    assert resolver is not other
+    assert resolver._cache is other._cache
+    assert resolver._cache_cfn_pointer is other._cache_cfn_pointer
+    assert resolver._urljoin_cache is other._urljoin_cache
+    assert resolver.store is other.store
+    assert resolver._get_subschemas_cache() is other._get_subschemas_cache()
+
+    # the scope stacks aren't shared
+    resolver.push_scope("https://example.com/sub")
+    assert other.resolution_scope == ""
+    resolver.pop_scope()
+
+    assert RefResolver.from_schema(dict(schema))._cache is not resolver._cache
+    assert RefResolver.from_schema(schema, store={})._cache is not resolver._cache
+    # caches that are passed in aren't replaced
+    cache = RefResolver(schema)._cache
+    assert RefResolver.from_schema(schema, _cache=cache)._cache is cache
+
+
+def test_resolvers_resolve_once(schema):
+    # validating each intrinsic function used to create a resolver and
+    # resolve the same references again so count the schema searches
+    with patch.object(
+        cfnlint.schema.resolver._resolver,
+        "_search_schema",
+        wraps=cfnlint.schema.resolver._resolver._search_schema,
+    ) as search:
+        for _ in range(1_000):
+            resolver = RefResolver.from_schema(schema)
+            assert resolver.resolve("#/definitions/Name") == (
+                "#/definitions/Name",
+                {"type": "string"},
+            )
+            assert resolver.resolve_cfn_pointer("/properties/Name") == {
+                "type": "string"
+            }
+
+    assert search.call_count <= 3
+
+
+def test_shared_resolvers_are_bounded():
+    schemas = [{"type": "string"} for _ in range(10)]
+    with patch.object(cfnlint.schema.resolver._resolver, "_MAX_SHARED_RESOLVERS", 4):
+        with patch.dict(
+            cfnlint.schema.resolver._resolver._shared_resolvers, clear=True
+        ):
+            for schema in schemas:
+                RefResolver.from_schema(schema)
+            shared = cfnlint.schema.resolver._resolver._shared_resolvers
+            assert len(shared) == 4
+            assert [v[0] for v in shared.values()] == [s for s in schemas[-4:]]
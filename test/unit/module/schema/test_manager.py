@@ -109,6 +109,14 @@ class TestUpdateResourceSchemas(BaseTestCase):
             mock_get_url.assert_called_once()
             self.assertTrue((Path(tmpdir) / "providers" / "us-east-1.json").exists())
             self.assertTrue((Path(tmpdir) / "resources" / "abc123.json").exists())
+            self.assertTrue((Path(tmpdir) / "resources" / "schemas.bin").exists())
+            self.assertEqual(
+                self.manager.get_resource_schema(
+                    "us-east-1", "AWS::S3::Bucket"
+                ).type_name,
+                "AWS::S3::Bucket",
+            )
+            self.manager._store.close()
 
     @patch("cfnlint.schema.manager.url_has_newer_version")
     @patch("cfnlint.schema.manager.get_url_retrieve")
@@ -287,6 +295,14 @@ class TestManagerGetResourceSchema(BaseTestCase):
         # Schemas should be identical (same hash)
         self.assertDictEqual(schema_east_1.schema, schema_east_2.schema)
 
+    def test_regions_share_schema_with_same_hash(self):
+        rt = "AWS::EC2::VPC"
+
+        schema_east_1 = self.manager.get_resource_schema("us-east-1", rt)
+        schema_west_2 = self.manager.get_resource_schema("us-west-2", rt)
+
+        self.assertIs(schema_east_1, schema_west_2)
+
     def test_removed_types(self):
         rt = "AWS::EC2::VPC"
         region = "us-east-1"
@@ -345,6 +361,21 @@ class TestManagerPatch(BaseTestCase):
 
         mock_exit.assert_called_with(1)
 
+    def test_patch_shared_schema(self):
+        """Test patching a region doesn't patch other regions with the schema"""
+        rt = "AWS::EC2::VPC"
+        self.manager.get_resource_schema("us-west-2", rt)
+
+        self.manager.patch(SchemaPatch([], [], {rt: self.schema_patch}), "us-east-1")
+
+        self.assertEqual(
+            self.manager.get_resource_schema("us-east-1", rt).schema["cfnSchema"],
+            ["test"],
+        )
+        self.assertNotIn(
+            "cfnSchema", self.manager.get_resource_schema("us-west-2", rt).schema
+        )
+
 
 class TestReadSchemaDate(BaseTestCase):
     """Test _read_schema_date"""
@@ -380,6 +411,20 @@ class TestReadSchemaDate(BaseTestCase):
             result = ProviderSchemaManager._read_schema_date(Path(tmpdir))
             self.assertEqual(result, "")
 
+    def test_schema_date_of_manager(self):
+        """Returns schema_date from the directory above the providers"""
+        import tempfile
+        from pathlib import Path
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            version_file = Path(tmpdir) / "version.json"
+            version_file.write_text(json.dumps({"schema_date": "2026-07-07T14:23:15Z"}))
+            manager = ProviderSchemaManager(
+                providers_dir=Path(tmpdir) / "providers",
+                resources_dir=Path(tmpdir) / "resources",
+            )
+            self.assertEqual(manager.schema_date, "2026-07-07T14:23:15Z")
+
     def test_returns_empty_when_field_missing(self):
         """Returns empty string when schema_date field is absent"""
         import tempfile
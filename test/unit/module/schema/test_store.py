@@ -0,0 +1,82 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cfnlint.schema._store import STORE_FILENAME, SchemaStore, compile_schema_store
+from cfnlint.schema.manager import ProviderSchemaManager
+
+_fixtures_dir = Path(__file__).parent.parent.parent.parent / "fixtures" / "schemas"
+
+
+@pytest.fixture
+def resources_dir(tmp_path):
+    resources = tmp_path / "resources"
+    shutil.copytree(_fixtures_dir / "resources", resources)
+    return resources
+
+
+def test_compile_and_read(resources_dir):
+    store_path = resources_dir / STORE_FILENAME
+    compile_schema_store(resources_dir, store_path)
+
+    store = SchemaStore(store_path)
+    schema_files = list(resources_dir.glob("*.json"))
+    assert schema_files
+    for schema_file in schema_files:
+        with open(schema_file, encoding="utf-8") as f:
+            assert store.get(schema_file.stem) == json.load(f)
+
+    assert store.get("missing") is None
+    store.close()
+    assert store.get(schema_files[0].stem) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"not a schema store",
+        b"CFNLSCH1\xff\xff\xff\xff{}",
+    ],
+)
+def test_invalid_store(tmp_path, content):
+    store_path = tmp_path / STORE_FILENAME
+    store_path.write_bytes(content)
+
+    assert SchemaStore(store_path).get("abc") is None
+
+
+def test_store_from_another_version(resources_dir):
+    store_path = resources_dir / STORE_FILENAME
+    with patch("cfnlint.schema._store._store_version", return_value="2.7-2"):
+        compile_schema_store(resources_dir, store_path)
+
+    schema_file = next(resources_dir.glob("*.json"))
+    assert SchemaStore(store_path).get(schema_file.stem) is None
+
+
+def test_missing_store(tmp_path):
+    assert SchemaStore(tmp_path / STORE_FILENAME).get("abc") is None
+
+
+def test_manager_loads_from_store(resources_dir):
+    compile_schema_store(resources_dir, resources_dir / STORE_FILENAME)
+    with open(_fixtures_dir / "resources" / "9c4ceb830d397acc.json", "r") as f:
+        expected = json.load(f)
+    # the JSON files aren't needed once the store is compiled
+    for schema_file in resources_dir.glob("*.json"):
+        schema_file.unlink()
+
+    manager = ProviderSchemaManager(
+        providers_dir=_fixtures_dir / "providers", resources_dir=resources_dir
+    )
+
+    assert manager.get_resource_schema("us-east-1", "AWS::EC2::VPC").schema == expected
@@ -8,6 +8,9 @@ import os
 from test.testlib.testcase import BaseTestCase
 from unittest.mock import patch
 
+import regex as re
+
+import cfnlint.template.template
 from cfnlint.decode import cfn_yaml, convert_dict
 from cfnlint.schema.manager import ProviderSchemaManager
 from cfnlint.template import Template  # pylint: disable=E0401
@@ -1585,3 +1588,70 @@ ElasticLoadBalancer -> MyEC2Instance [key=0, source_paths="[\\"Properties\\", \\
         )
         self.assertEqual(len(results), 1)
         self.assertIn("ImageId", results[0]["Object"])
+
+    def test_search_deep_keys(self):
+        """Test searching for keys across the template and Globals"""
+        template = Template(
+            "test.yaml",
+            {
+                "Resources": {
+                    "myBucket": {
+                        "Type": "AWS::S3::Bucket",
+                        "Properties": {
+                            "BucketName": {
+                                "Fn::If": ["cond", {"Ref": "A"}, {"Fn::Sub": "b"}]
+                            },
+                            "Tags": [{"Key": "k", "Value": {"Ref": "B"}}],
+                        },
+                    },
+                    "Fn::ForEach::Buckets": ["Name", ["A"], {"Ref": "C"}],
+                },
+            },
+        )
+        template.transform_pre["Globals"] = {"Function": {"Runtime": {"Ref": "D"}}}
+        template._cache_clear()
+
+        self.assertEqual(
+            template.search_deep_keys("Ref"),
+            [
+                ["Resources", "myBucket", "Properties", "BucketName"]
+                + ["Fn::If", 1, "Ref", "A"],
+                ["Resources", "myBucket", "Properties", "Tags", 0, "Value", "Ref", "B"],
+                ["Resources", "Fn::ForEach::Buckets", 2, "Ref", "C"],
+                ["Globals", "Function", "Runtime", "Ref", "D"],
+            ],
+        )
+        self.assertEqual(
+            template.search_deep_keys("Ref", includeGlobals=False)[-1],
+            ["Resources", "Fn::ForEach::Buckets", 2, "Ref", "C"],
+        )
+        # patterns keep the order the keys are in the template
+        self.assertEqual(
+            [path[-2] for path in template.search_deep_keys(re.compile("^Fn::"))],
+            ["Fn::If", "Fn::Sub", "Fn::ForEach::Buckets"],
+        )
+        self.assertEqual(template.search_deep_keys("Fn::GetAtt"), [])
+
+    def test_search_deep_keys_indexes_once(self):
+        """Test the template is only walked once for all searches"""
+        resources = {
+            f"myBucket{i}": {
+                "Type": "AWS::S3::Bucket",
+                "Properties": {"BucketName": {"Fn::Sub": "${AWS::Region}"}},
+                "DependsOn": [f"myBucket{i - 1}"],
+            }
+            for i in range(1, 50)
+        }
+        template = Template("test.yaml", {"Resources": resources})
+        template._cache_clear()
+
+        with patch(
+            "cfnlint.template.template._index_keys",
+            wraps=cfnlint.template.template._index_keys,
+        ) as index_keys:
+            for key in ["Ref", "Fn::Sub", "Fn::If", "Condition", "DependsOn"]:
+                template.search_deep_keys(key)
+            self.assertEqual(len(template.search_deep_keys("Fn::Sub")), 49)
+
+        # once for the template and once for Globals
+        self.assertEqual(index_keys.call_count, 2)
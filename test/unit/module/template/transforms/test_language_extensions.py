@@ -1461,3 +1461,69 @@ class TestTransformSubWithUnderscoreVariable(TestCase):
         self.assertIn("Fn::Sub", bucket_name)
         self.assertEqual(bucket_name["Fn::Sub"][0], "${Bucket_Arn}/*")
         self.assertIn("Bucket_Arn", bucket_name["Fn::Sub"][1])
+
+
+class TestTransformStructuralSharing(TestCase):
+    def setUp(self) -> None:
+        self.template_obj = convert_dict(
+            {
+                "Transform": "AWS::LanguageExtensions",
+                "Resources": {
+                    "Fn::ForEach::Envs": [
+                        "Env",
+                        [f"Env{i}" for i in range(50)],
+                        {
+                            "Fn::ForEach::Topics": [
+                                "Name",
+                                [f"Name{i}" for i in range(100)],
+                                {
+                                    "Topic${Env}${Name}": {
+                                        "Type": "AWS::SNS::Topic",
+                                        "Properties": {
+                                            "TopicName": {"Fn::Sub": "${Env}-${Name}"},
+                                            "Tags": [
+                                                {"Key": f"Key{i}", "Value": f"Value{i}"}
+                                                for i in range(20)
+                                            ],
+                                        },
+                                    }
+                                },
+                            ]
+                        },
+                    ],
+                    "Bucket": {"Type": "AWS::S3::Bucket"},
+                },
+            }
+        )
+        return super().setUp()
+
+    def test_transform(self):
+        original = deepcopy(self.template_obj)
+        output = self.template_obj["Resources"]["Fn::ForEach::Envs"][2][
+            "Fn::ForEach::Topics"
+        ][2]
+        body = output["Topic${Env}${Name}"]
+        cfn = Template(filename="", template=self.template_obj, regions=["us-east-1"])
+
+        # the expansion to 5,000 resources used to deep copy every node
+        # it visited so make sure nothing is copied that doesn't change
+        with mock.patch(
+            "cfnlint.template.transforms._language_extensions.deepcopy"
+        ) as copy:
+            matches, template = language_extension(cfn)
+        copy.assert_not_called()
+        self.assertListEqual(matches, [])
+        self.assertEqual(self.template_obj, original)
+
+        resources = template["Resources"]
+        self.assertEqual(len(resources), 5_001)
+        self.assertIs(resources["Bucket"], self.template_obj["Resources"]["Bucket"])
+
+        topic = resources["TopicEnv49Name99"]
+        self.assertEqual(topic["Properties"]["TopicName"], "Env49-Name99")
+        self.assertIs(topic["Type"], body["Type"])
+        self.assertIs(topic["Properties"]["Tags"], body["Properties"]["Tags"])
+        # copied nodes keep their marks
+        self.assertEqual(topic.start_mark, body.start_mark)
+        key = next(k for k in resources if k == "TopicEnv49Name99")
+        self.assertEqual(key.start_mark, next(iter(output)).start_mark)
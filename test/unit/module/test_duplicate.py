@@ -4,10 +4,12 @@ SPDX-License-Identifier: MIT-0
 """
 
 from test.testlib.testcase import BaseTestCase
+from unittest.mock import patch
 
 import cfnlint.decode.cfn_json  # pylint: disable=E0401
 import cfnlint.decode.cfn_yaml  # pylint: disable=E0401
 from cfnlint.config import _DEFAULT_RULESDIR
+from cfnlint.decode.node import str_node
 from cfnlint.rules import Rules
 
 
@@ -62,3 +64,57 @@ class TestDuplicate(BaseTestCase):
             return
 
         assert False
+
+    def test_every_duplicate_reported(self):
+        """Test every duplicate is reported with its mark"""
+        with self.assertRaises(cfnlint.decode.cfn_yaml.CfnParseError) as e:
+            cfnlint.decode.cfn_yaml.loads("a: 1\nb: 1\na: 2\na: 3\nb: 2\n")
+        self.assertListEqual(
+            [(m.message, m.linenumber) for m in e.exception.matches],
+            [
+                ("Duplicate found 'a' (line 1)", 1),
+                ("Duplicate found 'a' (line 3)", 3),
+                ("Duplicate found 'a' (line 4)", 4),
+                ("Duplicate found 'b' (line 5)", 5),
+            ],
+        )
+
+        with self.assertRaises(cfnlint.decode.cfn_json.JSONDecodeError) as e:
+            cfnlint.decode.cfn_json.loads('{"a": 1,\n"a": 2,\n"a": 3}')
+        self.assertListEqual(
+            [m.linenumber for m in e.exception.matches],
+            [1, 0, 2],
+        )
+
+    def test_duplicates_found_by_hash(self):
+        """Test duplicates in a large mapping are found by hash"""
+
+        # comparing every key with the keys before it takes about 125k
+        # comparisons for a 500 key mapping so count them
+        class _Key(str_node):
+            comparisons = 0
+
+            def __eq__(self, other):
+                _Key.comparisons += 1
+                return str.__eq__(self, other)
+
+            __hash__ = str.__hash__
+
+        keys = 500
+        yaml_content = "".join(f"Key{i}: {i}\n" for i in range(keys)) + "Key7: 7\n"
+        json_content = (
+            "{" + ",".join(f'"Key{i}": {i}' for i in range(keys)) + ', "Key7": 7}'
+        )
+
+        with patch("cfnlint.decode.cfn_yaml.str_node", _Key):
+            with self.assertRaises(cfnlint.decode.cfn_yaml.CfnParseError) as e:
+                cfnlint.decode.cfn_yaml.loads(yaml_content)
+        self.assertListEqual([m.linenumber for m in e.exception.matches], [8, keys + 1])
+        self.assertLess(_Key.comparisons, keys)
+
+        _Key.comparisons = 0
+        with patch("cfnlint.decode.cfn_json.str_node", _Key):
+            with self.assertRaises(cfnlint.decode.cfn_json.JSONDecodeError) as e:
+                cfnlint.decode.cfn_json.loads(json_content)
+        self.assertEqual(len(e.exception.matches), 2)
+        self.assertLess(_Key.comparisons, keys)
@@ -0,0 +1,76 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+import networkx
+import pytest
+
+from cfnlint.template import Template
+
+
+def _template(resources: int, cycle_size: int) -> Template:
+    # every resource depends on the next one in its group of resources
+    # and the last one in a group depends on the first
+    template: dict[str, Any] = {"Resources": {}}
+    for i in range(resources):
+        group, position = divmod(i, cycle_size)
+        target = group * cycle_size + (position + 1) % cycle_size
+        template["Resources"][f"Topic{i}"] = {
+            "Type": "AWS::SNS::Topic",
+            "DependsOn": f"Topic{min(target, resources - 1)}",
+        }
+    return Template("", template, ["us-east-1"])
+
+
+def test_get_cycles():
+    cfn = Template(
+        "",
+        {
+            "Resources": {
+                "A": {"Type": "AWS::SNS::Topic", "DependsOn": ["B", "C"]},
+                "B": {"Type": "AWS::SNS::Topic", "DependsOn": "A"},
+                "C": {
+                    "Type": "AWS::SNS::Topic",
+                    "DependsOn": "A",
+                    "Properties": {"TopicName": {"Ref": "A"}},
+                },
+                "D": {"Type": "AWS::SNS::Topic", "DependsOn": ["A", "D"]},
+            }
+        },
+        ["us-east-1"],
+    )
+
+    # both cycles through A are found and the edges from C to A are
+    # only returned once
+    assert [edge[:2] for edge in cfn.graph.get_cycles(cfn)] == [
+        ("A", "B"),
+        ("A", "C"),
+        ("B", "A"),
+        ("C", "A"),
+        ("D", "D"),
+    ]
+
+
+@pytest.mark.parametrize("resources", [10, 100])
+def test_get_cycles_single_pass(resources):
+    # searching for a cycle from every resource is quadratic so the
+    # components of the graph are found with a single pass
+    cfn = _template(resources, 10)
+
+    with (
+        patch.object(
+            networkx,
+            "strongly_connected_components",
+            wraps=networkx.strongly_connected_components,
+        ) as components,
+        patch.object(networkx, "find_cycle", wraps=networkx.find_cycle) as find_cycle,
+    ):
+        cycles = cfn.graph.get_cycles(cfn)
+
+    assert components.call_count == 1
+    assert find_cycle.call_count == 0
+    assert len(cycles) == resources
@@ -0,0 +1,148 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import json
+from unittest.mock import patch
+
+import cfnlint.profiler
+from cfnlint.profiler import Profiler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds=1.0):
+        self.now += seconds
+
+
+def test_profile_self_and_total_time():
+    clock = _Clock()
+    profiler = Profiler()
+
+    def child():
+        clock.tick(2)
+        yield "a"
+        clock.tick(1)
+
+    def parent():
+        clock.tick(1)
+        yield from profiler.profile("keyword", "child", child)
+        # time spent by the consumer isn't counted
+        yield "b"
+        clock.tick(3)
+
+    with patch("cfnlint.profiler.perf_counter", clock):
+        with profiler.template("template.yaml"):
+            for _ in profiler.profile("rule", "E1001", parent):
+                clock.tick(10)
+            with profiler.measure("phase", "transform"):
+                clock.tick(5)
+
+    assert profiler.results() == [
+        {
+            "template": "template.yaml",
+            "category": "phase",
+            "name": "transform",
+            "calls": 1,
+            "total_time": 5.0,
+            "self_time": 5.0,
+        },
+        {
+            "template": "template.yaml",
+            "category": "rule",
+            "name": "E1001",
+            "calls": 1,
+            "total_time": 7.0,
+            "self_time": 4.0,
+        },
+        {
+            "template": "template.yaml",
+            "category": "keyword",
+            "name": "child",
+            "calls": 1,
+            "total_time": 3.0,
+            "self_time": 3.0,
+        },
+    ]
+
+
+def test_profile_recursion_counted_once():
+    clock = _Clock()
+    profiler = Profiler()
+
+    def recurse(depth):
+        clock.tick(1)
+        if depth:
+            yield from profiler.profile("keyword", "properties", recurse, depth - 1)
+        return
+        yield
+
+    with patch("cfnlint.profiler.perf_counter", clock):
+        list(profiler.profile("keyword", "properties", recurse, 2))
+
+    assert profiler.results(aggregate=True) == [
+        {
+            "category": "keyword",
+            "name": "properties",
+            "calls": 3,
+            "total_time": 3.0,
+            "self_time": 3.0,
+        }
+    ]
+
+
+def test_profile_non_generator():
+    profiler = Profiler()
+
+    assert list(profiler.profile("keyword", "type", lambda: None)) == []
+    assert list(profiler.profile("keyword", "enum", lambda: ["a"])) == ["a"]
+    assert profiler.stats[("-", "keyword", "type")].calls == 1
+
+
+def test_aggregate():
+    profiler = Profiler()
+    for filename in ["a.yaml", "b.yaml"]:
+        with profiler.template(filename):
+            with profiler.measure("phase", "decode"):
+                pass
+
+    assert [r["template"] for r in profiler.results()] == ["a.yaml", "b.yaml"]
+    assert [r["calls"] for r in profiler.results(aggregate=True)] == [2]
+
+    table = profiler.format("table")
+    assert "Profile for a.yaml" in table
+    assert "Profile for b.yaml" in table
+    assert profiler.format("table", aggregate=True).startswith(
+        "Profile for All templates\nCategory  Name    Calls"
+    )
+    assert json.loads(profiler.format("json", aggregate=True))[0]["name"] == "decode"
+
+
+def test_disabled():
+    assert cfnlint.profiler.PROFILER is None
+    assert cfnlint.profiler.profile("rule", "E1001", lambda: [1]) == [1]
+    with cfnlint.profiler.measure("phase", "decode"):
+        with cfnlint.profiler.template("a.yaml"):
+            pass
+
+    profiler = cfnlint.profiler.enable()
+    try:
+        assert cfnlint.profiler.PROFILER is profiler
+        assert list(cfnlint.profiler.profile("rule", "E1001", lambda: [1])) == [1]
+        with cfnlint.profiler.template("a.yaml"):
+            with cfnlint.profiler.measure("phase", "decode"):
+                pass
+    finally:
+        cfnlint.profiler.disable()
+
+    assert cfnlint.profiler.PROFILER is None
+    assert set(profiler.stats) == {
+        ("-", "rule", "E1001"),
+        ("a.yaml", "phase", "decode"),
+    }
@@ -0,0 +1,123 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: MIT-0
+"""
+
+import json
+import os
+
+import pytest
+
+from cfnlint.config import ConfigMixIn
+from cfnlint.data import AdditionalSpecs
+from cfnlint.helpers import load_resource
+from cfnlint.rules.helpers import get_policy_services
+from cfnlint.rules.helpers.policies import (
+    POLICIES_FILENAME,
+    STORE_FILENAME,
+    PolicyStore,
+    compile_policy_store,
+)
+from cfnlint.runner import Runner
+from cfnlint.runner.template import run_template_by_file_path
+
+
+@pytest.fixture
+def services():
+    return {
+        "s3": {"Actions": {"getobject": {"Resources": ["object"]}}},
+        "iam": {"Actions": {"tagrole": {}}, "Resources": {}},
+    }
+
+
+def test_store_is_up_to_date():
+    # run `cfn-lint --update-iam-policies` to update both files
+    store = get_policy_services()
+    expected = load_resource(AdditionalSpecs, "Policies.json")
+
+    assert isinstance(store, PolicyStore)
+    assert list(store) == list(expected)
+    assert dict(store) == expected
+
+
+def test_compile_and_read(tmp_path, services):
+    store_path = tmp_path / STORE_FILENAME
+    source_path = tmp_path / POLICIES_FILENAME
+    source_path.write_text(json.dumps(services))
+    compile_policy_store(services, str(store_path), str(source_path))
+    store = PolicyStore(str(store_path), str(source_path))
+
+    assert list(store) == ["iam", "s3"]
+    assert "s3" in store
+    assert "ec2" not in store
+    assert store["s3"] == services["s3"]
+    assert store["s3"] is store["s3"]
+    assert list(store._services) == ["s3"]
+    with pytest.raises(KeyError):
+        store["ec2"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        b"",
+        b"not a policy store",
+        b"CFNLPOL1\xff\xff\xff\xff{}",
+    ],
+)
+def test_invalid_store(tmp_path, content):
+    store_path = tmp_path / STORE_FILENAME
+    if content is not None:
+        store_path.write_bytes(content)
+    store = PolicyStore(
+        str(store_path),
+        os.path.join(os.path.dirname(AdditionalSpecs.__file__), POLICIES_FILENAME),
+    )
+
+    # every service is loaded from the JSON file instead
+    assert store["s3"] == load_resource(AdditionalSpecs, "Policies.json")["s3"]
+    assert len(store._services) == len(store)
+    with pytest.raises(KeyError):
+        store["foo"]
+
+
+def test_source_changed(tmp_path, services):
+    store_path = tmp_path / STORE_FILENAME
+    source_path = tmp_path / POLICIES_FILENAME
+    source_path.write_text(json.dumps(services))
+    compile_policy_store(services, str(store_path), str(source_path))
+
+    # the JSON file was updated without rebuilding the store
+    services["ec2"] = {"Actions": {}}
+    source_path.write_text(json.dumps(services))
+    store = PolicyStore(str(store_path), str(source_path))
+
+    assert list(store) == ["s3", "iam", "ec2"]
+    assert store["ec2"] == {"Actions": {}}
+    assert store._mmap is None
+
+
+def test_store_only_parses_used_services(tmp_path):
+    # linting a template without IAM policies doesn't read the store and
+    # a policy only parses the services it uses
+    bucket = tmp_path / "bucket.yaml"
+    bucket.write_text("Resources:\n  Bucket:\n    Type: AWS::S3::Bucket\n")
+    get_policy_services.cache_clear()
+    try:
+        runner = Runner(ConfigMixIn([]))
+        store = get_policy_services()
+
+        for filename in [bucket, "test/fixtures/templates/good/generic.yaml"]:
+            list(
+                run_template_by_file_path(
+                    str(filename), runner.config, runner.rules, False
+                )
+            )
+            if filename == bucket:
+                assert store._index is None
+    finally:
+        get_policy_services.cache_clear()
+
+    assert 0 < len(store._services) < 10
+    assert len(store) > 400
@@ -89,3 +89,46 @@ def test_cfn_schema(name, keywords, expected_errs, rule):
 
     errs = list(rule.cfnLint(validator, keywords, True, {}))
     assert errs == expected_errs, f"{name} failed {errs} did not match {expected_errs}"
+
+
+def test_cfn_lint_wired_up_again(rule):
+    # child rules are wired up again after the rules are initialized
+    context = Context(regions=["us-east-1"])
+    validator = CfnTemplateValidator(schema={}, context=context)
+    other = CfnLint()
+    other.child_rules = {"EXXXX": _FooError()}
+    assert len(list(other.cfnLint(validator, ["Bar"], True, {}))) == 0
+
+    other.initialize(None)
+    other.child_rules["EYYYY"] = _BarError()
+    assert len(list(other.cfnLint(validator, ["Bar"], True, {}))) == 1
+
+    other.child_rules = {}
+    assert len(list(other.cfnLint(validator, ["Foo"], True, {}))) == 0
+
+
+def test_cfn_lint_indexes_keywords_once():
+    # the keywords of the child rules are indexed once instead of being
+    # compared with the keyword of every node
+    keyword_lookups = []
+
+    class _Rule(CfnLintKeyword):
+        id = "EXXXX"
+
+        @property
+        def keywords(self):
+            keyword_lookups.append(self)
+            return [f"Resources/AWS::Service::{id(self)}/Properties"]
+
+        @keywords.setter
+        def keywords(self, keywords):
+            pass
+
+    rule = CfnLint()
+    rule.child_rules = {f"E{i}": _Rule() for i in range(20)}
+    validator = CfnTemplateValidator(schema={}, context=Context(regions=["us-east-1"]))
+
+    for _ in range(10):
+        assert list(rule.cfnLint(validator, ["Resources/*"], True, {})) == []
+
+    assert len(keyword_lookups) == 20
@@ -235,3 +235,25 @@ def test_permissions(name, instance, expected, rule, validator):
     errors = list(rule.validate(validator, {}, instance, {}))
 
     assert errors == expected, f"Test {name!r} got {errors!r}"
+
+
+def test_permissions_index_actions_once(validator):
+    # the actions of a service are indexed once and a wildcard is only
+    # compared with every action the first time it is seen
+    class _Actions(dict):
+        scans = 0
+
+        def __iter__(self):
+            _Actions.scans += 1
+            return super().__iter__()
+
+    rule = Permissions()
+    actions = _Actions((f"action{i}", {}) for i in range(100))
+    rule._service_map = {"svc": {"Actions": actions}}
+
+    instance = [f"svc:Action{i}" for i in range(100)] * 3
+    instance += ["svc:Action99*", "svc:Action?", "svc:Missing*"] * 100
+    errors = list(rule.validate(validator, {}, instance, {}))
+
+    assert len(errors) == 100
+    assert _Actions.scans == 4
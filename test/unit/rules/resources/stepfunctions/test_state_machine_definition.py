@@ -3,15 +3,21 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: MIT-0
 """
 
+import json
 from collections import deque
+from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 
 from cfnlint.jsonschema.validators import ValidationError
 from cfnlint.rules.resources.stepfunctions.StateMachineDefinition import (
     StateMachineDefinition,
+    _definitions,
 )
 
+_MODULE = "cfnlint.rules.resources.stepfunctions.StateMachineDefinition"
+
 
 @pytest.fixture(scope="module")
 def rule():
@@ -452,6 +458,7 @@ def rule():
                             "Type": "Succeed",
                         },
                         "DefaultState": {"Type": "Fail", "Cause": "No Matches!"},
+                        "NextState": {"Type": "Succeed"},
                     },
                 }
             },
@@ -1542,6 +1549,87 @@ def rule():
                 ),
             ],
         ),
+        (
+            "Missing Next, Default and Catch targets",
+            {
+                "DefinitionSubstitutions": {"Substituted": "Task"},
+                "Definition": {
+                    "StartAt": "Choice",
+                    "States": {
+                        "Choice": {
+                            "Type": "Choice",
+                            "Choices": [
+                                {
+                                    "Variable": "$.value",
+                                    "NumericEquals": 0,
+                                    "Next": "Task",
+                                },
+                            ],
+                            "Default": "Missing",
+                        },
+                        "Task": {
+                            "Type": "Task",
+                            "Resource": (
+                                "arn:aws:lambda:us-east-1:123456789012:function:Foo"
+                            ),
+                            "Catch": [
+                                {
+                                    "ErrorEquals": ["States.ALL"],
+                                    "Next": "${Substituted}",
+                                },
+                                {
+                                    "ErrorEquals": ["States.Timeout"],
+                                    "Next": "CatchMissing",
+                                },
+                            ],
+                            "Next": "NextMissing",
+                        },
+                    },
+                },
+            },
+            [
+                ValidationError(
+                    "Missing 'Next' target 'Missing' at /States/Choice/Default",
+                    rule=StateMachineDefinition(),
+                    path=deque(["Definition", "States", "Choice", "Default"]),
+                ),
+                ValidationError(
+                    "Missing 'Next' target 'NextMissing' at /States/Task/Next",
+                    rule=StateMachineDefinition(),
+                    path=deque(["Definition", "States", "Task", "Next"]),
+                ),
+                ValidationError(
+                    (
+                        "Missing 'Next' target 'CatchMissing' at "
+                        "/States/Task/Catch/1/Next"
+                    ),
+                    rule=StateMachineDefinition(),
+                    path=deque(["Definition", "States", "Task", "Catch", 1, "Next"]),
+                ),
+            ],
+        ),
+        (
+            "Unknown substitution in StartAt",
+            {
+                "DefinitionSubstitutions": {"Known": "Task"},
+                "Definition": {
+                    "StartAt": "${Unknown}",
+                    "States": {
+                        "Task": {
+                            "Type": "Pass",
+                            "Next": "${Known}",
+                        },
+                    },
+                },
+            },
+            [
+                ValidationError(
+                    "Missing 'Next' target '${Unknown}' at /StartAt",
+                    rule=StateMachineDefinition(),
+                    path=deque(["Definition", "StartAt"]),
+                ),
+            ],
+        ),
         (
             "JSONata string Arguments in task",
             {
@@ -1571,3 +1659,30 @@ def test_validate(
 ):
     errs = list(rule.validate(validator, {}, instance, {}))
     assert errs == expected, f"{name!r} test failed with {errs!r}"
+
+
+def test_validate_parses_once(validator):
+    # the JSONata schema is built once per rule and a definition string
+    # is only parsed the first time it is seen
+    rule = StateMachineDefinition()
+    definition = {
+        "QueryLanguage": "JSONata",
+        "StartAt": "Pass",
+        "States": {"Pass": {"Type": "Pass", "End": True}},
+    }
+    instances = [
+        {"Definition": definition},
+        {"DefinitionString": json.dumps(definition)},
+    ]
+
+    _definitions.clear()
+    with (
+        patch(f"{_MODULE}.json.loads", wraps=json.loads) as loads,
+        patch(f"{_MODULE}.deepcopy", wraps=deepcopy) as copies,
+    ):
+        for _ in range(3):
+            for instance in instances:
+                assert list(rule.validate(validator, {}, instance, {})) == []
+
+    assert loads.call_count == 1
+    assert copies.call_count == 2